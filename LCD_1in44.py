@@ -26,8 +26,12 @@
  #
 
 import config
+import os
 import time
+import zlib
+import signal
 import numpy as np
+import tile_delta
 
 LCD_1IN44 = 1
 LCD_1IN8 = 0
@@ -56,6 +60,46 @@ D2U_L2R = 7
 D2U_R2L = 8
 SCAN_DIR_DFT = U2D_R2L
 
+#Written after a full initialization; later starts in the same boot skip the
+#hardware reset and the power-up delays. Set M5_LCD_FULL_INIT=1 to always reset.
+PANEL_STATE = os.environ.get('M5_LCD_STATE', '/tmp/m5-lcd.state')
+
+#Without the display daemon a switcher can draw on the panel from its own
+#process, so an unchanged frame is still sent in full at least this often
+REFRESH_SECONDS = 5.0
+
+def boot_id():
+	try:
+		with open('/proc/sys/kernel/random/boot_id') as f:
+			return f.read().strip()
+	except OSError:
+		return None
+
+def panel_initialized():
+	if os.environ.get('M5_LCD_FULL_INIT') or boot_id() is None:
+		return False
+	try:
+		with open(PANEL_STATE) as f:
+			return f.read().strip() == boot_id()
+	except OSError:
+		return False
+
+def mark_panel_initialized():
+	try:
+		with open(PANEL_STATE, 'w') as f:
+			f.write(boot_id() or '')
+	except OSError:
+		pass
+
+#Milliseconds since this process started (None where /proc is unavailable)
+def process_age_ms():
+	try:
+		with open('/proc/self/stat') as f:
+			start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+		return (time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf('SC_CLK_TCK')) * 1000
+	except (OSError, ValueError, IndexError, AttributeError):
+		return None
+
 
 class LCD(config.RaspberryPi):
 
@@ -64,6 +108,16 @@ class LCD(config.RaspberryPi):
 	LCD_Scan_Dir = SCAN_DIR_DFT
 	LCD_X_Adjust = LCD_X
 	LCD_Y_Adjust = LCD_Y
+	warm_start = False
+	first_frame_pending = False
+	first_pixel_ms = None
+	last_frame_crc = None
+	static_frames = 0
+	frames_skipped = 0
+	tile_delta = None
+	refresh_seconds = REFRESH_SECONDS	#None when nothing else draws on the panel (the daemon's driver)
+	refreshed_at = 0.0
+	panel_stale = False
 
 	"""    Hardware reset     """
 	def  LCD_Reset(self):
@@ -242,25 +296,41 @@ class LCD(config.RaspberryPi):
 		if (self.module_init() != 0):
 			return -1
 		
+		#Warm start: the panel is already powered up this boot, so the registers
+		#are re-sent without the reset and the 320 ms of power-up delays
+		self.warm_start = panel_initialized()
+		self.first_frame_pending = True
+		
 		#Turn on the backlight
 		self.bl_DutyCycle(100)
 		
 		#Hardware reset
-		self.LCD_Reset()
+		if not self.warm_start:
+			self.LCD_Reset()
 		
 		#Set the initialization register
 		self.LCD_InitReg()
 		
 		#Set the display scan and color transfer modes	
 		self.LCD_SetGramScanWay(Lcd_ScanDir)
-		self.delay_ms(200)
+		if not self.warm_start:
+			self.delay_ms(200)
 		
 		#sleep out
 		self.LCD_WriteReg(0x11)
-		self.delay_ms(120)
+		self.delay_ms(5 if self.warm_start else 120)
 		
 		#Turn on the LCD display
 		self.LCD_WriteReg(0x29)
+		if not self.warm_start:
+			mark_panel_initialized()
+		self.tile_delta = tile_delta.TileDelta(self.width, self.height)
+		
+		#A switcher stops the effect while its card is up; repaint in full on resume
+		try:
+			signal.signal(signal.SIGCONT, lambda signum, frame: self.LCD_Invalidate())
+		except ValueError:
+			pass	#Not the main thread
 		
 	#/********************************************************************************
 	#function:	Sets the start position and size of the display area
@@ -271,29 +341,85 @@ class LCD(config.RaspberryPi):
 	#	Yend    :   Y direction end coordinates
 	#********************************************************************************/
 	def LCD_SetWindows(self, Xstart, Ystart, Xend, Yend):
-		#set the X coordinates
+		#set the X coordinates (the four parameter bytes go in one transfer)
 		self.LCD_WriteReg(0x2A)
-		self.LCD_WriteData_8bit(0x00)
-		self.LCD_WriteData_8bit((Xstart & 0xff) + self.LCD_X_Adjust)
-		self.LCD_WriteData_8bit(0x00)
-		self.LCD_WriteData_8bit(((Xend - 1) & 0xff) + self.LCD_X_Adjust)
+		self.digital_write(self.GPIO_DC_PIN, True)
+		self.spi_writebyte([0x00, (Xstart & 0xff) + self.LCD_X_Adjust,
+			0x00, ((Xend - 1) & 0xff) + self.LCD_X_Adjust])
 
 		#set the Y coordinates
 		self.LCD_WriteReg (0x2B)
-		self.LCD_WriteData_8bit(0x00)
-		self.LCD_WriteData_8bit((Ystart & 0xff) + self.LCD_Y_Adjust)
-		self.LCD_WriteData_8bit(0x00)
-		self.LCD_WriteData_8bit(((Yend - 1) & 0xff )+ self.LCD_Y_Adjust)
+		self.digital_write(self.GPIO_DC_PIN, True)
+		self.spi_writebyte([0x00, (Ystart & 0xff) + self.LCD_Y_Adjust,
+			0x00, ((Yend - 1) & 0xff) + self.LCD_Y_Adjust])
 
 		self.LCD_WriteReg(0x2C)
 
 	def LCD_Clear(self):
-		#hello
-		_buffer = [0xff]*(self.width * self.height * 2)
+		#Straight after init the first frame covers the panel; skip the white fill
+		if self.first_frame_pending:
+			return
+		self.last_frame_crc = None
+		if self.tile_delta is not None:
+			self.tile_delta.reset()
 		self.LCD_SetWindows(0, 0, self.width, self.height)
 		self.digital_write(self.GPIO_DC_PIN, True)
-		for i in range(0,len(_buffer),4096):
-			self.spi_writebyte(_buffer[i:i+4096])
+		self.spi_writebytes2(b'\xff' * (self.width * self.height * 2))
+
+	#Someone else may have drawn on the panel: send the next frame even if unchanged
+	def LCD_Invalidate(self):
+		self.panel_stale = True
+
+	#True once when the panel has to be repainted: after LCD_Invalidate, or
+	#every refresh_seconds when another process could have drawn on it
+	def LCD_PanelStale(self):
+		now = time.monotonic()
+		if self.refresh_seconds is not None and now - self.refreshed_at >= self.refresh_seconds:
+			self.panel_stale = True
+		if not self.panel_stale:
+			return False
+		self.panel_stale = False
+		self.refreshed_at = now
+		return True
+
+	#Checksum the packed frame; False (and no SPI transfer) when it matches the last
+	#one and the panel can't have been drawn on since
+	def LCD_FrameChanged(self, Data):
+		crc = zlib.crc32(Data)
+		stale = self.LCD_PanelStale()
+		if stale and self.tile_delta is not None:
+			self.tile_delta.reset()	#Any tile may hold someone else's pixels
+		if crc == self.last_frame_crc:
+			self.static_frames += 1
+			if not stale:
+				self.frames_skipped += 1
+				if self.tile_delta is not None:
+					self.tile_delta.skipped()
+				return False
+		else:
+			self.static_frames = 0
+		self.last_frame_crc = crc
+		return True
+
+	#Send the tiles that changed since the last frame (or all of it) to the panel
+	def LCD_SendFrame(self, Data):
+		if self.tile_delta is None:
+			self.LCD_SendWindow(0, 0, self.width, self.height, Data)
+		else:
+			self.tile_delta.push(Data, self.LCD_SendWindow)
+
+	def LCD_SendWindow(self, Xstart, Ystart, Xend, Yend, Data):
+		self.LCD_SetWindows(Xstart, Ystart, Xend, Yend)
+		self.digital_write(self.GPIO_DC_PIN, True)
+		self.spi_writebytes2(Data)
+
+	#Report time-to-first-pixel once, after the first frame is sent
+	def LCD_FirstPixel(self):
+		self.first_frame_pending = False
+		self.first_pixel_ms = process_age_ms()
+		if self.first_pixel_ms is not None:
+			print('First pixel {0:.0f} ms after start ({1} init)'.format(
+				self.first_pixel_ms, 'warm' if self.warm_start else 'full'))
 
 	def LCD_ShowImage(self,Image,Xstart,Ystart):
 		if (Image == None):
@@ -302,12 +428,34 @@ class LCD(config.RaspberryPi):
 		if imwidth != self.width or imheight != self.height:
 			raise ValueError('Image must be same dimensions as display \
 				({0}x{1}).' .format(self.width, self.height))
-		img = np.asarray(Image)
-		pix = np.zeros((self.width,self.height,2), dtype = np.uint8)
-		pix[...,[0]] = np.add(np.bitwise_and(img[...,[0]],0xF8),np.right_shift(img[...,[1]],5))
-		pix[...,[1]] = np.add(np.bitwise_and(np.left_shift(img[...,[1]],3),0xE0),np.right_shift(img[...,[2]],3))
-		pix = pix.flatten().tolist()
-		self.LCD_SetWindows(0, 0, self.width , self.height)
-		self.digital_write(self.GPIO_DC_PIN, True)
-		for i in range(0,len(pix),4096):
-			self.spi_writebyte(pix[i:i+4096])
+		pix = image_to_rgb565(Image)
+		if not self.LCD_FrameChanged(pix):
+			return
+		self.LCD_SendFrame(pix)
+		if self.first_frame_pending:
+			self.LCD_FirstPixel()
+
+	#/********************************************************************************
+	#function:	Push an already packed RGB565 frame without going through PIL
+	#parameter:
+	#	Data	:   bytes, memoryview or uint8 array of width*height*2
+	#********************************************************************************/
+	def LCD_ShowRGB565(self, Data):
+		if len(Data) != self.width * self.height * 2:
+			raise ValueError('Frame must be {0}x{1} RGB565 ({2} bytes).'
+				.format(self.width, self.height, self.width * self.height * 2))
+		if not self.LCD_FrameChanged(Data):
+			return
+		self.LCD_SendFrame(Data)
+		if self.first_frame_pending:
+			self.LCD_FirstPixel()
+
+#/********************************************************************************
+#function:	Pack an RGB image into the panel's big-endian RGB565 byte layout
+#********************************************************************************/
+def image_to_rgb565(Image):
+	img = np.asarray(Image)
+	pix = np.zeros((img.shape[0], img.shape[1], 2), dtype = np.uint8)
+	pix[...,[0]] = np.add(np.bitwise_and(img[...,[0]],0xF8),np.right_shift(img[...,[1]],5))
+	pix[...,[1]] = np.add(np.bitwise_and(np.left_shift(img[...,[1]],3),0xE0),np.right_shift(img[...,[2]],3))
+	return pix
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Accel - Compiled kernels for serial effect loops
+The chaos game, turtle walks and falling-dot collisions carry a value from
+one step to the next, so they don't vectorize directly. Each kernel here is
+a plain loop that Numba JIT-compiles when it is installed, with a NumPy
+formulation of the same kernel as the fallback. Set M5_ACCEL=numpy to
+force the fallback.
+"""
+
+import os
+import math
+import numpy as np
+
+try:
+    if os.environ.get('M5_ACCEL', 'numba') == 'numpy':
+        raise ImportError('NumPy backend requested')
+    import numba
+except ImportError:
+    numba = None
+
+BACKEND = 'numba' if numba else 'numpy'
+
+# Chaos game steps folded per closed-form chunk (2**64 stays well inside float64)
+CHAOS_CHUNK = 64
+
+TURTLE_FORWARD = ord('F')
+TURTLE_RIGHT = ord('+')
+TURTLE_LEFT = ord('-')
+
+
+def _chaos_game_loop(x, y, vertex_x, vertex_y, choices):
+    """Serial chaos game: move halfway to the chosen vertex each step"""
+    xs = np.empty(len(choices))
+    ys = np.empty(len(choices))
+    for i in range(len(choices)):
+        x = (x + vertex_x[choices[i]]) / 2
+        y = (y + vertex_y[choices[i]]) / 2
+        xs[i] = x
+        ys[i] = y
+    return xs, ys
+
+
+def _chaos_game_numpy(x, y, vertex_x, vertex_y, choices):
+    """Chaos game in closed form: p_k = (p_0 + sum v_j 2**(j-1)) / 2**k per chunk"""
+    vertex_x = np.asarray(vertex_x, dtype=np.float64)
+    vertex_y = np.asarray(vertex_y, dtype=np.float64)
+    xs = np.empty(len(choices))
+    ys = np.empty(len(choices))
+
+    for start in range(0, len(choices), CHAOS_CHUNK):
+        chunk = choices[start:start + CHAOS_CHUNK]
+        weights = np.exp2(np.arange(len(chunk), dtype=np.float64))
+        xs[start:start + len(chunk)] = (x + np.cumsum(vertex_x[chunk] * weights)) / (weights * 2)
+        ys[start:start + len(chunk)] = (y + np.cumsum(vertex_y[chunk] * weights)) / (weights * 2)
+        x, y = xs[start + len(chunk) - 1], ys[start + len(chunk) - 1]
+    return xs, ys
+
+
+def _turtle_walk_loop(commands, x, y, angle, step):
+    """Serial turtle walk over F/+/- commands, returning every vertex"""
+    xs = np.empty(len(commands) + 1)
+    ys = np.empty(len(commands) + 1)
+    xs[0] = x
+    ys[0] = y
+    points = 1
+    for command in commands:
+        if command == TURTLE_FORWARD:
+            x = x + step * math.cos(math.radians(angle))
+            y = y + step * math.sin(math.radians(angle))
+            xs[points] = x
+            ys[points] = y
+            points += 1
+        elif command == TURTLE_RIGHT:
+            angle += 90
+        elif command == TURTLE_LEFT:
+            angle -= 90
+    return xs[:points], ys[:points]
+
+
+def _turtle_walk_numpy(commands, x, y, angle, step):
+    """Turtle walk as a cumulative sum of turns, then of moves"""
+    turns = np.where(commands == TURTLE_RIGHT, 90, np.where(commands == TURTLE_LEFT, -90, 0))
+    forward = commands == TURTLE_FORWARD
+    heading = np.radians(angle + np.cumsum(turns)[forward])
+
+    xs = np.empty(len(heading) + 1)
+    ys = np.empty(len(heading) + 1)
+    xs[0] = x
+    ys[0] = y
+    np.cumsum(step * np.cos(heading), out=xs[1:])
+    np.cumsum(step * np.sin(heading), out=ys[1:])
+    xs[1:] += x
+    ys[1:] += y
+    return xs, ys
+
+
+def _drip_collide_loop(stream, y, speed, brightness, dripping, top, count, height, limit):
+    """Move falling dots in order, stacking each one that lands on its stream"""
+    settled = np.empty(len(y), dtype=np.int64)
+    settles = 0
+    hit = np.zeros(len(y), dtype=np.bool_)
+    for i in range(len(y)):
+        s = stream[i]
+        y[i] += speed[i]
+        if y[i] >= height - 1 or y[i] >= top[s] - 1:
+            hit[i] = True
+            if not dripping[i]:
+                settled[settles] = i
+                settles += 1
+                top[s] = min(top[s], height - 1 - count[s])
+                count[s] = min(count[s] + 1, limit)
+        else:
+            brightness[i] = max(0, brightness[i] - 3)
+    return settled[:settles], hit
+
+
+def _drip_collide_numpy(stream, y, speed, brightness, dripping, top, count, height, limit):
+    """Same collisions in rounds: each round lands the first hitting dot of every stream"""
+    y += speed
+    hit = np.zeros(len(y), dtype=bool)
+    settled = []
+
+    pending = np.arange(len(y))
+    while pending.size:
+        streams = stream[pending]
+        hits = (y[pending] >= height - 1) | (y[pending] >= top[streams] - 1)
+        if not hits.any():
+            break
+
+        # Dots before a stream's first hitter saw the same stack top, so they missed
+        hitters = pending[hits]
+        hit_streams, first = np.unique(stream[hitters], return_index=True)
+        first_hit = hitters[first]
+        hit[first_hit] = True
+
+        landing = first_hit[~dripping[first_hit]]
+        landed = stream[landing]
+        top[landed] = np.minimum(top[landed], height - 1 - count[landed])
+        count[landed] = np.minimum(count[landed] + 1, limit)
+        settled.append(landing)
+
+        cutoff = np.full(len(top), len(y))
+        cutoff[hit_streams] = first_hit
+        pending = pending[pending > cutoff[streams]]
+
+    brightness[~hit] = np.maximum(0, brightness[~hit] - 3)
+    return (np.concatenate(settled) if settled else np.empty(0, dtype=np.int64)), hit
+
+
+if numba:
+    chaos_game = numba.njit(cache=True)(_chaos_game_loop)
+    turtle_walk = numba.njit(cache=True)(_turtle_walk_loop)
+    drip_collide = numba.njit(cache=True)(_drip_collide_loop)
+else:
+    chaos_game = _chaos_game_numpy
+    turtle_walk = _turtle_walk_numpy
+    drip_collide = _drip_collide_numpy
@@ -6,44 +6,20 @@ Background Launcher - Run screensavers in background (survive terminal closing)
 import subprocess
 import sys
 import os
+import effect_registry
 
 def run_in_background(screensaver_num):
     """Launch screensaver in background using nohup"""
     
-    screensavers = {
-        1: 'glyph_rain1_fixed.py',
-        2: 'glyph_rain1.py', 
-        3: 'glyph_rain2.py',
-        4: 'glyph_rain3.py',
-        5: 'matrix_binary.py',
-        6: 'neon_rain.py',
-        7: 'glyph_rain4_timer.py',
-        8: 'glyph_rain5_slow.py',
-        9: 'raindrops.py',
-        10: 'heavy_rain.py',
-        11: 'micro_dots.py',
-        12: 'micro_dots_dripping.py',
-        13: 'simple_flames.py',
-        14: 'campfire.py',
-        15: 'retro_geometry.py',
-        16: 'plasma_field.py',
-        17: 'bouncing_balls.py',
-        18: 'kaleidoscope.py',
-        19: 'mandelbrot.py',
-        20: 'julia_set.py',
-        21: 'sierpinski.py',
-        22: 'dragon_curve.py',
-        80: 'simple_button_switcher.py',
-        81: 'button_screensaver.py'
-    }
+    screensavers = effect_registry.launchable()
     
     if screensaver_num not in screensavers:
         print(f"❌ Invalid screensaver number: {screensaver_num}")
         return False
     
-    filepath = screensavers[screensaver_num]
+    filepath = screensavers[screensaver_num]['file']
     
-    if not os.path.exists(filepath):
+    if not screensavers[screensaver_num]['available']:
         print(f"❌ File not found: {filepath}")
         return False
     
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite - Headless timing of effect render kernels
+Runs the heavy kernels without touching the LCD and reports ms per frame,
+so every optimization ships with numbers
+
+Usage:
+    python3 benchmark.py            # Run all benchmarks
+    python3 benchmark.py <name>     # Run one benchmark
+    python3 benchmark.py list       # List benchmarks
+"""
+
+import sys
+import os
+import time
+import socket
+import subprocess
+import tempfile
+import numpy as np
+
+import accel
+import fractal
+import display_daemon
+import golden_frames
+import headless
+from frame_ring import FrameRing, pack_rgb565
+from fractal_pool import TiledFractalRenderer
+from fractal_zoom import IncrementalZoom
+from julia_atlas import JuliaAtlas, build_atlas, path_c
+from render_scale import RenderScale
+from tile_delta import TileDelta
+
+WIDTH = 128
+HEIGHT = 128
+
+
+def time_call(func, repeat=5):
+    """Best-of-N wall time for one call, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def print_table(title, rows):
+    """Print (case, ms) rows with speedup against the first row"""
+    print(f"\n📊 {title}")
+    print("-" * 60)
+    baseline = rows[0][1]
+    for case, ms in rows:
+        speedup = baseline / ms if ms > 0 else float('inf')
+        print(f"   {case:<34} {ms:8.2f} ms  {speedup:6.1f}x")
+
+
+def bench_render_scale():
+    """Mandelbrot and Julia kernels at 128x128, 64x64 and 32x32"""
+    render_scale = RenderScale(WIDTH, HEIGHT)
+    mandelbrot_rows = []
+    julia_rows = []
+
+    for scale in (1, 2, 4):
+        render_scale.set_scale(scale)
+        xs, ys = render_scale.pixel_coords()
+        size = f"{WIDTH // scale}x{HEIGHT // scale}"
+
+        mandelbrot_rows.append((f"mandelbrot {size}", time_call(
+            lambda: fractal.mandelbrot_iterations(-0.5, 0.0, 1.0, WIDTH, HEIGHT, 30, xs, ys))))
+        julia_rows.append((f"julia {size}", time_call(
+            lambda: fractal.julia_iterations(complex(-0.7, 0.27015), WIDTH, HEIGHT, 25, xs, ys))))
+
+    print_table("Mandelbrot render resolution (max_iter=30)", mandelbrot_rows)
+    print_table("Julia render resolution (max_iter=25)", julia_rows)
+
+
+def bench_tiled_pool():
+    """Deep Mandelbrot zoom in-process vs banded across worker processes"""
+    xs, ys = np.arange(WIDTH), np.arange(HEIGHT)
+    args = (-0.74529, 0.11307, 50.0, WIDTH, HEIGHT, 200)
+    rows = [("in-process", time_call(lambda: fractal.mandelbrot_iterations(*args, xs, ys)))]
+
+    for workers in (2, 3, 4):
+        renderer = TiledFractalRenderer(WIDTH, HEIGHT, workers)
+        try:
+            renderer.render('mandelbrot_iterations', args, xs, ys)  # Warm the workers
+            rows.append((f"{workers} workers, {renderer.bands} bands", time_call(
+                lambda: renderer.render('mandelbrot_iterations', args, xs, ys))))
+        finally:
+            renderer.close()
+
+    print_table("Tiled Mandelbrot, zoom 50x (max_iter=200)", rows)
+
+
+def bench_deep_zoom():
+    """Perturbation Mandelbrot frame cost as the zoom goes deeper"""
+    xs, ys = np.arange(0, WIDTH, 2), np.arange(0, HEIGHT, 2)
+    center = ("-0.2306185488094149258366498672466233051", "0.8160764508988396612991868716560091980")
+    rows = []
+
+    for depth in (2, 10, 20, 30):
+        zoom = 10.0 ** depth
+
+        def frame():
+            orbit = fractal.reference_orbit(center[0], center[1], 512, depth + 20)
+            series = fractal.series_approximation(orbit, fractal.view_radius(zoom, WIDTH, HEIGHT))
+            fractal.perturbation_iterations(orbit, series, zoom, WIDTH, HEIGHT, series[0] + 180, xs, ys)
+
+        rows.append((f"zoom 1e{depth}", time_call(frame)))
+
+    print_table("Deep zoom 64x64 (reference orbit + series skip + 180 iterations)", rows)
+
+
+def bench_zoom_reuse():
+    """Deep zoom frames rendered in full vs reprojected from the previous frame"""
+    center = ("-0.2306185488094149258366498672466233051", "0.8160764508988396612991868716560091980")
+    orbit = fractal.reference_orbit(center[0], center[1], 1024, 40)
+    frames = 120
+
+    for scale in (2, 1):
+        xs, ys = np.arange(0, WIDTH, scale), np.arange(0, HEIGHT, scale)
+        zoom_reuse = IncrementalZoom(WIDTH, HEIGHT)
+        full_time = reused_time = recomputed = 0.0
+
+        zoom = 1e6
+        for _ in range(frames):
+            series = fractal.series_approximation(orbit, fractal.view_radius(zoom, WIDTH, HEIGHT))
+            limit = series[0] + 180
+            args = (orbit, series, zoom, WIDTH, HEIGHT, limit)
+
+            start = time.perf_counter()
+            fractal.perturbation_iterations(*args, xs, ys)
+            full_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            zoom_reuse.render(center, zoom, limit, xs, ys,
+                              lambda: fractal.perturbation_iterations(*args, xs, ys),
+                              lambda dc: fractal.perturbation_escape(orbit, dc, limit, series))
+            reused_time += time.perf_counter() - start
+            recomputed += zoom_reuse.recomputed
+            zoom *= 1.02
+
+        rows = [("full render", full_time / frames * 1000),
+                (f"reprojected ({recomputed / frames * 100:.0f}% recomputed)", reused_time / frames * 1000)]
+        print_table(f"Deep zoom {len(xs)}x{len(ys)}, {frames} frames at 1.02x", rows)
+
+
+def bench_subdivide():
+    """Brute-force vs rectangle-subdivision Mandelbrot and Julia kernels"""
+    for scale in (1, 2):
+        xs = ys = np.arange(0, WIDTH, scale)
+        size = f"{len(xs)}x{len(ys)}"
+        mandelbrot = (-0.5, 0.0, 3.0, WIDTH, HEIGHT, 60, xs, ys)
+        julia = (complex(-0.4, 0.6), WIDTH, HEIGHT, 25, xs, ys)
+        print_table(f"Mandelbrot main bulb {size} (max_iter=60)", [
+            ("brute force", time_call(lambda: fractal.mandelbrot_iterations(*mandelbrot))),
+            ("subdivided (approx)", time_call(lambda: fractal.mandelbrot_subdivided(*mandelbrot))),
+        ])
+        print_table(f"Julia c=-0.4+0.6i {size} (max_iter=25)", [
+            ("brute force", time_call(lambda: fractal.julia_iterations(*julia))),
+            ("subdivided (approx)", time_call(lambda: fractal.julia_subdivided(*julia))),
+        ])
+
+
+def bench_interior():
+    """Plain escape time vs cardioid/bulb early-out and periodicity checking"""
+    xs = ys = np.arange(0, WIDTH, 2)
+    views = [("main bulb", (-0.5, 0.0, 3.0), 60),
+             ("edge detail", (-0.75, 0.1, 10.0), 60),
+             ("period-3 minibrot", (-1.7548776662, 0.0, 400.0), 200)]
+    for name, view, max_iter in views:
+        c = fractal.mandelbrot_plane(*view, WIDTH, HEIGHT, xs, ys)
+        skipped = fractal.in_main_bulbs(c).mean() * 100
+        print_table(f"Mandelbrot {name} 64x64 (max_iter={max_iter})", [
+            ("plain escape time", time_call(lambda: fractal.escape_time(np.zeros_like(c), c, max_iter))),
+            ("periodicity check", time_call(
+                lambda: fractal.escape_time(np.zeros_like(c), c, max_iter, periodicity=True))),
+            (f"mandelbrot_escape ({skipped:.0f}% in bulbs)", time_call(
+                lambda: fractal.mandelbrot_escape(c, max_iter))),
+        ])
+
+    orbit = fractal.reference_orbit("-1.7548776662466927600495", "0", 1024, 40)
+    series = fractal.series_approximation(orbit, fractal.view_radius(1e5, WIDTH, HEIGHT))
+    dc = fractal.plane_offsets(1e5, WIDTH, HEIGHT, xs[np.newaxis, :], ys[:, np.newaxis])
+    limit = series[0] + 360
+    print_table("Perturbation period-3 minibrot 64x64, zoom 1e5 (series skip + 360)", [
+        ("periodicity off", time_call(lambda: fractal.perturbation_escape(orbit, dc, limit, series, periodicity=False))),
+        ("periodicity auto", time_call(lambda: fractal.perturbation_escape(orbit, dc, limit, series))),
+    ])
+
+
+def bench_effect_periodicity():
+    """Periodicity checking off, always on and automatic over the Mandelbrot effect's frames"""
+    headless.install()
+    import mandelbrot
+    xs = ys = np.arange(0, WIDTH, 2)
+    frame_time = {}
+    MODES = {False: 'off', True: 'always', None: 'auto'}
+
+    def add(key, func):
+        start = time.perf_counter()
+        func()
+        frame_time.setdefault(key, []).append((time.perf_counter() - start) * 1000)
+
+    for target in mandelbrot.INTERESTING_POINTS:
+        # Every 4th shallow frame of the zoom, outside the bulbs as mandelbrot_escape runs it
+        for zoom in 1.02 ** np.arange(0, np.log(mandelbrot.DEEP_ZOOM) / np.log(1.02), 4):
+            c = fractal.mandelbrot_plane(float(target[0]), float(target[1]), zoom, WIDTH, HEIGHT,
+                                         xs[np.newaxis, :], ys[:, np.newaxis])
+            c = c[~fractal.in_main_bulbs(c)]
+            for max_iter in (12, 30, 60):
+                for periodicity in MODES:
+                    add(('shallow', max_iter, periodicity), lambda: fractal.escape_time(
+                        np.zeros_like(c), c, max_iter, periodicity=periodicity, smooth=True))
+        # Deep frames from 60x to MAX_ZOOM, each decade of zoom once
+        for depth in range(2, 30):
+            zoom = 10.0 ** depth
+            dc = fractal.plane_offsets(zoom, WIDTH, HEIGHT, xs[np.newaxis, :], ys[:, np.newaxis])
+            orbit = fractal.reference_orbit(target[0], target[1], 1024, depth + 20)
+            series = fractal.series_approximation(orbit, fractal.view_radius(zoom, WIDTH, HEIGHT))
+            for max_iter in (12, 30, 60):
+                limit = series[0] + max_iter * mandelbrot.DEEP_ITER_BUDGET
+                for periodicity in MODES:
+                    add(('deep', max_iter, periodicity), lambda: fractal.perturbation_escape(
+                        orbit, dc, limit, series, smooth=True, periodicity=periodicity))
+
+    for path in ('shallow', 'deep'):
+        frames = len(frame_time[(path, 12, False)])
+        rows = []
+        for max_iter in (12, 30, 60):
+            for periodicity, mode in MODES.items():
+                rows.append((f"max_iter={max_iter} periodicity {mode}",
+                             np.mean(frame_time[(path, max_iter, periodicity)])))
+        print_table(f"Mandelbrot effect {path} frames 64x64 ({frames} frames, mean)", rows)
+
+
+def bench_smooth():
+    """Integer vs smooth (log-log LUT) coloring, kernel plus palette lookup"""
+    xs = ys = np.arange(0, WIDTH, 2)
+    colors = [(i, 255 - i, (i * 3) % 256) for i in range(256)]
+    palette = np.array(colors, dtype=np.uint8)
+    blended = fractal.interpolate_palette(colors)
+    steps = len(blended) // len(colors)
+    args = (-0.75, 0.1, 3.0, WIDTH, HEIGHT, 30, xs, ys)
+
+    def banded():
+        counts = fractal.mandelbrot_iterations(*args)
+        return palette[counts % len(palette)]
+
+    def smooth():
+        counts = fractal.mandelbrot_iterations(*args, smooth=True)
+        return blended[(counts * steps // fractal.SMOOTH_SCALE) % len(blended)]
+
+    print_table("Mandelbrot 64x64 (max_iter=30) with coloring", [
+        ("integer counts", time_call(banded)),
+        ("smooth counts", time_call(smooth)),
+    ])
+
+
+def bench_julia_atlas():
+    """Live Julia render vs memory-mapped atlas lookup, both with palette"""
+    xs = ys = np.arange(0, WIDTH, 2)
+    colors = [(i, 255 - i, (i * 3) % 256) for i in range(256)]
+    palette = fractal.interpolate_palette(colors)
+    steps = len(palette) // len(colors)
+    t = 12.3
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'atlas.bin')
+        build_atlas(256, path=path)
+        atlas = JuliaAtlas(path)
+
+        def live():
+            counts = fractal.julia_iterations(complex(*path_c(t)), WIDTH, HEIGHT, 25, xs, ys, smooth=True)
+            return palette[(counts * 8 * steps // fractal.SMOOTH_SCALE) % len(palette)]
+
+        def lookup():
+            return palette[(atlas.path_field(t).astype(np.int32) * steps) % len(palette)]
+
+        print_table("Julia 64x64 frame (max_iter=25)", [
+            ("live render", time_call(live)),
+            ("atlas lookup", time_call(lookup)),
+        ])
+        del atlas
+
+
+def bench_accel():
+    """Serial effect kernels: plain Python loop vs the active accel backend"""
+    rng = np.random.default_rng(0)
+    vertex_x = np.array([64.0, 10.0, 118.0])
+    vertex_y = np.array([10.0, 118.0, 118.0])
+    choices = rng.integers(0, 3, 150)
+    print_table("Chaos game, 150 points per frame", [
+        ("python loop", time_call(lambda: accel._chaos_game_loop(64.0, 64.0, vertex_x, vertex_y, choices))),
+        (f"accel ({accel.BACKEND})", time_call(lambda: accel.chaos_game(64.0, 64.0, vertex_x, vertex_y, choices))),
+    ])
+
+    commands = "F"
+    for _ in range(7):
+        commands = commands.replace("F", "F+F--F+F")
+    commands = np.frombuffer(commands.encode('ascii'), dtype=np.uint8)
+    print_table(f"Dragon turtle walk, {len(commands)} commands (iteration 7)", [
+        ("python loop", time_call(lambda: accel._turtle_walk_loop(commands, 64.0, 64.0, 0.0, 2.0))),
+        (f"accel ({accel.BACKEND})", time_call(lambda: accel.turtle_walk(commands, 64.0, 64.0, 0.0, 2.0))),
+    ])
+
+    # A dripping frame: ~8 falling dots per stream, stacks partly built
+    stream = rng.integers(0, 64, 512)
+    y = rng.uniform(0, HEIGHT, 512)
+    speed = rng.uniform(0.3, 1.8, 512)
+    dripping = np.zeros(512, dtype=bool)
+    count = rng.integers(0, 20, 64)
+    top = np.where(count > 0, HEIGHT - count, np.inf)
+
+    def collide(kernel):
+        return lambda: kernel(stream, y.copy(), speed, np.full(512, 200), dripping, top.copy(), count.copy(),
+                              HEIGHT, HEIGHT // 3)
+
+    print_table("Dripping dots collision, 512 dots in 64 streams", [
+        ("python loop", time_call(collide(accel._drip_collide_loop))),
+        (f"accel ({accel.BACKEND})", time_call(collide(accel.drip_collide))),
+    ])
+
+
+def stream_frames(conn, ring_name, frame, count):
+    """Writer process for bench_frame_ring: push count frames as fast as possible"""
+    ring = FrameRing.attach(ring_name) if ring_name else None
+    for _ in range(count):
+        if ring is not None:
+            ring.write(frame)
+            display_daemon.send_message(conn, display_daemon.TICK)
+        else:
+            display_daemon.send_message(conn, display_daemon.FRAME_565, frame.tobytes())
+    conn.close()
+
+
+def frames_per_second(frame, ring=None, count=2000):
+    """Frames/s a display process receives from a writer process"""
+    import multiprocessing
+    receiver, sender = socket.socketpair()
+    writer = multiprocessing.get_context('fork').Process(
+        target=stream_frames, args=(sender, ring.name if ring else None, frame, count))
+    start = time.perf_counter()
+    writer.start()
+    sender.close()
+    shown = sequence = 0
+    while True:
+        kind, payload = display_daemon.recv_message(receiver)
+        if kind is None:
+            break
+        if ring is not None:
+            sequence, payload = ring.read(sequence)
+        if payload is not None:
+            shown += 1
+    elapsed = time.perf_counter() - start
+    writer.join()
+    receiver.close()
+    return count / elapsed, shown / elapsed
+
+
+def bench_frame_ring():
+    """Frame transport to the display owner: socket messages vs shared-memory ring"""
+    for width, height in ((128, 128), (240, 135)):
+        rgb = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+        rgb565 = np.random.default_rng(1).integers(0, 256, width * height * 2, dtype=np.uint8)
+        sender, receiver = socket.socketpair()
+        ring = FrameRing.create(width, height)
+        reader = FrameRing.attach(ring.name)
+
+        def socket_frame(kind, payload):
+            def send():
+                display_daemon.send_message(sender, kind, payload)
+                display_daemon.recv_message(receiver)
+            return send
+
+        def ring_frame(write, frame):
+            def send():
+                write(frame)
+                reader.read(ring.sequence - 1)
+            return send
+
+        print_table(f"Frame transport {width}x{height}, one frame written and read", [
+            ("socket, RGB888 frame", time_call(socket_frame(display_daemon.FRAME, rgb.tobytes()), 50)),
+            ("socket, RGB565 frame", time_call(socket_frame(display_daemon.FRAME_565, rgb565.tobytes()), 50)),
+            ("shm ring, RGB565 frame", time_call(ring_frame(ring.write, rgb565), 50)),
+            ("shm ring, packed from RGB", time_call(ring_frame(ring.write_rgb, rgb), 50)),
+        ])
+
+        # Across processes, as the daemon runs it: the ring only needs a tick per frame
+        sent, shown = frames_per_second(rgb565)
+        print(f"   socket between processes:   {sent:8,.0f} frames/s sent, {shown:8,.0f} shown")
+        sent, shown = frames_per_second(rgb565, reader)
+        print(f"   shm ring between processes: {sent:8,.0f} frames/s sent, {shown:8,.0f} shown (newest only)")
+
+        reader.close()
+        ring.close()
+        sender.close()
+        receiver.close()
+
+
+# Child for bench_first_pixel: start an effect headless and report its first frame
+FIRST_PIXEL_CHILD = '''
+import sys, time
+start = time.perf_counter()
+import headless
+headless.install()
+import effect_registry
+info = effect_registry.find(sys.argv[1])
+effect_class = effect_registry.effect_class(info)
+imported = time.perf_counter()
+effect = effect_class()
+for step in info['frame']:
+    image = getattr(effect, step)()
+effect.LCD.LCD_ShowImage(image, 0, 0)
+print('first-pixel', (imported - start) * 1000, (time.perf_counter() - imported) * 1000, flush=True)
+'''
+
+
+def first_pixel(effect_name):
+    """(total, import, first frame) ms from launching an effect to its first frame"""
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, '-c', FIRST_PIXEL_CHILD, effect_name],
+                             cwd=os.path.dirname(os.path.abspath(__file__)),
+                             stdout=subprocess.PIPE, text=True)
+    # Effects print while starting; the child's own line ends the wait
+    for line in child.stdout:
+        if line.startswith('first-pixel'):
+            break
+    total = (time.perf_counter() - start) * 1000
+    child.stdout.read()
+    child.wait()
+    imported, frame = (float(value) for value in line.split()[1:])
+    return total, imported, frame
+
+
+def bench_first_pixel():
+    """Launch to first frame per effect, without the LCD driver's own init"""
+    print("\n📊 Time to first pixel (headless, best of 3)")
+    print("-" * 60)
+    print(f"   {'effect':<22} {'total':>8} {'imports':>9} {'init+frame':>11}")
+    for effect_name in ('glyph_rain1_fixed', 'simple_flames', 'plasma_field', 'julia_set', 'neon_rain'):
+        total, imported, frame = min(first_pixel(effect_name) for _ in range(3))
+        print(f"   {effect_name:<22} {total:6.0f} ms {imported:6.0f} ms {frame:8.0f} ms")
+    # The driver adds its reset and power-up delays on top, which a warm start skips
+    print("   LCD_Init delays: 350 ms full init (reset + 200 + 120 ms), 5 ms warm start")
+    print("   Start-up LCD_Clear: skipped, the first frame is the first write")
+
+
+def bench_tile_delta():
+    """SPI bytes per effect with unchanged frames skipped and only changed tiles sent"""
+    frames = tuple(range(60))
+    print(f"\n📊 SPI bytes saved over {len(frames)} frames (skipped frames + changed tiles)")
+    print("-" * 60)
+    print(f"   {'effect':<22} {'8x8 tiles':>10} {'16x16':>7} {'windows':>8} {'hash+plan':>10}")
+    for effect_name in golden_frames.EFFECTS:
+        captured, _ = golden_frames.render_frames(effect_name, frames)
+        packed = [pack_rgb565(rgb, np.empty(rgb.shape[:2] + (2,), np.uint8)) for rgb in captured.values()]
+        row = []
+        for tile in (8, 16):
+            delta = TileDelta(WIDTH, HEIGHT, tile)
+            last = None
+            start = time.perf_counter()
+            for frame in packed:
+                if last is not None and np.array_equal(frame, last):
+                    delta.skipped()
+                else:
+                    delta.push(frame, lambda *window: None)
+                last = frame
+            row.append((delta, (time.perf_counter() - start) * 1000 / len(packed)))
+        (small, ms), (large, _) = row
+        windows = small.windows / small.frames
+        print(f"   {effect_name:<22} {small.saved():9.0%} {large.saved():7.0%} {windows:8.1f} {ms:7.2f} ms")
+    print(f"   Full frame: {WIDTH * HEIGHT * 2:,} bytes, {WIDTH * HEIGHT * 2 * 8 / 40e6 * 1000:.1f} ms at 40 MHz")
+
+
+BENCHMARKS = {
+    'render_scale': bench_render_scale,
+    'tiled_pool': bench_tiled_pool,
+    'deep_zoom': bench_deep_zoom,
+    'zoom_reuse': bench_zoom_reuse,
+    'subdivide': bench_subdivide,
+    'interior': bench_interior,
+    'effect_periodicity': bench_effect_periodicity,
+    'smooth': bench_smooth,
+    'julia_atlas': bench_julia_atlas,
+    'accel': bench_accel,
+    'frame_ring': bench_frame_ring,
+    'first_pixel': bench_first_pixel,
+    'tile_delta': bench_tile_delta,
+}
+
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] == 'list':
+        for name, bench in BENCHMARKS.items():
+            print(f"{name:<16} - {bench.__doc__}")
+        return
+
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"❌ Unknown benchmark: {name}")
+            print("Use 'list' to see available benchmarks")
+            return
+
+    print("⏱️ EFFECT BENCHMARKS")
+    print(f"   NumPy {np.__version__}, panel {WIDTH}x{HEIGHT}, accel backend: {accel.BACKEND}")
+    for name in names:
+        BENCHMARKS[name]()
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,35 +7,12 @@ Allows easy switching between different boot screensavers
 import subprocess
 import os
 import sys
+import effect_registry
 
 class BootManager:
     def __init__(self):
-        self.screensavers = {
-            1: {'file': 'glyph_rain1_fixed.py', 'name': 'Fixed Matrix Rain (Stable)', 'stability': '🟢'},
-            2: {'file': 'glyph_rain1.py', 'name': 'Classic Matrix Rain', 'stability': '🟡'},
-            3: {'file': 'glyph_rain2.py', 'name': 'Blue Matrix Rain', 'stability': '🟡'},
-            4: {'file': 'glyph_rain3.py', 'name': 'Rainbow Matrix Rain', 'stability': '🟡'},
-            5: {'file': 'matrix_binary.py', 'name': 'Binary Matrix', 'stability': '🟡'},
-            6: {'file': 'neon_rain.py', 'name': 'Neon Rain', 'stability': '🟡'},
-            7: {'file': 'glyph_rain4_timer.py', 'name': 'Medium Timer Rain', 'stability': '🟡'},
-            8: {'file': 'glyph_rain5_slow.py', 'name': 'All-Day Timer Rain', 'stability': '🟡'},
-            9: {'file': 'raindrops.py', 'name': 'Raindrops', 'stability': '🟡'},
-            10: {'file': 'heavy_rain.py', 'name': 'Heavy Rain', 'stability': '🟡'},
-            11: {'file': 'micro_dots.py', 'name': 'Micro Dots', 'stability': '🟡'},
-            12: {'file': 'micro_dots_dripping.py', 'name': 'Dripping Dots', 'stability': '🟡'},
-            13: {'file': 'simple_flames.py', 'name': 'Simple Flames', 'stability': '🟡'},
-            14: {'file': 'campfire.py', 'name': 'Campfire', 'stability': '🟡'},
-            15: {'file': 'retro_geometry.py', 'name': 'Retro Geometry', 'stability': '🟡'},
-            16: {'file': 'plasma_field.py', 'name': 'Plasma Field', 'stability': '🟡'},
-            17: {'file': 'bouncing_balls.py', 'name': 'Bouncing Balls', 'stability': '🟡'},
-            18: {'file': 'kaleidoscope.py', 'name': 'Kaleidoscope', 'stability': '🟡'},
-            19: {'file': 'mandelbrot.py', 'name': 'Mandelbrot Set', 'stability': '🟡'},
-            20: {'file': 'julia_set.py', 'name': 'Julia Set', 'stability': '🟡'},
-            21: {'file': 'sierpinski.py', 'name': 'Sierpinski Triangle', 'stability': '🟡'},
-            22: {'file': 'dragon_curve.py', 'name': 'Dragon Curve', 'stability': '🟡'},
-            80: {'file': 'simple_button_switcher.py', 'name': 'Button Switcher (3 buttons)', 'stability': '🕹️'},
-            81: {'file': 'button_screensaver.py', 'name': 'Advanced Button Switcher', 'stability': '🕹️'}
-        }
+        # Effects 1-22 and the button switchers (80, 81), straight from effects.json
+        self.screensavers = effect_registry.launchable()
         
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.username = os.getenv('USER', 'pi')
@@ -57,22 +34,25 @@ class BootManager:
         print()
         
         # Show screensaver options in groups
+        effects = effect_registry.effects()
         print("📱 MATRIX/RAIN SCREENSAVERS:")
-        for i in range(1, 7):
-            info = self.screensavers[i]
-            status = "⭐" if i == 1 else "  "
-            print(f"   {status} {i:2d}) {info['stability']} {info['name']}")
+        for i, info in effects.items():
+            if info['category'] == 'Matrix/Rain':
+                status = "⭐" if i == 1 else "  "
+                print(f"   {status} {i:2d}) {info['stability']} {info['name']}")
         
         print("\n🌊 OTHER SCREENSAVERS:")
-        for i in range(7, 23):
-            info = self.screensavers[i]
-            print(f"      {i:2d}) {info['stability']} {info['name']}")
+        for i, info in effects.items():
+            if info['category'] != 'Matrix/Rain':
+                print(f"      {i:2d}) {info['stability']} {info['name']}")
         
         print("\n🕹️ BUTTON CONTROLS:")
-        for i in [80, 81]:
-            info = self.screensavers[i]
+        for i, info in effect_registry.switchers().items():
             print(f"      {i:2d}) {info['stability']} {info['name']}")
             
+        print("\n🎞️ RECORDED LOOPS:")
+        print("      98) Boot a Recorded Loop (lowest CPU)")
+            
         print("\n🔧 BOOT MANAGEMENT:")
         print("      95) Check Current Boot Status")
         print("      96) Disable All Auto-Boot")
@@ -108,14 +88,40 @@ class BootManager:
             return False
         
         info = self.screensavers[screensaver_num]
-        filepath = info['file']
+        if not info['available']:
+            print(f"❌ File not found: {info['file']}")
+            return False
         
-        if not os.path.exists(filepath):
-            print(f"❌ File not found: {filepath}")
+        return self.install_boot_service(f"#{screensaver_num}: {info['name']}", info['path'])
+
+    def create_loop_boot_service(self):
+        """Create systemd service that plays a recorded loop clip"""
+        import frame_clip
+        clips = frame_clip.list_clips()
+        if not clips:
+            print("   Record one first: python3 frame_clip.py record <effect> <seconds>")
             return False
+        print()
+        
+        for i, name in enumerate(clips, 1):
+            print(f"   {i}) {name}")
         
+        try:
+            choice = int(input("Clip to boot (or 0 to cancel): ").strip())
+            if choice == 0:
+                return False
+            clip = os.path.join(frame_clip.CLIP_DIR, clips[choice - 1])
+        except (ValueError, IndexError):
+            print("❌ Invalid choice")
+            return False
+        
+        return self.install_boot_service(f"Loop {clips[choice - 1]}",
+                                         f"{self.script_dir}/frame_clip.py play {clip}")
+
+    def install_boot_service(self, label, command):
+        """Install and enable lcd-boot-screensaver.service running a command"""
         service_content = f"""[Unit]
-Description=LCD Boot Screensaver #{screensaver_num}: {info['name']}
+Description=LCD Boot Screensaver {label}
 After=multi-user.target
 Wants=multi-user.target
 
@@ -124,7 +130,7 @@ Type=simple
 User={self.username}
 Group={self.username}
 WorkingDirectory={self.script_dir}
-ExecStart=/usr/bin/python3 {self.script_dir}/{filepath}
+ExecStart=/usr/bin/python3 {command}
 Restart=always
 RestartSec=10
 StandardOutput=journal
@@ -141,7 +147,7 @@ Environment=DISPLAY=:0
 WantedBy=multi-user.target"""
         
         try:
-            print(f"🔧 Setting up boot service for #{screensaver_num}: {info['name']}")
+            print(f"🔧 Setting up boot service for {label}")
             
             # Stop and disable all existing LCD services
             existing_services = [
@@ -167,7 +173,7 @@ WantedBy=multi-user.target"""
             subprocess.run(['sudo', 'systemctl', 'enable', 'lcd-boot-screensaver.service'], check=True)
             
             print("✅ Boot service created and enabled!")
-            print(f"   Screensaver #{screensaver_num} will start on every boot")
+            print(f"   {label} will start on every boot")
             print("   Features:")
             print("   - Survives terminal closing")
             print("   - Auto-restart on crash")
@@ -255,7 +261,7 @@ WantedBy=multi-user.target"""
             if result.stdout.strip():
                 lines = result.stdout.strip().split('\n')
                 screensaver_procs = [line for line in lines if any(name in line for name in 
-                    ['glyph', 'matrix', 'rain', 'flame', 'plasma', 'dots', 'button'])]
+                    ['glyph', 'matrix', 'rain', 'flame', 'plasma', 'dots', 'button', 'frame_clip', 'playlist'])]
                 
                 if screensaver_procs:
                     for proc in screensaver_procs:
@@ -347,6 +353,9 @@ def main():
             elif choice_num == 97:
                 manager.show_service_logs()
             
+            elif choice_num == 98:
+                manager.create_loop_boot_service()
+            
             elif choice_num in manager.screensavers:
                 manager.create_boot_service(choice_num)
             
@@ -6,12 +6,14 @@ Colorful balls bouncing around the screen with trails
 
 import LCD_1in44
 import time
-import random
 import math
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
+from phosphor import PhosphorBuffer
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class BouncingBalls:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("⚽ Initializing Bouncing Balls...")
         
         # Initialize LCD
@@ -25,6 +27,8 @@ class BouncingBalls:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Classic neon colors
         self.ball_colors = [
             (255, 0, 255),    # Magenta
@@ -46,34 +50,28 @@ class BouncingBalls:
         for _ in range(self.num_balls):
             self.balls.append(self.create_ball())
         
-        # Trail system for retro effect
-        self.trails = []
-        self.max_trail_length = 15
+        # Trails come from phosphor persistence - old frames fade out
+        self.phosphor = PhosphorBuffer(self.width, self.height, decay=0.8)
+        self.sparkles = []  # Sparkles spawned this frame
         
         print(f"⚽ Created {self.num_balls} bouncing balls")
     
     def create_ball(self):
         """Create a bouncing ball"""
         return {
-            'x': random.uniform(10, self.width - 10),
-            'y': random.uniform(10, self.height - 10),
-            'vx': random.uniform(-3, 3),
-            'vy': random.uniform(-3, 3),
-            'radius': random.randint(3, 8),
-            'color': random.choice(self.ball_colors),
-            'trail': [],
+            'x': self.random.uniform(10, self.width - 10),
+            'y': self.random.uniform(10, self.height - 10),
+            'vx': self.random.uniform(-3, 3),
+            'vy': self.random.uniform(-3, 3),
+            'radius': self.random.randint(3, 8),
+            'color': self.random.choice(self.ball_colors),
             'bounce_count': 0,
-            'glow_phase': random.uniform(0, 2 * math.pi)
+            'glow_phase': self.random.uniform(0, 2 * math.pi)
         }
     
     def update_balls(self):
         """Update ball positions and handle bouncing"""
         for ball in self.balls:
-            # Store previous position for trail
-            ball['trail'].append((int(ball['x']), int(ball['y'])))
-            if len(ball['trail']) > self.max_trail_length:
-                ball['trail'].pop(0)
-            
             # Update position
             ball['x'] += ball['vx']
             ball['y'] += ball['vy']
@@ -108,74 +106,40 @@ class BouncingBalls:
             
             # Occasionally change color after many bounces
             if ball['bounce_count'] > 0 and ball['bounce_count'] % 20 == 0:
-                ball['color'] = random.choice(self.ball_colors)
+                ball['color'] = self.random.choice(self.ball_colors)
                 ball['bounce_count'] = 0
     
     def create_bounce_effect(self, ball):
         """Create visual effect when ball bounces"""
-        # Add some sparkle particles
+        # Add some sparkle particles - drawn once, the phosphor fades them
         for _ in range(3):
             sparkle = {
-                'x': ball['x'] + random.uniform(-5, 5),
-                'y': ball['y'] + random.uniform(-5, 5),
-                'life': 10,
+                'x': ball['x'] + self.random.uniform(-5, 5),
+                'y': ball['y'] + self.random.uniform(-5, 5),
                 'color': ball['color']
             }
-            self.trails.append(sparkle)
-    
-    def update_effects(self):
-        """Update trail and sparkle effects"""
-        # Update sparkles
-        for effect in self.trails[:]:
-            effect['life'] -= 1
-            if effect['life'] <= 0:
-                self.trails.remove(effect)
+            self.sparkles.append(sparkle)
     
     def draw_frame(self):
         """Draw the bouncing balls with trails"""
-        # Classic black background
-        image = Image.new('RGB', (self.width, self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        # Fade the previous frame - this is what leaves the trails
+        self.phosphor.fade()
+        layer = self.phosphor.canvas()
+        draw = ImageDraw.Draw(layer)
         
-        # Draw ball trails
-        for ball in self.balls:
-            for i, (tx, ty) in enumerate(ball['trail']):
-                if i > 0:
-                    # Fade trail
-                    fade = i / len(ball['trail'])
-                    r, g, b = ball['color']
-                    trail_color = (
-                        int(r * fade * 0.5),
-                        int(g * fade * 0.5),
-                        int(b * fade * 0.5)
-                    )
-                    
-                    # Draw trail segment
-                    trail_size = max(1, int(ball['radius'] * fade * 0.7))
-                    draw.ellipse([
-                        tx - trail_size, ty - trail_size,
-                        tx + trail_size, ty + trail_size
-                    ], fill=trail_color)
-        
-        # Draw sparkle effects
-        for effect in self.trails:
-            fade = effect['life'] / 10.0
-            r, g, b = effect['color']
-            sparkle_color = (
-                int(r * fade),
-                int(g * fade),
-                int(b * fade)
-            )
+        # Draw new sparkle effects
+        for effect in self.sparkles:
+            sparkle_color = effect['color']
             
             # Draw small sparkle
             sx, sy = int(effect['x']), int(effect['y'])
             if 0 <= sx < self.width and 0 <= sy < self.height:
-                image.putpixel((sx, sy), sparkle_color)
+                layer.putpixel((sx, sy), sparkle_color)
                 # Add + shape
                 for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
                     px, py = sx + dx, sy + dy
                     if 0 <= px < self.width and 0 <= py < self.height:
-                        image.putpixel((px, py), sparkle_color)
+                        layer.putpixel((px, py), sparkle_color)
         
         # Draw balls with glow effect
         for ball in self.balls:
@@ -224,7 +188,8 @@ class BouncingBalls:
                 highlight_x + highlight_size, highlight_y + highlight_size
             ], fill=highlight_color)
         
-        return image
+        self.sparkles = []
+        return self.phosphor.commit(layer)
     
     def run(self):
         """Main animation loop"""
@@ -236,9 +201,10 @@ class BouncingBalls:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(20, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update_balls()
-                self.update_effects()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
                 
@@ -250,7 +216,7 @@ class BouncingBalls:
                     total_bounces = sum(ball['bounce_count'] for ball in self.balls)
                     print(f"⚽ {elapsed:.1f}s: {total_bounces} total bounces")
                 
-                time.sleep(0.05)  # 20 FPS
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 20 FPS
                 
         except KeyboardInterrupt:
             print(f"\n⚽ Bouncing balls stopped")
@@ -9,112 +9,64 @@ Controls:
 - KEY3 (Pin 16): Toggle pause/resume
 - Joystick UP (Pin 6): Jump to favorite screensavers
 - Joystick DOWN (Pin 19): Show current screensaver info
+- Joystick LEFT (Pin 5): Cycle render resolution (scalable effects)
 - Joystick PRESS (Pin 13): Exit switcher
 """
 
 import time
-import threading
-import subprocess
-import os
 import signal
+import asyncio
 from gpiozero import Button
 from PIL import Image, ImageDraw, ImageFont
 import LCD_1in44
+import display_daemon
+import effect_registry
+from effect_controller import EffectController
+from status_overlay import StatusBanner, draw_card, BANNER_HEIGHT
 
 class ButtonScreensaverSwitcher:
     def __init__(self):
         print("🕹️ Initializing Button-Controlled Screensaver Switcher...")
         
-        # Initialize LCD
-        self.LCD = LCD_1in44.LCD()
+        # Initialize LCD (a display daemon client when one owns the panel)
+        if display_daemon.daemon_running():
+            self.LCD = display_daemon.DisplayClient('button_screensaver')
+        else:
+            self.LCD = LCD_1in44.LCD()
         Lcd_ScanDir = LCD_1in44.U2D_L2R
         self.LCD.LCD_Init(Lcd_ScanDir)
         self.LCD.LCD_Clear()
         
         # Button setup (with pull-up resistors)
-        self.key1 = Button(21, pull_up=True)      # Next screensaver
-        self.key2 = Button(20, pull_up=True)      # Previous screensaver
-        self.key3 = Button(16, pull_up=True)      # Pause/Resume
-        self.joy_up = Button(6, pull_up=True)     # Jump to favorites
-        self.joy_down = Button(19, pull_up=True)  # Show info
-        self.joy_press = Button(13, pull_up=True) # Exit
+        self.key1 = Button(21, pull_up=True, bounce_time=0.05)      # Next screensaver
+        self.key2 = Button(20, pull_up=True, bounce_time=0.05)      # Previous screensaver
+        self.key3 = Button(16, pull_up=True, bounce_time=0.05)      # Pause/Resume
+        self.joy_up = Button(6, pull_up=True, bounce_time=0.05)     # Jump to favorites
+        self.joy_down = Button(19, pull_up=True, bounce_time=0.05)  # Show info
+        self.joy_left = Button(5, pull_up=True, bounce_time=0.05)   # Cycle render resolution
+        self.joy_press = Button(13, pull_up=True, bounce_time=0.05) # Exit
         
-        # Screensaver list (prioritized for button switching)
-        self.screensavers = [
-            # Top picks - most stable and visually appealing
-            {
-                'file': 'glyph_rain1_fixed.py',
-                'name': 'Fixed Matrix Rain',
-                'category': '⭐ STABLE',
-                'description': 'Memory-safe classic matrix'
-            },
-            {
-                'file': 'glyph_rain2.py',
-                'name': 'Blue Matrix Rain',
-                'category': 'Matrix',
-                'description': 'Blue matrix theme'
-            },
-            {
-                'file': 'glyph_rain3.py',
-                'name': 'Rainbow Matrix',
-                'category': 'Matrix',
-                'description': 'Rainbow colored matrix'
-            },
-            {
-                'file': 'neon_rain.py',
-                'name': 'Neon Rain',
-                'category': 'Matrix',
-                'description': 'Neon shapes rain'
-            },
-            {
-                'file': 'simple_flames.py',
-                'name': 'Simple Flames',
-                'category': 'Fire',
-                'description': 'Stable flame effect'
-            },
-            {
-                'file': 'plasma_field.py',
-                'name': 'Plasma Field',
-                'category': 'Retro',
-                'description': 'Mathematical plasma'
-            },
-            {
-                'file': 'bouncing_balls.py',
-                'name': 'Bouncing Balls',
-                'category': 'Retro',
-                'description': 'Classic bouncing balls'
-            },
-            {
-                'file': 'kaleidoscope.py',
-                'name': 'Kaleidoscope',
-                'category': 'Visual',
-                'description': 'Rotating patterns'
-            },
-            {
-                'file': 'micro_dots.py',
-                'name': 'Micro Dots',
-                'category': 'Particles',
-                'description': 'Ultra-tiny dots'
-            },
-            {
-                'file': 'raindrops.py',
-                'name': 'Raindrops',
-                'category': 'Water',
-                'description': 'Realistic rain'
-            }
-        ]
+        # Screensaver list (prioritized for button switching, from effects.json)
+        self.screensavers = effect_registry.button_set()
         
         # Favorites (accessed with UP button)
         self.favorites = [0, 1, 4, 5]  # Indices of favorite screensavers
         self.favorite_index = 0
         
         # State
-        self.current_index = 0
-        self.current_process = None
         self.paused = False
-        self.running = True
-        self.last_button_time = 0
-        self.debounce_time = 0.3
+        
+        # Presses are queued; the controller switches effects one at a time
+        self.controller = EffectController([saver['file'] for saver in self.screensavers],
+                                           on_switch=self.prepare_screensaver,
+                                           command=display_daemon.effect_command)
+        self.controller.on('pause', self.toggle_pause)
+        self.controller.on('info', self.show_screensaver_info)
+        self.controller.on('resolution', self.cycle_resolution)
+        
+        # Cards are drawn once and shown over the running screensaver
+        self.banner = StatusBanner(self.LCD, self.render_banner, hold=self.hold_for_card)
+        self.info = StatusBanner(self.LCD, self.render_info, duration=2.0, hold=self.hold_for_card)
         
         # Setup button handlers
         self.setup_button_handlers()
@@ -124,20 +76,14 @@ class ButtonScreensaverSwitcher:
         
     def setup_button_handlers(self):
         """Setup button event handlers"""
-        self.key1.when_pressed = self.next_screensaver
-        self.key2.when_pressed = self.previous_screensaver
-        self.key3.when_pressed = self.toggle_pause
+        # Callbacks run on gpiozero's thread, so they only queue a command
+        self.key1.when_pressed = lambda: self.controller.post('next')
+        self.key2.when_pressed = lambda: self.controller.post('prev')
+        self.key3.when_pressed = lambda: self.controller.post('pause')
         self.joy_up.when_pressed = self.next_favorite
-        self.joy_down.when_pressed = self.show_info
-        self.joy_press.when_pressed = self.exit_switcher
-        
-    def debounce_check(self):
-        """Simple debounce to prevent button spam"""
-        current_time = time.time()
-        if current_time - self.last_button_time < self.debounce_time:
-            return False
-        self.last_button_time = current_time
-        return True
+        self.joy_down.when_pressed = lambda: self.controller.post('info')
+        self.joy_left.when_pressed = lambda: self.controller.post('resolution')
+        self.joy_press.when_pressed = lambda: self.controller.post('exit')
     
     def show_controls(self):
         """Display control instructions on LCD"""
@@ -153,6 +99,7 @@ class ButtonScreensaverSwitcher:
             "KEY3: Pause ⏸",
             "↑: Favorites ⭐",
             "↓: Info ℹ️",
+            "←: Resolution",
             "⭕: Exit"
         ]
         
@@ -164,11 +111,16 @@ class ButtonScreensaverSwitcher:
         self.LCD.LCD_ShowImage(image, 0, 0)
         time.sleep(3)
     
-    def show_screensaver_info(self, index):
-        """Display current screensaver info"""
-        if index >= len(self.screensavers):
-            return
-            
+    def render_banner(self, index):
+        """Banner shown while a screensaver starts"""
+        saver = self.screensavers[index]
+        return draw_card([
+            (f"#{index + 1}: {saver['name'][:16]}", (255, 255, 0)),
+            (f"Cat: {saver['category']}", (200, 200, 255)),
+        ], self.LCD.width, BANNER_HEIGHT, (0, 20, 40))
+    
+    def render_info(self, index):
+        """Full info card for a screensaver"""
         saver = self.screensavers[index]
         image = Image.new('RGB', (self.LCD.width, self.LCD.height), (0, 20, 40))
         draw = ImageDraw.Draw(image)
@@ -204,120 +156,58 @@ class ButtonScreensaverSwitcher:
         
         # Controls reminder
         draw.text((2, 110), "KEY1→ KEY2← KEY3⏸", fill=(150, 150, 150), font=font)
-        
-        self.LCD.LCD_ShowImage(image, 0, 0)
-        time.sleep(2)
-    
-    def start_screensaver(self, index):
-        """Start a specific screensaver"""
-        if index >= len(self.screensavers):
-            print(f"❌ Invalid screensaver index: {index}")
-            return False
-            
-        saver = self.screensavers[index]
-        filepath = saver['file']
-        
-        if not os.path.exists(filepath):
-            print(f"❌ File not found: {filepath}")
-            return False
-        
-        # Stop current screensaver
-        self.stop_current_screensaver()
-        
-        # Show info briefly
-        self.show_screensaver_info(index)
-        
-        try:
-            print(f"🚀 Starting: {saver['name']}")
-            self.current_process = subprocess.Popen(['python3', filepath])
-            return True
-        except Exception as e:
-            print(f"❌ Error starting screensaver: {e}")
-            return False
+        return image
     
-    def stop_current_screensaver(self):
-        """Stop the currently running screensaver"""
-        if self.current_process:
-            try:
-                self.current_process.terminate()
-                self.current_process.wait(timeout=3)
-            except subprocess.TimeoutExpired:
-                self.current_process.kill()
-            except:
-                pass
-            finally:
-                self.current_process = None
-        
-        # Also kill any orphaned Python screensaver processes
-        try:
-            subprocess.run(['pkill', '-f', 'glyph_rain'], capture_output=True)
-            subprocess.run(['pkill', '-f', 'screensaver'], capture_output=True)
-        except:
-            pass
+    def show_screensaver_info(self, arg=None):
+        """Show the current screensaver's info card over it"""
+        index = self.controller.index
+        print(f"ℹ️ Info: #{index + 1}")
+        self.info.show(index)
     
-    def next_screensaver(self):
-        """Switch to next screensaver"""
-        if not self.debounce_check():
-            return
-            
-        self.current_index = (self.current_index + 1) % len(self.screensavers)
-        print(f"🔄 Next → #{self.current_index + 1}")
-        self.start_screensaver(self.current_index)
+    def hold_for_card(self, signum):
+        """Stop/resume the screensaver around a card, leaving a user pause alone"""
+        if self.paused:
+            return False
+        return self.controller.send_signal(signum)
     
-    def previous_screensaver(self):
-        """Switch to previous screensaver"""
-        if not self.debounce_check():
-            return
-            
-        self.current_index = (self.current_index - 1) % len(self.screensavers)
-        print(f"🔄 Prev ← #{self.current_index + 1}")
-        self.start_screensaver(self.current_index)
+    def prepare_screensaver(self, index):
+        """Show a banner over the screensaver as it starts (doesn't wait)"""
+        self.paused = False
+        print(f"🔄 → #{index + 1} {self.screensavers[index]['name']}")
+        self.banner.show(index)
     
     def next_favorite(self):
         """Jump to next favorite screensaver"""
-        if not self.debounce_check():
-            return
-            
         self.favorite_index = (self.favorite_index + 1) % len(self.favorites)
-        self.current_index = self.favorites[self.favorite_index]
-        print(f"⭐ Favorite → #{self.current_index + 1}")
-        self.start_screensaver(self.current_index)
+        print(f"⭐ Favorite → #{self.favorites[self.favorite_index] + 1}")
+        self.controller.post('goto', self.favorites[self.favorite_index])
     
-    def toggle_pause(self):
+    def toggle_pause(self, arg=None):
         """Toggle pause/resume current screensaver"""
-        if not self.debounce_check():
-            return
-            
-        if self.current_process:
-            try:
-                if self.paused:
-                    # Resume
-                    self.current_process.send_signal(signal.SIGCONT)
+        try:
+            if self.paused:
+                # Resume
+                if self.controller.send_signal(signal.SIGCONT):
                     self.paused = False
                     print("▶️ Resumed")
-                else:
-                    # Pause
-                    self.current_process.send_signal(signal.SIGSTOP)
+            else:
+                # Pause
+                if self.controller.send_signal(signal.SIGSTOP):
                     self.paused = True
                     print("⏸️ Paused")
-            except Exception as e:
-                print(f"❌ Pause/resume error: {e}")
-    
-    def show_info(self):
-        """Show current screensaver info"""
-        if not self.debounce_check():
-            return
-            
-        print(f"ℹ️ Info: #{self.current_index + 1}")
-        self.show_screensaver_info(self.current_index)
+        except Exception as e:
+            print(f"❌ Pause/resume error: {e}")
     
-    def exit_switcher(self):
-        """Exit the switcher"""
-        if not self.debounce_check():
+    def cycle_resolution(self, arg=None):
+        """Ask the running effect to switch render resolution"""
+        saver = self.screensavers[self.controller.index]
+        if not saver.get('scalable'):
+            print(f"🔍 {saver['name']} renders at a fixed resolution")
             return
-            
-        print("🚪 Exit button pressed")
-        self.running = False
+        
+        # The effect's RenderScale cycles 128 → 64 → 32 on SIGUSR1
+        if self.controller.send_signal(signal.SIGUSR1):
+            print(f"🔍 Resolution switch → {saver['name']}")
     
     def run(self):
         """Main run loop"""
@@ -328,27 +218,17 @@ class ButtonScreensaverSwitcher:
         print("   KEY3 (Pin 16): Pause/Resume ⏸️")
         print("   UP (Pin 6): Next favorite ⭐")
         print("   DOWN (Pin 19): Show info ℹ️")
+        print("   LEFT (Pin 5): Cycle render resolution 🔍")
         print("   PRESS (Pin 13): Exit 🚪")
         print()
         
-        # Start with first screensaver
-        self.start_screensaver(self.current_index)
-        
+        # Start with the first screensaver and handle presses until exit
         try:
-            # Keep running until exit button pressed
-            while self.running:
-                time.sleep(0.1)
-                
-                # Check if current screensaver crashed
-                if self.current_process and self.current_process.poll() is not None:
-                    print("⚠️ Screensaver ended, restarting...")
-                    self.start_screensaver(self.current_index)
-                    
+            asyncio.run(self.controller.run(0))
         except KeyboardInterrupt:
             print("\n🛑 Ctrl+C pressed")
         
         print("🧹 Cleaning up...")
-        self.stop_current_screensaver()
         self.LCD.LCD_Clear()
         print("✅ Button switcher stopped!")
 
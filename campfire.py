@@ -6,12 +6,13 @@ Simple campfire with flickering flames and warm colors
 
 import LCD_1in44
 import time
-import random
 import math
 from PIL import Image, ImageDraw
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class Campfire:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🏕️ Initializing Campfire...")
         
         # Initialize LCD
@@ -25,6 +26,8 @@ class Campfire:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Campfire base
         self.fire_base_y = self.height - 10
         
@@ -36,11 +39,11 @@ class Campfire:
             x = 30 + i * 15  # Spread across middle of screen
             self.flame_tongues.append({
                 'x': x,
-                'base_height': random.randint(20, 40),
+                'base_height': self.random.randint(20, 40),
                 'current_height': 0,
-                'flicker_phase': random.uniform(0, 2 * math.pi),
-                'flicker_speed': random.uniform(0.1, 0.3),
-                'width': random.randint(8, 15)
+                'flicker_phase': self.random.uniform(0, 2 * math.pi),
+                'flicker_speed': self.random.uniform(0.1, 0.3),
+                'width': self.random.randint(8, 15)
             })
         
         # Simple fire colors
@@ -100,7 +103,7 @@ class Campfire:
                 
                 # Add some random flicker to color
                 r, g, b = color
-                flicker_factor = 0.8 + 0.2 * random.random()
+                flicker_factor = 0.8 + 0.2 * self.random.random()
                 final_color = (
                     int(r * flicker_factor),
                     int(g * flicker_factor),
@@ -121,13 +124,13 @@ class Campfire:
                         draw.rectangle([left, top, right, bottom], fill=final_color)
         
         # Add some sparks/embers
-        if random.random() < 0.1:  # 10% chance
-            for _ in range(random.randint(1, 3)):
-                spark_x = random.randint(20, self.width - 20)
-                spark_y = random.randint(self.fire_base_y - 30, self.fire_base_y - 10)
+        if self.random.random() < 0.1:  # 10% chance
+            for _ in range(self.random.randint(1, 3)):
+                spark_x = self.random.randint(20, self.width - 20)
+                spark_y = self.random.randint(self.fire_base_y - 30, self.fire_base_y - 10)
                 
                 if 0 <= spark_x < self.width and 0 <= spark_y < self.height:
-                    spark_color = random.choice([
+                    spark_color = self.random.choice([
                         (255, 100, 0),    # Orange spark
                         (255, 150, 50),   # Yellow spark
                         (255, 200, 100),  # Bright spark
@@ -172,7 +175,9 @@ class Campfire:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(12, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -184,7 +189,7 @@ class Campfire:
                     elapsed = time.time() - start_time
                     print(f"🏕️ {elapsed:.1f}s: Campfire burning steadily")
                 
-                time.sleep(0.08)  # ~12 FPS for gentle flicker
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # ~12 FPS for gentle flicker
                 
         except KeyboardInterrupt:
             print(f"\n🏕️ Campfire extinguished")
@@ -24,7 +24,6 @@
  # THE SOFTWARE.
  #
  
-import spidev
 import time
 import logging
 import numpy as np
@@ -42,7 +41,11 @@ KEY2_PIN       = 20
 KEY3_PIN       = 16
 
 class RaspberryPi:
-    def __init__(self,spi=spidev.SpiDev(0,0),spi_freq=40000000,rst = 27,dc = 25,bl = 24,bl_freq=1000,i2c=None,i2c_freq=100000):
+    def __init__(self,spi=None,spi_freq=40000000,rst = 27,dc = 25,bl = 24,bl_freq=1000,i2c=None,i2c_freq=100000):
+        # Opened here rather than as a default argument, which opened it on import
+        if spi is None:
+            import spidev
+            spi = spidev.SpiDev(0,0)
         self.np=np
         self.INPUT = False
         self.OUTPUT = True
@@ -50,7 +53,8 @@ class RaspberryPi:
         self.SPEED  =spi_freq
         self.BL_freq=bl_freq
 
-        self.GPIO_RST_PIN= self.gpio_mode(rst,self.OUTPUT)
+        # Reset starts released so an already initialized panel keeps its state
+        self.GPIO_RST_PIN= self.gpio_mode(rst,self.OUTPUT,initial_value=True)
         self.GPIO_DC_PIN = self.gpio_mode(dc,self.OUTPUT)
         self.GPIO_BL_PIN = self.gpio_pwm(bl)
         self.bl_DutyCycle(0)
@@ -77,9 +81,9 @@ class RaspberryPi:
             self.SPI.max_speed_hz = spi_freq
             self.SPI.mode = 0b00
 
-    def gpio_mode(self,Pin,Mode,pull_up = None,active_state = True):
+    def gpio_mode(self,Pin,Mode,pull_up = None,active_state = True,initial_value = False):
         if Mode:
-            return DigitalOutputDevice(Pin,active_high = True,initial_value =False)
+            return DigitalOutputDevice(Pin,active_high = True,initial_value =initial_value)
         else:
             return DigitalInputDevice(Pin,pull_up=pull_up,active_state=active_state)
 
@@ -102,6 +106,11 @@ class RaspberryPi:
         if self.SPI!=None :
             self.SPI.writebytes(data)
 
+    def spi_writebytes2(self, data):
+        # Accepts bytes/memoryview/numpy buffers and chunks them internally
+        if self.SPI!=None :
+            self.SPI.writebytes2(data)
+
     def bl_DutyCycle(self, duty):
         self.GPIO_BL_PIN.value = duty / 100
         
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Display Daemon - One long-lived owner for the LCD
+Opens the LCD once and takes frames from effect processes, so launching
+or switching effects no longer means killing the previous one and waiting
+for the GPIO pins to come free. A Unix socket carries control messages;
+frames travel through each client's shared-memory ring (frame_ring).
+Clients stack: the newest is on screen, the others are paused until it
+leaves.
+
+Usage:
+    python3 display_daemon.py serve                  # Own the LCD (run once)
+    python3 display_daemon.py run <effect.py> [args] # Run an effect through the daemon
+    python3 display_daemon.py status                 # Show connected clients
+    python3 display_daemon.py switch <name>          # Bring a client back on screen
+    python3 display_daemon.py stop                   # Stop the daemon
+"""
+
+import sys
+import os
+import time
+import struct
+import socket
+import selectors
+import runpy
+import atexit
+import signal
+import zlib
+import numpy as np
+
+from frame_ring import FrameRing, pack_rgb565
+
+# In the user's runtime directory when there is one; either way only the owner may connect
+SOCKET_PATH = os.environ.get('M5_DISPLAY_SOCKET', os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or '/tmp', 'm5-display.sock'))
+
+# 'shm' passes frames through a shared-memory ring, 'socket' sends them inline
+TRANSPORT = os.environ.get('M5_DISPLAY_TRANSPORT', 'shm')
+
+# Every message: 4-byte kind, payload length, payload
+MESSAGE = struct.Struct('<4sI')
+SIZE = struct.Struct('<HH')
+OVERLAY_HEADER = struct.Struct('<hhHHf')   # x, y, card width, height, seconds; RGB565 card follows
+
+# Client -> daemon
+HELLO = b'HELO'   # Client name; answered with SIZE
+FRAME = b'FRAM'   # RGB888 frame
+FRAME_565 = b'R565'  # Packed RGB565 frame, sent to SPI as is
+RING = b'RING'    # Name of the client's shared-memory frame ring
+TICK = b'TICK'    # A new frame is in the ring
+CLEAR = b'CLR '
+OVERLAY = b'OVLY'  # Status card composited over every frame for a while
+LIST = b'LIST'    # Answered with TEXT
+FOCUS = b'FOCS'   # Client name to bring on screen
+QUIT = b'QUIT'
+
+# Daemon -> client
+SCREEN = b'SIZE'  # Display width, height
+SHOW = b'SHOW'    # Client is on screen again
+HIDE = b'HIDE'    # Another client took the screen; frames are dropped
+TEXT = b'TEXT'
+
+
+def send_message(sock, kind, payload=b''):
+    """Send one framed message"""
+    sock.sendall(MESSAGE.pack(kind, len(payload)) + payload)
+
+
+def recv_exact(sock, count):
+    """Read exactly count bytes, or None if the peer closed"""
+    data = bytearray()
+    while len(data) < count:
+        chunk = sock.recv(count - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return bytes(data)
+
+
+def recv_message(sock):
+    """Read one framed message; (None, None) if the peer closed"""
+    header = recv_exact(sock, MESSAGE.size)
+    if header is None:
+        return None, None
+    kind, length = MESSAGE.unpack(header)
+    payload = recv_exact(sock, length) if length else b''
+    if payload is None:
+        return None, None
+    return kind, payload
+
+
+def daemon_running(path=SOCKET_PATH):
+    """True when a daemon is listening on the socket"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(path)
+        return True
+    except OSError:
+        return False
+
+
+class Overlay:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.card = None
+        self.x = self.y = 0
+        self.expires = 0.0
+
+    def show(self, card, x, y, seconds):
+        """Composite card, an (h, w, 2) RGB565 array, at x, y for seconds"""
+        # Clip to the panel so a card can't write outside the frame
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + card.shape[1], self.width), min(y + card.shape[0], self.height)
+        if right <= left or bottom <= top:
+            return
+        self.card = card[top - y:bottom - y, left - x:right - x]
+        self.x, self.y = left, top
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds until the card expires, or None without one"""
+        return None if self.card is None else max(self.expires - time.monotonic(), 0.0)
+
+    def expire(self):
+        """Drop the card once its time is up; True when it just went"""
+        if self.card is not None and time.monotonic() >= self.expires:
+            self.card = None
+            return True
+        return False
+
+    def apply(self, frame):
+        """Copy of a packed frame with the card on top (the frame itself is untouched)"""
+        if self.card is None:
+            return frame
+        out = np.array(frame, dtype=np.uint8).reshape(self.height, self.width, 2)
+        out[self.y:self.y + self.card.shape[0], self.x:self.x + self.card.shape[1]] = self.card
+        return out.reshape(-1)
+
+
+class Client:
+    def __init__(self, sock):
+        self.sock = sock
+        self.name = None
+        self.buffer = bytearray()
+        self.frames = 0
+        self.bytes_full = 0     # Frame bytes pushed for this client, and what the panel was sent
+        self.bytes_sent = 0
+        self.ring = None
+        self.sequence = 0   # Last ring frame pushed
+
+
+class DisplayDaemon:
+    def __init__(self, lcd, path=SOCKET_PATH):
+        self.lcd = lcd
+        self.path = path
+        self.width = lcd.width
+        self.height = lcd.height
+        self.stack = []     # Named clients, last one on screen
+        self.running = False
+        self.overlay = Overlay(self.width, self.height)
+        self.last_frame = None  # Packed, without the overlay, for repainting around it
+        self.rgb565 = np.empty((self.height, self.width, 2), dtype=np.uint8)
+
+        if os.path.exists(path):
+            if daemon_running(path):
+                raise RuntimeError(f"Display daemon already running on {path}")
+            os.unlink(path)  # Stale socket from a daemon that died
+
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Created 0600 so other local users can't take the screen or send QUIT
+        umask = os.umask(0o177)
+        try:
+            self.server.bind(path)
+        finally:
+            os.umask(umask)
+        self.server.listen(8)
+        self.server.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+
+    @property
+    def active(self):
+        return self.stack[-1] if self.stack else None
+
+    def serve_forever(self):
+        """Handle clients until stop() or a QUIT message"""
+        self.running = True
+        try:
+            while self.running:
+                # Wake up when a status card is due to come off
+                remaining = self.overlay.remaining()
+                timeout = 0.5 if remaining is None else min(remaining, 0.5)
+                for key, _ in self.selector.select(timeout=timeout):
+                    if key.fileobj is self.server:
+                        self.accept()
+                    else:
+                        self.read(key.data)
+                if self.overlay.expire() and self.last_frame is not None:
+                    self.lcd.LCD_ShowRGB565(self.last_frame)
+        finally:
+            self.close()
+
+    def stop(self):
+        self.running = False
+
+    def accept(self):
+        try:
+            sock, _ = self.server.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        self.selector.register(sock, selectors.EVENT_READ, Client(sock))
+
+    def read(self, client):
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self.remove(client)
+            return
+
+        client.buffer += data
+        # Handle every complete message in the buffer
+        while len(client.buffer) >= MESSAGE.size:
+            kind, length = MESSAGE.unpack_from(client.buffer)
+            end = MESSAGE.size + length
+            if len(client.buffer) < end:
+                break
+            payload = bytes(client.buffer[MESSAGE.size:end])
+            del client.buffer[:end]
+            # A client that sends something the panel can't take is dropped, never the daemon
+            try:
+                if self.valid(client, kind, payload):
+                    self.handle(client, kind, payload)
+                else:
+                    print(f"⚠️ Dropping {client.name or 'client'}: bad {kind!r} message ({length} bytes)")
+                    self.remove(client)
+            except Exception as e:
+                print(f"⚠️ Dropping {client.name or 'client'}: {e}")
+                self.remove(client)
+            if client.sock.fileno() < 0:
+                return
+
+    def valid(self, client, kind, payload):
+        """Whether a frame or card payload matches the panel it is meant for"""
+        pixels = self.width * self.height
+        if kind == FRAME:
+            return len(payload) == pixels * 3
+        if kind == FRAME_565:
+            return len(payload) == pixels * 2
+        if kind == TICK:
+            return client.ring is not None
+        if kind == OVERLAY:
+            if len(payload) < OVERLAY_HEADER.size:
+                return False
+            x, y, width, height, _ = OVERLAY_HEADER.unpack_from(payload)
+            return (len(payload) == OVERLAY_HEADER.size + width * height * 2
+                    and x >= 0 and y >= 0 and x + width <= self.width and y + height <= self.height)
+        return True
+
+    def handle(self, client, kind, payload):
+        """Act on one message from a client"""
+        if kind == TICK or kind == FRAME or kind == FRAME_565 or kind == CLEAR:
+            # Frames from clients that are not on screen are dropped
+            if client is not self.active:
+                return
+            if kind == TICK:
+                # Only the newest complete frame is pushed; stale ticks find nothing new
+                client.sequence, frame = client.ring.read(client.sequence)
+                if frame is None:
+                    return
+                self.push(frame, client)
+            elif kind == FRAME:
+                rgb = np.frombuffer(payload, dtype=np.uint8).reshape(self.height, self.width, 3)
+                self.push(pack_rgb565(rgb, self.rgb565).reshape(-1), client)
+            elif kind == FRAME_565:
+                self.push(np.frombuffer(payload, dtype=np.uint8), client)
+            else:
+                self.lcd.LCD_Clear()
+                self.last_frame = None
+            client.frames += 1
+        elif kind == OVERLAY:
+            x, y, width, height, seconds = OVERLAY_HEADER.unpack_from(payload)
+            card = np.frombuffer(payload, dtype=np.uint8, offset=OVERLAY_HEADER.size)
+            self.overlay.show(card.reshape(height, width, 2), x, y, seconds)
+            # Show it now, over whatever is up, rather than waiting for the next frame
+            blank = np.zeros(self.width * self.height * 2, dtype=np.uint8)
+            self.push(self.last_frame if self.last_frame is not None else blank)
+        elif kind == HELLO:
+            client.name = payload.decode('utf-8', 'replace') or f"client-{client.sock.fileno()}"
+            self.send(client, SCREEN, SIZE.pack(self.width, self.height))
+            self.focus(client)
+            print(f"🖥️ {client.name} connected")
+        elif kind == RING:
+            try:
+                client.ring = FrameRing.attach(payload.decode())
+            except (OSError, ValueError):
+                # The client exited before its ring could be opened
+                self.remove(client)
+        elif kind == LIST:
+            lines = [f"{'*' if c is self.active else ' '} {c.name} ({c.frames} frames"
+                     + (f", {1 - c.bytes_sent / c.bytes_full:.0%} SPI bytes saved)" if c.bytes_full else ")")
+                     for c in reversed(self.stack)]
+            self.send(client, TEXT, '\n'.join(lines).encode())
+        elif kind == FOCUS:
+            name = payload.decode('utf-8', 'replace')
+            for other in reversed(self.stack):
+                if other.name == name:
+                    self.focus(other)
+                    break
+            self.send(client, TEXT, (self.active.name if self.active else '').encode())
+        elif kind == QUIT:
+            self.stop()
+
+    def push(self, frame, client=None):
+        """Send a packed frame to the panel, with any status card on top"""
+        self.last_frame = frame
+        # The driver's tile delta says how much of each frame actually went over SPI
+        delta = getattr(self.lcd, 'tile_delta', None)
+        sent = delta.bytes_sent if delta is not None else 0
+        self.lcd.LCD_ShowRGB565(self.overlay.apply(frame))
+        if delta is not None and client is not None:
+            client.bytes_full += self.width * self.height * 2
+            client.bytes_sent += delta.bytes_sent - sent
+
+    def focus(self, client):
+        """Put a client on screen, pausing the one it replaces"""
+        previous = self.active
+        if client in self.stack:
+            self.stack.remove(client)
+        self.stack.append(client)
+        if previous is not None and previous is not client:
+            self.send(previous, HIDE)
+        self.send(client, SHOW)
+
+    def remove(self, client):
+        was_active = client is self.active
+        if client in self.stack:
+            self.stack.remove(client)
+        try:
+            self.selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
+        if client.ring is not None:
+            client.ring.close()
+            client.ring = None
+        if client.name:
+            print(f"🖥️ {client.name} disconnected")
+        # The client underneath resumes and redraws on its next frame
+        if was_active and self.active is not None:
+            self.send(self.active, SHOW)
+
+    def send(self, client, kind, payload=b''):
+        try:
+            client.sock.setblocking(True)
+            send_message(client.sock, kind, payload)
+            client.sock.setblocking(False)
+        except OSError:
+            self.remove(client)
+
+    def close(self):
+        self.stack = []
+        for key in list(self.selector.get_map().values()):
+            if key.fileobj is not self.server:
+                key.fileobj.close()
+                if key.data.ring is not None:
+                    key.data.ring.close()
+        self.selector.close()
+        self.server.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+class DisplayClient:
+    """Drop-in for LCD_1in44.LCD that sends frames to the daemon"""
+
+    def __init__(self, name=None, path=SOCKET_PATH, transport=TRANSPORT):
+        self.name = name or os.path.splitext(os.path.basename(sys.argv[0]))[0] or 'effect'
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        send_message(self.sock, HELLO, self.name.encode())
+
+        kind, payload = recv_message(self.sock)
+        if kind != SCREEN:
+            raise RuntimeError("Display daemon did not answer")
+        self.width, self.height = SIZE.unpack(payload)
+        # New clients go on screen, so SHOW always follows SIZE
+        self.visible = False
+        self.handle(recv_message(self.sock)[0])
+
+        # Frames are packed straight into shared memory; the socket only carries ticks
+        self.ring = None
+        self.first_frame_pending = True
+        # Unchanged frames are not sent at all; the count lets a FramePacer idle
+        self.last_frame_crc = None
+        self.static_frames = 0
+        if transport == 'shm':
+            self.ring = FrameRing.create(self.width, self.height)
+            send_message(self.sock, RING, self.ring.name.encode())
+        atexit.register(self.close)
+
+    def LCD_Init(self, scan_dir):
+        pass  # The daemon initialised the panel once
+
+    def LCD_Clear(self):
+        # The start-up clear is dropped: the previous effect stays up until the first frame
+        if self.first_frame_pending:
+            return
+        # Not waited on: paused effects clear on their way out, and the daemon drops it
+        self.last_frame_crc = None
+        send_message(self.sock, CLEAR)
+
+    def frame_changed(self, data):
+        """False for a frame identical to the last one sent"""
+        crc = zlib.crc32(data)
+        if crc == self.last_frame_crc:
+            self.static_frames += 1
+            return False
+        self.last_frame_crc = crc
+        self.static_frames = 0
+        return True
+
+    def LCD_ShowImage(self, image, x_start, y_start):
+        """Send a frame; blocks while another client is on screen"""
+        self.wait_visible()
+        self.first_frame_pending = False
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        data = image.tobytes()
+        if not self.frame_changed(data):
+            return
+        if self.ring is not None:
+            self.ring.write_rgb(image)
+            send_message(self.sock, TICK)
+        else:
+            send_message(self.sock, FRAME, data)
+
+    def LCD_ShowRGB565(self, data):
+        self.wait_visible()
+        self.first_frame_pending = False
+        if not self.frame_changed(data):
+            return
+        if self.ring is not None:
+            self.ring.write(data)
+            send_message(self.sock, TICK)
+        else:
+            send_message(self.sock, FRAME_565, bytes(data))
+
+    def handle(self, kind):
+        if kind is None:
+            raise ConnectionError("Display daemon went away")
+        if kind == SHOW:
+            self.visible = True
+            self.last_frame_crc = None  # Someone else's frame is up; send the next one regardless
+        elif kind == HIDE:
+            self.visible = False
+
+    def poll(self):
+        """Apply any SHOW/HIDE notifications without blocking"""
+        self.sock.setblocking(False)
+        try:
+            while True:
+                header = self.sock.recv(MESSAGE.size, socket.MSG_PEEK)
+                if not header:
+                    self.handle(None)
+                if len(header) < MESSAGE.size:
+                    break
+                self.sock.setblocking(True)
+                kind, _ = recv_message(self.sock)
+                self.sock.setblocking(False)
+                self.handle(kind)
+        except BlockingIOError:
+            pass
+        finally:
+            self.sock.setblocking(True)
+
+    def wait_visible(self):
+        """Block until this client is on screen"""
+        self.poll()
+        while not self.visible:
+            kind, _ = recv_message(self.sock)
+            self.handle(kind)
+
+    def close(self):
+        self.sock.close()
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+
+def show_overlay(card, width, height, x=0, y=0, seconds=1.5, path=SOCKET_PATH):
+    """Put a packed RGB565 card over the screen for a while; returns without waiting"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        send_message(sock, OVERLAY, OVERLAY_HEADER.pack(x, y, width, height, seconds) + bytes(card))
+
+
+def effect_command():
+    """Command prefix that launches an effect script on the display"""
+    if daemon_running():
+        return ['python3', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'display_daemon.py'), 'run']
+    return ['python3']
+
+
+def request(kind, payload=b'', path=SOCKET_PATH):
+    """Send a control message and return the daemon's text reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        send_message(sock, kind, payload)
+        if kind == QUIT or kind == OVERLAY:
+            return ''
+        _, reply = recv_message(sock)
+        return (reply or b'').decode('utf-8', 'replace')
+
+
+def stop_effect(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_effect(script, args):
+    """Run an effect script with its LCD routed through the daemon"""
+    import headless
+    headless.install(DisplayClient)
+    # Effects clean up on Ctrl+C; give a terminate (switch, test timeout) the same path
+    signal.signal(signal.SIGTERM, stop_effect)
+    sys.argv = [script] + list(args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    runpy.run_path(script, run_name='__main__')
+
+
+def serve():
+    import LCD_1in44
+    lcd = LCD_1in44.LCD()
+    lcd.LCD_Init(LCD_1in44.SCAN_DIR_DFT)
+    lcd.refresh_seconds = None  # Every frame and card goes through here, so the driver's cache holds
+    lcd.LCD_Clear()
+
+    daemon = DisplayDaemon(lcd)
+    print(f"🖥️ Display daemon ready on {daemon.path} ({daemon.width}x{daemon.height})")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    lcd.LCD_Clear()
+    print("✅ Display daemon stopped")
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else ''
+
+    if command == 'serve':
+        serve()
+    elif command == 'run' and len(sys.argv) > 2:
+        if not daemon_running():
+            print(f"❌ No display daemon on {SOCKET_PATH}")
+            sys.exit(1)
+        run_effect(sys.argv[2], sys.argv[3:])
+    elif command in ('status', 'switch', 'stop'):
+        if not daemon_running():
+            print(f"❌ No display daemon on {SOCKET_PATH}")
+            sys.exit(1)
+        if command == 'status':
+            start = time.perf_counter()
+            clients = request(LIST)
+            print(f"🖥️ Display daemon on {SOCKET_PATH} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+            print(clients or "   No clients")
+        elif command == 'switch' and len(sys.argv) > 2:
+            print(f"🖥️ On screen: {request(FOCUS, sys.argv[2].encode()) or 'nothing'}")
+        elif command == 'stop':
+            request(QUIT)
+            print("✅ Stop requested")
+    else:
+        print("Usage:")
+        print("  python3 display_daemon.py serve")
+        print("  python3 display_daemon.py run <effect.py> [args]")
+        print("  python3 display_daemon.py status")
+        print("  python3 display_daemon.py switch <name>")
+        print("  python3 display_daemon.py stop")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,15 @@ Animated Heighway dragon curve with growing iterations
 
 import LCD_1in44
 import time
-import random
 import math
+import numpy as np
 from PIL import Image, ImageDraw
+import accel
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class DragonCurve:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🐉 Initializing Dragon Curve...")
         
         # Initialize LCD
@@ -25,11 +28,14 @@ class DragonCurve:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Dragon curve parameters
         self.max_iterations = 14
         self.current_iteration = 1
         self.line_length = 2
         self.angle = 0  # Current direction angle
+        self.commands = None  # (iteration, L-system bytes) of the last walk
         
         # Animation parameters
         self.growth_timer = 0
@@ -73,34 +79,21 @@ class DragonCurve:
         
         return current
     
-    def draw_dragon_curve(self, dragon_string, start_x, start_y, angle_offset):
-        """Draw dragon curve from L-system string"""
-        points = []
-        
-        # Starting position and angle
-        x, y = start_x, start_y
-        angle = angle_offset
+    def dragon_commands(self, iterations):
+        """L-system string for an iteration as a byte array, regenerated only when it grows"""
+        if self.commands is None or self.commands[0] != iterations:
+            dragon_string = self.generate_dragon_string(iterations)
+            self.commands = (iterations, np.frombuffer(dragon_string.encode('ascii'), dtype=np.uint8))
+        return self.commands[1]
+    
+    def draw_dragon_curve(self, commands, start_x, start_y, angle_offset):
+        """Draw dragon curve from L-system commands"""
+        # F moves forward, + and - turn 90 degrees right and left
+        xs, ys = accel.turtle_walk(commands, float(start_x), float(start_y),
+                                   float(angle_offset), float(self.line_length))
         
         # Track all points for the path
-        points.append((int(x), int(y)))
-        
-        for char in dragon_string:
-            if char == "F":
-                # Move forward
-                new_x = x + self.line_length * math.cos(math.radians(angle))
-                new_y = y + self.line_length * math.sin(math.radians(angle))
-                
-                points.append((int(new_x), int(new_y)))
-                x, y = new_x, new_y
-                
-            elif char == "+":
-                # Turn right 90 degrees
-                angle += 90
-            elif char == "-":
-                # Turn left 90 degrees
-                angle -= 90
-        
-        return points
+        return list(zip(xs.astype(int).tolist(), ys.astype(int).tolist()))
     
     def draw_frame(self):
         """Draw dragon curve"""
@@ -108,14 +101,14 @@ class DragonCurve:
         draw = ImageDraw.Draw(image)
         
         # Generate dragon curve for current iteration
-        dragon_string = self.generate_dragon_string(self.current_iteration)
+        commands = self.dragon_commands(self.current_iteration)
         
         # Calculate starting position to center the curve
         start_x = self.width // 2
         start_y = self.height // 2
         
         # Get all points of the dragon curve
-        points = self.draw_dragon_curve(dragon_string, start_x, start_y, self.rotation_offset)
+        points = self.draw_dragon_curve(commands, start_x, start_y, self.rotation_offset)
         
         # Draw the dragon curve
         if len(points) > 1:
@@ -165,8 +158,8 @@ class DragonCurve:
             if self.current_iteration > self.max_iterations:
                 self.current_iteration = 1
                 # Change colors or parameters for variety
-                random.shuffle(self.dragon_colors)
-                self.line_length = random.choice([1, 2, 3])
+                self.random.shuffle(self.dragon_colors)
+                self.line_length = self.random.choice([1, 2, 3])
     
     def run(self):
         """Main animation loop"""
@@ -178,7 +171,9 @@ class DragonCurve:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(20, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -189,7 +184,7 @@ class DragonCurve:
                     elapsed = time.time() - start_time
                     print(f"🐉 {elapsed:.1f}s: iteration {self.current_iteration}/{self.max_iterations}")
                 
-                time.sleep(0.05)  # 20 FPS
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 20 FPS
                 
         except KeyboardInterrupt:
             print(f"\n🐉 Dragon curve stopped")
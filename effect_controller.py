@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Effect Controller - Event-driven effect switching for the button switchers
+Button callbacks only queue commands; one coordinator task on an asyncio
+loop runs every transition in order. A burst of next/previous presses
+collapses to a single switch to the final target, and child exits are
+awaited instead of polled.
+"""
+
+import os
+import signal
+import asyncio
+
+NAVIGATION = ('next', 'prev', 'goto')
+
+
+class EffectController:
+    def __init__(self, effects, on_switch=None, restart_delay=1.0, coalesce=0.25, command=('python3',)):
+        self.effects = effects            # Effect script paths
+        self.on_switch = on_switch        # Blocking callback(index) run before each start
+        self.restart_delay = restart_delay
+        self.coalesce = coalesce          # Seconds of quiet that end a burst of presses
+        self.command = command            # Command prefix, or a callable returning it at each start
+        self.handlers = {}
+
+        self.index = 0                    # Target effect
+        self.current = None               # Effect actually running
+        self.process = None
+        self.loop = None
+        self.queue = None
+        self.running = False
+
+    def on(self, command, handler):
+        """Run handler(arg) off the loop when command is posted"""
+        self.handlers[command] = handler
+
+    def post(self, command, arg=None):
+        """Queue a command; safe from any thread (gpiozero calls back on its own)"""
+        loop = self.loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.queue.put_nowait, (command, arg))
+
+    def navigate(self, command, arg):
+        """Move the target without starting anything"""
+        if command == 'next':
+            self.index = (self.index + 1) % len(self.effects)
+        elif command == 'prev':
+            self.index = (self.index - 1) % len(self.effects)
+        else:
+            self.index = arg % len(self.effects)
+
+    async def run(self, index=0):
+        """Coordinator: handle queued commands until 'exit'"""
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self.running = True
+        self.index = index
+        try:
+            await self.switch()
+            while self.running:
+                command, arg = await self.queue.get()
+                await self.dispatch(command, arg)
+        finally:
+            await self.stop()
+            self.loop = None
+
+    async def dispatch(self, command, arg):
+        if command in NAVIGATION:
+            self.navigate(command, arg)
+            # Keep absorbing presses until they stop, then switch once
+            deferred = []
+            while True:
+                try:
+                    command, arg = await asyncio.wait_for(self.queue.get(), self.coalesce)
+                except asyncio.TimeoutError:
+                    break
+                if command == 'exit':
+                    self.running = False
+                    return
+                if command in NAVIGATION:
+                    self.navigate(command, arg)
+                else:
+                    deferred.append((command, arg))
+            if self.index != self.current:
+                await self.switch()
+            for command, arg in deferred:
+                await self.dispatch(command, arg)
+        elif command == 'exited':
+            # Only an unexpected exit of the running effect restarts it
+            if arg is self.process:
+                print("⚠️ Screensaver ended, restarting...")
+                await asyncio.sleep(self.restart_delay)
+                await self.switch()
+        elif command == 'exit':
+            self.running = False
+        elif command in self.handlers:
+            await self.loop.run_in_executor(None, self.handlers[command], arg)
+
+    async def switch(self):
+        """Stop the running effect and start the target one"""
+        await self.stop()
+        index = self.index
+        if self.on_switch:
+            await self.loop.run_in_executor(None, self.on_switch, index)
+
+        filepath = self.effects[index]
+        self.current = index
+        if not os.path.exists(filepath):
+            print(f"❌ Missing: {filepath}")
+            return
+        try:
+            command = self.command() if callable(self.command) else self.command
+            print(f"🚀 Starting #{index + 1}: {filepath}")
+            self.process = await asyncio.create_subprocess_exec(*command, filepath)
+        except OSError as e:
+            print(f"❌ Error: {e}")
+            return
+        asyncio.ensure_future(self.watch(self.process))
+
+    async def watch(self, process):
+        await process.wait()
+        self.queue.put_nowait(('exited', process))
+
+    async def stop(self):
+        """Terminate the running effect and wait for it to exit"""
+        process, self.process, self.current = self.process, None, None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.send_signal(signal.SIGCONT)  # A paused effect can't act on SIGTERM
+            process.terminate()
+            await asyncio.wait_for(process.wait(), 3)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        except ProcessLookupError:
+            pass
+
+    def send_signal(self, signum):
+        """Signal the running effect; False if nothing is running"""
+        if self.process is None or self.process.returncode is not None:
+            return False
+        self.process.send_signal(signum)
+        return True
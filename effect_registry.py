@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Effect Registry - The one list of effects every launcher reads
+Metadata (menu number, name, category, target FPS, cost class) lives in
+effects.json and is parsed with the standard library alone, so menus and
+launchers start without importing NumPy or PIL. An effect's module is only
+imported when its class is asked for.
+
+Usage:
+    python3 effect_registry.py list          # Effects with FPS and cost class
+    python3 effect_registry.py show <name>   # One effect's metadata
+"""
+
+import os
+import sys
+import json
+import importlib
+
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'effects.json')
+
+STABILITY = {
+    'stable': '🟢 STABLE',
+    'original': '🟡 ORIGINAL',
+    'switcher': '🕹️ BUTTONS',
+}
+
+# Render cost per frame: light < 1 ms, medium < 3 ms, heavy beyond (golden timings on a desktop)
+COST_CLASSES = ('light', 'medium', 'heavy')
+
+_loaded = {}
+
+
+def load(path=REGISTRY_FILE):
+    """Parsed registry for path, read once per process"""
+    if path not in _loaded:
+        with open(path) as f:
+            registry = json.load(f)
+        base = os.path.dirname(os.path.abspath(path))
+        # One directory listing instead of an exists() check per entry
+        present = set(os.listdir(base))
+        for entry in registry['effects'] + registry['switchers']:
+            entry.setdefault('module', entry['key'])
+            entry['file'] = entry['module'] + '.py'
+            entry['path'] = os.path.join(base, entry['file'])
+            entry['available'] = entry['file'] in present
+            entry['stability'] = STABILITY[entry['status']]
+        _loaded[path] = registry
+    return _loaded[path]
+
+
+def effects(path=REGISTRY_FILE):
+    """{menu number: effect} in menu order"""
+    return {entry['number']: entry for entry in load(path)['effects']}
+
+
+def switchers(path=REGISTRY_FILE):
+    """{menu number: button switcher script}"""
+    return {entry['number']: entry for entry in load(path)['switchers']}
+
+
+def launchable(path=REGISTRY_FILE):
+    """Effects and button switchers together, for boot and background launchers"""
+    entries = effects(path)
+    entries.update(switchers(path))
+    return entries
+
+
+def categories(path=REGISTRY_FILE):
+    """{category: [effect, ...]} in menu order"""
+    grouped = {}
+    for entry in load(path)['effects']:
+        grouped.setdefault(entry['category'], []).append(entry)
+    return grouped
+
+
+def find(name, path=REGISTRY_FILE):
+    """Effect or switcher by key, alias, file name or menu number; None if unknown"""
+    name = str(name).strip().lower()
+    if name.endswith('.py'):
+        name = name[:-3]
+    registry = load(path)
+    for entry in registry['effects'] + registry['switchers']:
+        if name in (entry['key'], str(entry['number'])) or name in entry.get('aliases', ()):
+            return entry
+    return None
+
+
+def button_set(path=REGISTRY_FILE):
+    """The curated effects the button switchers cycle through, in order"""
+    registry = load(path)
+    keyed = {entry['key']: entry for entry in registry['effects']}
+    return [keyed[key] for key in registry['buttons']]
+
+
+def effect_class(effect):
+    """Import an effect's module and return its class (first use only pays the import)"""
+    if isinstance(effect, str):
+        effect = find(effect)
+    if effect is None or 'class' not in effect:
+        raise KeyError(f"No effect class registered for {effect!r}")
+    return getattr(importlib.import_module(effect['module']), effect['class'])
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == 'show':
+        entry = find(sys.argv[2])
+        if entry is None:
+            print(f"❌ Unknown effect: {sys.argv[2]}")
+            return
+        for field in ('number', 'key', 'name', 'category', 'stability', 'fps', 'cost', 'file'):
+            if field in entry:
+                print(f"   {field:<10} {entry[field]}")
+        print(f"   {'status':<10} {'✅ Available' if entry['available'] else '❌ File missing'}")
+    elif len(sys.argv) <= 2 and sys.argv[1:] in ([], ['list']):
+        for category, entries in categories().items():
+            print(f"📁 {category.upper()}:")
+            for entry in entries:
+                print(f"   {entry['number']:2d}) {entry['key']:<22} {entry['fps']:3d} FPS  {entry['cost']}")
+            print()
+    else:
+        print("Usage: python3 effect_registry.py [list | show <name>]")
+
+
+if __name__ == "__main__":
+    main()
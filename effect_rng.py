@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Effect RNG - Seeded random streams for effects
+Each effect draws from its own numpy Generator instead of the global
+random module, so a fixed seed (--seed N on the command line, or M5_SEED
+from the manager) replays the same frames. Scalar draws are served from
+pre-drawn blocks; spawn paths ask for whole arrays at once.
+"""
+
+import os
+import sys
+import numpy as np
+
+SEED_ENV = 'M5_SEED'
+
+# Uniform floats drawn per refill for scalar calls
+BLOCK_SIZE = 4096
+
+
+def seed_from_args(argv=None):
+    """Seed from --seed N (or --seed=N), else M5_SEED, else None for a fresh seed"""
+    argv = sys.argv[1:] if argv is None else argv
+    for i, arg in enumerate(argv):
+        if arg == '--seed' and i + 1 < len(argv):
+            return int(argv[i + 1])
+        if arg.startswith('--seed='):
+            return int(arg.split('=', 1)[1])
+
+    seed = os.environ.get(SEED_ENV, '')
+    return int(seed) if seed else None
+
+
+def make_rng(seed=None):
+    """numpy Generator for an effect, seeded from the CLI or environment by default"""
+    return np.random.default_rng(seed_from_args() if seed is None else seed)
+
+
+class EffectRandom:
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else make_rng()
+        # One pre-drawn block of uniform floats, as an array for batches and a list for scalars
+        self.block = np.empty(0)
+        self.floats = []
+        self.next = 0
+
+    def refill(self):
+        """Draw the next block of uniform floats"""
+        self.block = self.rng.random(BLOCK_SIZE)
+        self.floats = self.block.tolist()
+        self.next = 0
+
+    def take(self, size):
+        """Array of size uniform floats in [0, 1) from the block"""
+        if size > BLOCK_SIZE:
+            return self.rng.random(size)
+        if self.next + size > BLOCK_SIZE or not self.floats:
+            self.refill()
+        self.next += size
+        return self.block[self.next - size:self.next]
+
+    def random(self, size=None):
+        """Uniform float in [0, 1), or an array of them"""
+        if size is not None:
+            return self.take(size)
+        if self.next >= len(self.floats):
+            self.refill()
+        self.next += 1
+        return self.floats[self.next - 1]
+
+    def uniform(self, low, high, size=None):
+        """Uniform float between low and high"""
+        if size is not None:
+            return low + (high - low) * self.take(size)
+        # Scalar paths read the block inline - they run thousands of times a frame
+        if self.next >= len(self.floats):
+            self.refill()
+        self.next += 1
+        return low + (high - low) * self.floats[self.next - 1]
+
+    def randint(self, low, high, size=None):
+        """Integer in [low, high] inclusive, like random.randint"""
+        if size is not None:
+            return low + (self.take(size) * (high - low + 1)).astype(np.int64)
+        if self.next >= len(self.floats):
+            self.refill()
+        self.next += 1
+        return low + int(self.floats[self.next - 1] * (high - low + 1))
+
+    def randrange(self, stop, size=None):
+        """Integer in [0, stop)"""
+        if size is not None:
+            return (self.take(size) * stop).astype(np.int64)
+        return int(self.random() * stop)
+
+    def choice(self, seq, size=None):
+        """Random element of seq, or a list of size elements"""
+        if size is not None:
+            return [seq[i] for i in (self.take(size) * len(seq)).astype(np.intp).tolist()]
+        if self.next >= len(self.floats):
+            self.refill()
+        self.next += 1
+        return seq[int(self.floats[self.next - 1] * len(seq))]
+
+    def shuffle(self, seq):
+        """Shuffle a list in place"""
+        self.rng.shuffle(seq)
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Fractal Kernels - Shared vectorized escape-time code
+Used by the Mandelbrot and Julia effects (and the benchmark suite)
+"""
+
+import decimal
+import numpy as np
+
+# Squared distance below which an orbit counts as having returned to a saved point
+PERIODICITY_EPSILON = 1e-16
+# The check costs about a third of an iteration, so left to itself
+# (periodicity=None) it only starts at a checkpoint from PERIODICITY_MIN_ITER
+# on where at least PERIODICITY_MIN_RUNNING of the pixels have not escaped.
+# A view into a minibrot passes; the Mandelbrot effect's boundary frames,
+# shallow or deep, have mostly escaped by then (benchmark.py effect_periodicity)
+PERIODICITY_MIN_ITER = 128
+PERIODICITY_MIN_RUNNING = 0.5
+
+# Smooth counts are fixed point: iterations * SMOOTH_SCALE + fraction
+SMOOTH_SCALE = 256
+# Fraction for each final |z|^2 between the bailout (4) and 16, where it
+# reaches zero: 1 - log2(log2|z|), precomputed so escaping pixels only pay
+# for a table lookup instead of two logarithms
+SMOOTH_LUT_SIZE = 1024
+SMOOTH_LUT = np.clip(
+    (1.0 - np.log2(0.5 * np.log2(np.linspace(4.0, 16.0, SMOOTH_LUT_SIZE)))) * SMOOTH_SCALE,
+    0, SMOOTH_SCALE - 1).astype(np.int32)
+
+
+def smooth_fraction(magnitude):
+    """Fixed-point fractional iteration for final |z|^2 values, via SMOOTH_LUT"""
+    index = ((magnitude - 4.0) * ((SMOOTH_LUT_SIZE - 1) / 12.0)).astype(np.intp)
+    return SMOOTH_LUT[np.clip(index, 0, SMOOTH_LUT_SIZE - 1)]
+
+
+def interpolate_palette(colors, steps=SMOOTH_SCALE // 16):
+    """Palette with steps entries blended between each pair of colors (wrapping)"""
+    colors = np.asarray(colors, dtype=np.float32)
+    following = np.roll(colors, -1, axis=0)
+    weight = (np.arange(steps, dtype=np.float32) / steps)[np.newaxis, :, np.newaxis]
+    blended = colors[:, np.newaxis] * (1 - weight) + following[:, np.newaxis] * weight
+    return np.rint(blended).astype(np.uint8).reshape(-1, 3)
+
+
+def escape_time(z, c, max_iter, periodicity=False, smooth=False):
+    """Iterations before |z| > 2 for z -> z*z + c (max_iter if it never escapes)
+
+    With smooth=True counts are fixed point (see SMOOTH_SCALE), with the
+    fraction taken from the final |z|^2 of each escaping pixel.
+    periodicity=None starts the periodicity check only where it pays.
+    """
+    # Escaped points leave the working set so later passes only touch
+    # the pixels that are still running
+    z = np.array(z, dtype=np.complex128)
+    shape = z.shape
+    z = z.ravel()
+    c = np.broadcast_to(np.asarray(c, dtype=np.complex128), shape).ravel().copy()
+
+    scale = SMOOTH_SCALE if smooth else 1
+    counts = np.full(z.size, max_iter * scale, dtype=np.int32)
+    index = np.arange(z.size)
+
+    # Brent-style periodicity check: compare against z saved at each power
+    # of two, so an orbit that has settled into a cycle of any length is
+    # caught within twice its length and dropped as never escaping
+    checking = periodicity is True
+    saved = z.copy() if checking else None
+    checkpoint = 1
+
+    for n in range(max_iter):
+        magnitude = z.real * z.real + z.imag * z.imag
+        escaped = magnitude > 4.0
+        if escaped.any():
+            counts[index[escaped]] = n * scale
+            if smooth:
+                counts[index[escaped]] += smooth_fraction(magnitude[escaped])
+            running = ~escaped
+            index, z, c = index[running], z[running], c[running]
+            if checking:
+                saved = saved[running]
+            if not index.size:
+                break
+        z = z * z + c
+
+        if checking:
+            difference = z - saved
+            cycling = (difference.real * difference.real
+                       + difference.imag * difference.imag) < PERIODICITY_EPSILON
+            if cycling.any():
+                running = ~cycling
+                index, z, c, saved = index[running], z[running], c[running], saved[running]
+                if not index.size:
+                    break
+        if n + 1 == checkpoint:
+            checking = checking or starts_checking(periodicity, checkpoint, index.size, counts.size)
+            if checking:
+                saved = z.copy()
+            checkpoint *= 2
+
+    return counts.reshape(shape)
+
+
+def starts_checking(periodicity, checkpoint, running, total):
+    """True if an automatic periodicity check (periodicity=None) starts at this checkpoint"""
+    return (periodicity is None and checkpoint >= PERIODICITY_MIN_ITER
+            and running >= PERIODICITY_MIN_RUNNING * total)
+
+
+def in_main_bulbs(c):
+    """True where c lies inside the main cardioid or the period-2 bulb"""
+    x, y = c.real, c.imag
+    y2 = y * y
+    q = (x - 0.25) ** 2 + y2
+    cardioid = q * (q + (x - 0.25)) <= 0.25 * y2
+    bulb = (x + 1.0) ** 2 + y2 <= 0.0625
+    return cardioid | bulb
+
+
+def mandelbrot_escape(c, max_iter, smooth=False):
+    """Escape time for Mandelbrot points c, skipping the analytically known interior"""
+    c = np.asarray(c, dtype=np.complex128)
+    counts = np.full(c.shape, max_iter * (SMOOTH_SCALE if smooth else 1), dtype=np.int32)
+    outside = ~in_main_bulbs(c)
+    counts[outside] = escape_time(np.zeros(np.count_nonzero(outside)), c[outside], max_iter,
+                                  periodicity=None, smooth=smooth)
+    return counts
+
+
+# One level of 8-sample blocks measured fastest at 64-128 px; each extra
+# level costs another vectorized pass over the borders
+SUBDIVIDE_LEVELS = (8,)
+
+
+def subdivide(sample, shape, levels=SUBDIVIDE_LEVELS):
+    """Mariani-Silver rendering of a grid of iteration counts
+
+    sample(rows, cols) returns the counts at grid positions, which may run
+    up to one block past the bottom/right edge of shape. The grid is tiled
+    into blocks of the first level's size; a block whose border has a
+    single count is filled with it, the rest are tiled again at the next
+    level and finally computed outright. Each level samples all of its
+    borders in one call.
+
+    Like any border-tracing renderer this is approximate: detail thinner
+    than the spacing of border samples can slip between them and be
+    filled over.
+    """
+    height, width = shape
+    size = levels[0]
+    grid_height = max(1, -(-(height - 1) // size)) * size + 1
+    grid_width = max(1, -(-(width - 1) // size)) * size + 1
+    counts = np.full((grid_height, grid_width), -1, dtype=np.int32)
+    y = np.arange(grid_height)[:, np.newaxis]
+    x = np.arange(grid_width)[np.newaxis, :]
+
+    def compute(mask):
+        rows, cols = np.nonzero(mask & (counts < 0))
+        if rows.size:
+            counts[rows, cols] = sample(rows, cols)
+
+    def closure(blocks, size):
+        """Pixels on or inside the given blocks"""
+        cells = np.repeat(np.repeat(blocks, size, axis=0), size, axis=1)
+        cells = np.pad(cells, 1)
+        return cells[:-1, :-1] | cells[:-1, 1:] | cells[1:, :-1] | cells[1:, 1:]
+
+    unresolved = np.ones(((grid_height - 1) // size, (grid_width - 1) // size), dtype=bool)
+    for index, size in enumerate(levels):
+        if index:
+            factor = levels[index - 1] // size
+            unresolved = np.repeat(np.repeat(unresolved, factor, axis=0), factor, axis=1)
+        lattice = (y % size == 0) | (x % size == 0)
+        compute(closure(unresolved, size) & lattice)
+
+        # Smallest and largest count along each block's border
+        blocks_y, blocks_x = unresolved.shape
+        rows = counts[::size, :-1].reshape(blocks_y + 1, blocks_x, size)
+        row_ends = counts[::size, size::size]
+        cols = counts[:-1, ::size].reshape(blocks_y, size, blocks_x + 1)
+        col_ends = counts[size::size, ::size]
+        low_h = np.minimum(rows.min(axis=2), row_ends)
+        high_h = np.maximum(rows.max(axis=2), row_ends)
+        low_v = np.minimum(cols.min(axis=1), col_ends)
+        high_v = np.maximum(cols.max(axis=1), col_ends)
+        low = np.minimum(np.minimum(low_h[:-1], low_h[1:]), np.minimum(low_v[:, :-1], low_v[:, 1:]))
+        high = np.maximum(np.maximum(high_h[:-1], high_h[1:]), np.maximum(high_v[:, :-1], high_v[:, 1:]))
+
+        uniform = unresolved & (low == high)
+        interior = ~lattice[:-1, :-1] & np.repeat(np.repeat(uniform, size, axis=0), size, axis=1)
+        block_value = np.repeat(np.repeat(low, size, axis=0), size, axis=1)
+        counts[:-1, :-1][interior] = block_value[interior]
+        unresolved &= ~uniform
+
+    compute(closure(unresolved, levels[-1]))
+    return counts[:height, :width]
+
+
+def mandelbrot_plane(center_x, center_y, zoom, width, height, xs, ys):
+    """Complex plane coordinates for panel pixels xs, ys of a zoomed view"""
+    aspect = width / height
+    half_width = 2.0 / zoom
+    half_height = half_width / aspect
+
+    real = center_x + (np.asarray(xs, dtype=np.float64) - width / 2) * half_width / (width / 2)
+    imag = center_y + (np.asarray(ys, dtype=np.float64) - height / 2) * half_height / (height / 2)
+    return real[np.newaxis, :] + 1j * imag[:, np.newaxis]
+
+
+def julia_plane(width, height, xs, ys, bounds=(-2.0, 2.0, -2.0, 2.0)):
+    """Complex plane coordinates for panel pixels xs, ys of a Julia view"""
+    x_min, x_max, y_min, y_max = bounds
+    real = x_min + (np.asarray(xs, dtype=np.float64) / width) * (x_max - x_min)
+    imag = y_min + (np.asarray(ys, dtype=np.float64) / height) * (y_max - y_min)
+    return real[np.newaxis, :] + 1j * imag[:, np.newaxis]
+
+
+def mandelbrot_iterations(center_x, center_y, zoom, width, height, max_iter, xs, ys, smooth=False):
+    """Iteration counts for a Mandelbrot view"""
+    c = mandelbrot_plane(center_x, center_y, zoom, width, height, xs, ys)
+    return mandelbrot_escape(c, max_iter, smooth)
+
+
+def julia_iterations(c, width, height, max_iter, xs, ys, smooth=False):
+    """Iteration counts for a Julia view"""
+    z = julia_plane(width, height, xs, ys)
+    return escape_time(z, c, max_iter, smooth=smooth)
+
+
+def _extend(coords, count):
+    """Evenly spaced sample coordinates continued past the last one"""
+    coords = np.asarray(coords)
+    step = coords[1] - coords[0] if len(coords) > 1 else 1
+    return coords[0] + step * np.arange(count)
+
+
+def mandelbrot_subdivided(center_x, center_y, zoom, width, height, max_iter, xs, ys,
+                          smooth=False, levels=SUBDIVIDE_LEVELS):
+    """Approximate iteration counts for a Mandelbrot view, by rectangle subdivision
+
+    Escaping filaments narrower than a pixel can be filled over as inside
+    the set: a sweep of the Mandelbrot effect's zoom paths at 128x128 found
+    49 such pixels in 43 of 8910 frames, so the effect renders per pixel.
+    """
+    pad = levels[0]
+    c = mandelbrot_plane(center_x, center_y, zoom, width, height,
+                         _extend(xs, len(xs) + pad), _extend(ys, len(ys) + pad))
+    return subdivide(lambda rows, cols: mandelbrot_escape(c[rows, cols], max_iter, smooth),
+                     (len(ys), len(xs)), levels)
+
+
+def julia_subdivided(c, width, height, max_iter, xs, ys, smooth=False, levels=SUBDIVIDE_LEVELS):
+    """Approximate iteration counts for a Julia view, by rectangle subdivision (see mandelbrot_subdivided)"""
+    pad = levels[0]
+    z = julia_plane(width, height, _extend(xs, len(xs) + pad), _extend(ys, len(ys) + pad))
+    return subdivide(lambda rows, cols: escape_time(z[rows, cols], c, max_iter, smooth=smooth),
+                     (len(ys), len(xs)), levels)
+
+
+def reference_orbit(center_real, center_imag, max_iter, digits):
+    """Orbit of the view center computed in Decimal, rounded to complex128"""
+    with decimal.localcontext() as context:
+        context.prec = digits
+        c_real = decimal.Decimal(center_real)
+        c_imag = decimal.Decimal(center_imag)
+        z_real = z_imag = decimal.Decimal(0)
+
+        orbit = [0j]
+        for _ in range(max_iter):
+            z_real, z_imag = z_real * z_real - z_imag * z_imag + c_real, 2 * z_real * z_imag + c_imag
+            z = complex(float(z_real), float(z_imag))
+            orbit.append(z)
+            if z.real * z.real + z.imag * z.imag > 4.0:
+                break
+
+    return np.array(orbit, dtype=np.complex128)
+
+
+def series_approximation(orbit, radius, tolerance=1e-6):
+    """Iterations every pixel within radius of the center can skip, with the
+    cubic series coefficients (A, B, C) that give dz there: A dc + B dc^2 + C dc^3"""
+    a, b, c = 0j, 0j, 0j
+    skip = 0
+    for n in range(len(orbit) - 1):
+        z = orbit[n]
+        next_a = 2 * z * a + 1
+        next_b = 2 * z * b + a * a
+        next_c = 2 * z * c + 2 * a * b
+        # Stop while the truncated cubic term is still negligible and
+        # before any pixel in the view could have escaped
+        if abs(next_c) * radius ** 3 > tolerance * abs(next_a) * radius:
+            break
+        if abs(orbit[n + 1]) + (abs(next_a) + (abs(next_b) + abs(next_c) * radius) * radius) * radius > 2.0:
+            break
+        a, b, c = next_a, next_b, next_c
+        skip = n + 1
+    return skip, a, b, c
+
+
+def perturbation_escape(orbit, dc, max_iter, series=(0, 0j, 0j, 0j), smooth=False, periodicity=None):
+    """Escape time for pixels at offsets dc from a reference orbit's center
+
+    periodicity is as for escape_time, counting checkpoints from the series skip.
+    """
+    # Each pixel follows z = orbit[ref] + dz with dz -> (2*Z + dz)*dz + dc,
+    # which stays accurate in float64 long after c itself runs out of digits.
+    # Pixels whose dz outgrows z (glitches) or that reach the end of the
+    # orbit are rebased onto the start of the orbit.
+    dc = np.array(dc, dtype=np.complex128)
+    shape = dc.shape
+    dc = dc.ravel()
+
+    # The series approximation jumps every pixel straight to iteration skip
+    skip, a, b, c = series
+    skip = min(skip, max_iter, len(orbit) - 1)
+    dz = ((c * dc + b) * dc + a) * dc
+    ref = np.full(dc.size, skip, dtype=np.intp)
+    last = len(orbit) - 1
+
+    scale = SMOOTH_SCALE if smooth else 1
+    counts = np.full(dc.size, max_iter * scale, dtype=np.int32)
+    index = np.arange(dc.size)
+
+    # Same Brent check as escape_time, on the full z of each pixel
+    checking = periodicity is True
+    saved = orbit[ref] + dz if checking else None
+    checkpoint = 1
+
+    for n in range(skip, max_iter):
+        z = orbit[ref] + dz
+        magnitude = z.real * z.real + z.imag * z.imag
+        escaped = magnitude > 4.0
+        if escaped.any():
+            counts[index[escaped]] = n * scale
+            if smooth:
+                counts[index[escaped]] += smooth_fraction(magnitude[escaped])
+            running = ~escaped
+            index, dz, dc, ref = index[running], dz[running], dc[running], ref[running]
+            z, magnitude = z[running], magnitude[running]
+            if checking:
+                saved = saved[running]
+            if not index.size:
+                break
+
+        if checking and n > skip:
+            difference = z - saved
+            cycling = (difference.real * difference.real
+                       + difference.imag * difference.imag) < PERIODICITY_EPSILON
+            if cycling.any():
+                running = ~cycling
+                index, dz, dc, ref = index[running], dz[running], dc[running], ref[running]
+                z, magnitude, saved = z[running], magnitude[running], saved[running]
+                if not index.size:
+                    break
+        if n - skip == checkpoint:
+            checking = checking or starts_checking(periodicity, checkpoint, index.size, counts.size)
+            if checking:
+                saved = z.copy()
+            checkpoint *= 2
+
+        glitched = (magnitude < dz.real * dz.real + dz.imag * dz.imag) | (ref == last)
+        if glitched.any():
+            dz[glitched] = z[glitched]
+            ref[glitched] = 0
+
+        dz = (2 * orbit[ref] + dz) * dz + dc
+        ref += 1
+
+    return counts.reshape(shape)
+
+
+def plane_offsets(zoom, width, height, px, py):
+    """Offsets from the view center for panel coordinates px, py (broadcast together)"""
+    aspect = width / height
+    half_width = 2.0 / zoom
+    half_height = half_width / aspect
+
+    dr = (np.asarray(px, dtype=np.float64) - width / 2) * half_width / (width / 2)
+    di = (np.asarray(py, dtype=np.float64) - height / 2) * half_height / (height / 2)
+    return dr + 1j * di
+
+
+def view_radius(zoom, width, height):
+    """Largest distance from the center to a pixel of a zoomed view"""
+    half_width = 2.0 / zoom
+    return float(np.hypot(half_width, half_width * height / width))
+
+
+def perturbation_iterations(orbit, series, zoom, width, height, max_iter, xs, ys, smooth=False):
+    """Iteration counts for a deep Mandelbrot view centered on the orbit's c"""
+    dc = plane_offsets(zoom, width, height, np.asarray(xs)[np.newaxis, :], np.asarray(ys)[:, np.newaxis])
+    return perturbation_escape(orbit, dc, max_iter, series, smooth)
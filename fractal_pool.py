@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Fractal Pool - Multi-core tiled escape-time rendering
+Splits a frame into horizontal bands and hands them to a persistent
+process pool. Workers write iteration counts straight into a shared
+memory buffer, so only the small band descriptions get pickled.
+"""
+
+import os
+import signal
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+import fractal
+
+WORKERS_ENV = 'M5_FRACTAL_WORKERS'
+
+# Per-worker view of the shared iteration buffer
+_worker_buffer = None
+_worker_memory = None
+
+
+def _attach_worker(memory_name, shape):
+    """Pool initializer: map the shared iteration buffer once per worker"""
+    global _worker_buffer, _worker_memory
+    # Ctrl+C is handled by the effect, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    _worker_buffer = np.ndarray(shape, dtype=np.int32, buffer=_worker_memory.buf)
+
+
+def _render_band(kernel, args, options, xs, ys, row_start, row_stop):
+    """Render rows [row_start, row_stop) of the frame into shared memory"""
+    counts = getattr(fractal, kernel)(*args, xs, ys[row_start:row_stop], **options)
+    _worker_buffer[row_start:row_stop, :len(xs)] = counts
+
+
+def worker_count(default):
+    """Workers from M5_FRACTAL_WORKERS (a number, or 'auto' for one per spare core), else default"""
+    value = os.environ.get(WORKERS_ENV, '').strip().lower()
+    if value == 'auto':
+        return max(1, (os.cpu_count() or 2) - 1)
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(f"⚠️ Ignoring {WORKERS_ENV}={value!r}, using {default}")
+        return default
+
+
+class TiledFractalRenderer:
+    def __init__(self, width, height, workers=None, bands_per_worker=4):
+        self.width = width
+        self.height = height
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        # More bands than workers so bands inside the set don't stall the frame
+        self.bands = self.workers * bands_per_worker
+
+        self.memory = shared_memory.SharedMemory(create=True, size=width * height * 4)
+        self.buffer = np.ndarray((height, width), dtype=np.int32, buffer=self.memory.buf)
+        # Spawned (not forked) workers don't inherit the effect's SPI and GPIO handles
+        context = multiprocessing.get_context('spawn')
+        self.pool = context.Pool(self.workers, initializer=_attach_worker,
+                                 initargs=(self.memory.name, (height, width)))
+
+    def render(self, kernel, args, xs, ys, **options):
+        """Iteration counts for fractal.<kernel>(*args, xs, ys, **options), rendered in bands"""
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        edges = np.linspace(0, len(ys), min(self.bands, len(ys)) + 1).astype(int)
+
+        tasks = [(kernel, args, options, xs, ys, start, stop)
+                 for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+        self.pool.starmap(_render_band, tasks)
+
+        return self.buffer[:len(ys), :len(xs)].copy()
+
+    def close(self):
+        """Stop the workers and free the shared buffer"""
+        self.pool.terminate()
+        self.pool.join()
+        del self.buffer
+        self.memory.close()
+        self.memory.unlink()
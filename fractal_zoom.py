@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Fractal Zoom - Incremental rendering for slowly zooming views
+Each zoom step only magnifies the view by a few percent, so most of the
+new frame can be reprojected from the previous iteration buffer. Each
+carried sample remembers how far it sits from where it was really
+computed; it is recomputed once that error gets large near a boundary,
+once it has been carried too long, or when the iteration limit moves.
+A full refresh every so often stops any remaining drift.
+"""
+
+import numpy as np
+
+import fractal
+
+
+class IncrementalZoom:
+    def __init__(self, width, height, refresh_every=60, max_age=16, max_error=0.5,
+                 tolerance=1, max_step=1.1):
+        self.width = width
+        self.height = height
+        self.refresh_every = refresh_every
+        self.max_age = max_age
+        # Positional error (in samples) a carried boundary sample may build up
+        self.max_error = max_error
+        # Neighbouring samples further apart than this count as a boundary
+        self.tolerance = tolerance
+        self.max_step = max_step
+
+        self.iterations = None
+        self.frames = 0
+        self.recomputed = 0.0
+
+    def invalidate(self):
+        """Force a full render on the next frame"""
+        self.iterations = None
+
+    def full_frame(self, key, zoom, limit, xs, ys, iterations):
+        """Adopt a fully rendered frame as the new reprojection source"""
+        self.iterations = iterations
+        self.key, self.zoom, self.limit = key, zoom, limit
+        self.xs, self.ys = xs, ys
+        self.frames = 0
+        self.recomputed = 1.0
+        # Stagger ages so the carried samples expire a few at a time
+        self.age = np.add.outer(np.arange(len(ys)) * 3, np.arange(len(xs))) % self.max_age
+        self.error_x = np.zeros(iterations.shape)
+        self.error_y = np.zeros(iterations.shape)
+        return iterations
+
+    def render(self, key, zoom, limit, xs, ys, render_full, render_points):
+        """Iteration counts for the view, reusing the previous frame when possible
+
+        render_full() renders the whole view; render_points(dc) renders the
+        samples at complex offsets dc from the view center.
+        """
+        step = zoom / self.zoom if self.iterations is not None else 0
+        if (self.iterations is None or key != self.key or self.frames >= self.refresh_every
+                or not 1.0 <= step <= self.max_step
+                or len(xs) != len(self.xs) or len(ys) != len(self.ys)):
+            return self.full_frame(key, zoom, limit, xs, ys, render_full())
+
+        # Nearest previous sample for every new sample under the zoom transform
+        pos_x = self.source_position(xs, self.xs, self.width, step)
+        pos_y = self.source_position(ys, self.ys, self.height, step)
+        src_x = np.clip(np.rint(pos_x).astype(np.intp), 0, len(self.xs) - 1)
+        src_y = np.clip(np.rint(pos_y).astype(np.intp), 0, len(self.ys) - 1)
+        source = (src_y[:, np.newaxis], src_x[np.newaxis, :])
+
+        previous = self.iterations
+        iterations = np.minimum(previous[source], limit)
+        age = self.age[source] + 1
+
+        # Distance from each sample to where its value was computed, in new samples
+        error_x = (self.error_x[source] + (src_x - pos_x)[np.newaxis, :]) * step
+        error_y = (self.error_y[source] + (src_y - pos_y)[:, np.newaxis]) * step
+        drifted = np.hypot(error_x, error_y) > self.max_error
+
+        stale = (self.boundary(previous)[source] & drifted) | (age >= self.max_age)
+        if limit > self.limit:
+            # Samples that were inside under the old limit might escape now
+            stale |= previous[source] == self.limit
+
+        rows, cols = np.nonzero(stale)
+        if rows.size:
+            dc = fractal.plane_offsets(zoom, self.width, self.height, xs[cols], ys[rows])
+            iterations[rows, cols] = render_points(dc)
+            age[rows, cols] = 0
+            error_x[rows, cols] = 0
+            error_y[rows, cols] = 0
+
+        self.iterations, self.age = iterations, age
+        self.error_x, self.error_y = error_x, error_y
+        self.zoom, self.limit = zoom, limit
+        self.frames += 1
+        self.recomputed = rows.size / iterations.size
+        return iterations
+
+    @staticmethod
+    def source_position(coords, previous, size, step):
+        """Fractional index into the previous samples of each coordinate after zooming in"""
+        position = size / 2 + (np.asarray(coords, dtype=np.float64) - size / 2) / step
+        spacing = previous[1] - previous[0] if len(previous) > 1 else 1
+        return (position - previous[0]) / spacing
+
+    def boundary(self, iterations):
+        """Samples whose 3x3 neighbourhood spans more than the tolerance"""
+        padded = np.pad(iterations, 1, mode='edge')
+        height, width = iterations.shape
+        low = high = iterations
+        for dy in range(3):
+            for dx in range(3):
+                window = padded[dy:dy + height, dx:dx + width]
+                low = np.minimum(low, window)
+                high = np.maximum(high, window)
+        return (high - low) > self.tolerance
+
+    def status(self):
+        """Telemetry string for status lines"""
+        return f"recomputed {self.recomputed * 100:.0f}%"
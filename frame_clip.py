@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Frame Clips - Pre-baked animation loops
+Records N seconds of an effect's RGB565 output to a compressed clip file,
+then plays it back from an mmap straight into the LCD's SPI path
+
+Usage:
+    python3 frame_clip.py record <effect> <seconds> [clip]   # Record a loop
+    python3 frame_clip.py play <clip>                         # Play a loop forever
+    python3 frame_clip.py list                                # List recorded clips
+"""
+
+import sys
+import os
+import time
+import mmap
+import struct
+import zlib
+import effect_registry
+
+CLIP_MAGIC = b'M5CLIP01'
+CLIP_HEADER = struct.Struct('<8sHHfI')   # magic, width, height, fps, frame count
+CLIP_INDEX = struct.Struct('<II')        # payload offset, payload length
+
+CLIP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'clips')
+
+# Effects with a next_frame() method, flagged recordable in effects.json
+RECORDABLE = {info['key']: info for info in effect_registry.effects().values() if info.get('recordable')}
+
+
+class ClipWriter:
+    def __init__(self, path, width, height, fps):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frame_bytes = width * height * 2
+
+        self.payloads = []   # Unique frame payloads in file order
+        self.index = []      # Payload number for every frame
+        self.seen = {}       # Payload -> payload number, dedupes repeated frames
+
+    def add_frame(self, data):
+        """Append one packed RGB565 frame"""
+        data = bytes(data)
+        if len(data) != self.frame_bytes:
+            raise ValueError(f"Frame must be {self.frame_bytes} bytes, got {len(data)}")
+
+        # Only keep the compressed form when it actually saves space, so
+        # incompressible frames can be streamed from the mmap without zlib
+        packed = zlib.compress(data, 6)
+        payload = packed if len(packed) < len(data) else data
+
+        if payload not in self.seen:
+            self.seen[payload] = len(self.payloads)
+            self.payloads.append(payload)
+        self.index.append(self.seen[payload])
+
+    def close(self):
+        """Write header, frame index and payloads to disk"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        offset = CLIP_HEADER.size + CLIP_INDEX.size * len(self.index)
+        payload_offsets = []
+        for payload in self.payloads:
+            payload_offsets.append(offset)
+            offset += len(payload)
+
+        with open(self.path, 'wb') as f:
+            f.write(CLIP_HEADER.pack(CLIP_MAGIC, self.width, self.height,
+                                     self.fps, len(self.index)))
+            for payload_num in self.index:
+                f.write(CLIP_INDEX.pack(payload_offsets[payload_num],
+                                        len(self.payloads[payload_num])))
+            for payload in self.payloads:
+                f.write(payload)
+
+        return offset
+
+
+class ClipPlayer:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        magic, self.width, self.height, self.fps, self.frame_count = \
+            CLIP_HEADER.unpack_from(self.map, 0)
+        if magic != CLIP_MAGIC:
+            self.close()
+            raise ValueError(f"Not a frame clip: {path}")
+
+        self.frame_bytes = self.width * self.height * 2
+        self.index = [CLIP_INDEX.unpack_from(self.map, CLIP_HEADER.size + i * CLIP_INDEX.size)
+                      for i in range(self.frame_count)]
+
+    def frame(self, number):
+        """Packed RGB565 bytes for a frame (a zero-copy view when stored raw)"""
+        offset, length = self.index[number % self.frame_count]
+        payload = self.view[offset:offset + length]
+        if length == self.frame_bytes:
+            return payload
+        return zlib.decompress(payload)
+
+    def close(self):
+        """Release the mapping and the file"""
+        try:
+            self.view.release()
+            self.map.close()
+        except BufferError:
+            pass  # A frame view is still in use - the GC will finish the job
+        self.file.close()
+
+
+def default_clip_path(effect_name):
+    """Where a recorded loop for an effect lives"""
+    return os.path.join(CLIP_DIR, f"{effect_name}.clip")
+
+
+def record_effect(effect_name, seconds, path=None):
+    """Run an effect for N seconds and record its frames to a clip"""
+    if effect_name not in RECORDABLE:
+        print(f"❌ Effect '{effect_name}' can't be recorded")
+        print(f"   Recordable: {', '.join(RECORDABLE)}")
+        return False
+
+    import LCD_1in44
+
+    fps = RECORDABLE[effect_name]['fps']
+    path = path or default_clip_path(effect_name)
+    total_frames = int(seconds * fps)
+
+    effect = effect_registry.effect_class(RECORDABLE[effect_name])()
+    writer = ClipWriter(path, effect.width, effect.height, fps)
+
+    print(f"🔴 Recording {total_frames} frames ({seconds}s at {fps} FPS) to {path}")
+    start_time = time.time()
+
+    try:
+        for frame in range(total_frames):
+            data = LCD_1in44.image_to_rgb565(effect.next_frame()).tobytes()
+            writer.add_frame(data)
+            effect.LCD.LCD_ShowRGB565(data)  # Preview while recording
+
+            if (frame + 1) % 50 == 0:
+                elapsed = time.time() - start_time
+                print(f"🔴 {elapsed:.1f}s: {frame + 1}/{total_frames} frames")
+    except KeyboardInterrupt:
+        print(f"\n⚠️ Recording stopped early at {len(writer.index)} frames")
+
+    if not writer.index:
+        print("❌ No frames recorded")
+        return False
+
+    size = writer.close()
+    raw_size = len(writer.index) * writer.frame_bytes
+    print(f"✅ Saved {len(writer.index)} frames ({len(writer.payloads)} unique)")
+    print(f"   {size / 1024:.0f} KB on disk, {raw_size / 1024:.0f} KB raw")
+    effect.cleanup()
+    return True
+
+
+def play_clip(path):
+    """Loop a recorded clip on the LCD forever"""
+    import LCD_1in44
+
+    player = ClipPlayer(path)
+
+    LCD = LCD_1in44.LCD()
+    LCD.LCD_Init(LCD_1in44.U2D_L2R)
+    if (player.width, player.height) != (LCD.width, LCD.height):
+        print(f"❌ Clip is {player.width}x{player.height}, LCD is {LCD.width}x{LCD.height}")
+        player.close()
+        return False
+
+    print(f"▶️ Playing {os.path.basename(path)}: {player.frame_count} frames at {player.fps:.0f} FPS")
+    print("   Press Ctrl+C to stop")
+
+    frame_time = 1.0 / player.fps
+    next_frame = time.perf_counter()
+    frame = 0
+
+    try:
+        while True:
+            LCD.LCD_ShowRGB565(player.frame(frame))
+            frame += 1
+
+            if frame % (player.frame_count * 10) == 0:
+                print(f"▶️ {frame // player.frame_count} loops played")
+
+            # Sleep until the frame's deadline instead of a fixed delay
+            next_frame += frame_time
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.perf_counter()
+
+    except KeyboardInterrupt:
+        print("\n▶️ Playback stopped")
+        LCD.LCD_Clear()
+    finally:
+        player.close()
+
+    return True
+
+
+def list_clips():
+    """List recorded clips"""
+    print("\n🎞️ RECORDED LOOPS:")
+    print("-" * 50)
+
+    clips = sorted(f for f in os.listdir(CLIP_DIR) if f.endswith('.clip')) \
+        if os.path.isdir(CLIP_DIR) else []
+
+    if not clips:
+        print("⚫ No clips recorded yet")
+        return []
+
+    for name in clips:
+        path = os.path.join(CLIP_DIR, name)
+        try:
+            player = ClipPlayer(path)
+            duration = player.frame_count / player.fps
+            print(f"   {name:<22} {player.frame_count:4d} frames, {duration:5.1f}s, "
+                  f"{os.path.getsize(path) / 1024:.0f} KB")
+            player.close()
+        except (ValueError, struct.error) as e:
+            print(f"   {name:<22} ❌ unreadable: {e}")
+
+    return clips
+
+
+def main():
+    if len(sys.argv) >= 4 and sys.argv[1] == 'record':
+        try:
+            seconds = float(sys.argv[3])
+        except ValueError:
+            print("❌ Seconds must be a number")
+            return
+        record_effect(sys.argv[2], seconds, sys.argv[4] if len(sys.argv) > 4 else None)
+    elif len(sys.argv) == 3 and sys.argv[1] == 'play':
+        path = sys.argv[2]
+        if not os.path.exists(path):
+            path = default_clip_path(path)
+        if not os.path.exists(path):
+            print(f"❌ Clip not found: {sys.argv[2]}")
+            return
+        play_clip(path)
+    elif len(sys.argv) == 2 and sys.argv[1] == 'list':
+        list_clips()
+    else:
+        print("🎞️ Frame Clips - record and play pre-baked loops")
+        print("Usage:")
+        print("  python3 frame_clip.py record <effect> <seconds> [clip]")
+        print("  python3 frame_clip.py play <clip>")
+        print("  python3 frame_clip.py list")
+        print()
+        print(f"Recordable effects: {', '.join(RECORDABLE)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Frame Pacer - Frame timing that backs off when the Pi is throttled
+Sleeps out each frame's remaining budget instead of a fixed interval, and
+every few seconds reads CPU temperature, CPU pressure (PSI) and the
+service cgroup's CPUQuota throttling. When any of them shows throttling
+the target FPS eases down, and eases back up once it clears. Given the
+LCD, it also drops to a slow tick once the effect has been drawing the
+same frame for a while (the driver skips those frames anyway).
+
+Files are read under M5_SYSFS_ROOT (default /), so a fake tree of
+sys/class/thermal, proc/pressure/cpu and sys/fs/cgroup stands in for the
+real one off the Pi. M5_PACING=off keeps the full target FPS.
+
+Usage:
+    python3 frame_pacer.py          # Show what the pacer reads right now
+"""
+
+import os
+import time
+
+SYSFS_ROOT = os.environ.get('M5_SYSFS_ROOT', '/')
+
+# Where each signal starts to count and where it means full back-off
+THERMAL_RANGE = (70.0, 82.0)     # °C; Pi firmware soft-throttles at 80
+PRESSURE_RANGE = (10.0, 50.0)    # % of the last 10 s some task waited for a CPU
+THROTTLE_RANGE = (0.05, 0.5)     # Share of CPUQuota periods that ran out of quota
+
+SAMPLE_INTERVAL = 2.0
+MIN_SCALE = 0.25                 # Never drop below a quarter of the target FPS
+SMOOTHING = 0.3                  # Fraction of the way to the new scale per sample
+
+IDLE_AFTER = 10.0                # Seconds of unchanged frames before ticking slowly
+IDLE_FPS = 1.0
+
+
+def ramp(value, low, high):
+    """0 below low, 1 above high, linear in between"""
+    if value is None or value <= low:
+        return 0.0
+    return min(1.0, (value - low) / (high - low))
+
+
+class SystemLoad:
+    def __init__(self, root=None):
+        self.root = root or SYSFS_ROOT
+        self.last_cpu_stat = None
+
+    def path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def read(self, *parts):
+        """File contents under the root, or None if it isn't there"""
+        try:
+            with open(self.path(*parts)) as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def temperature(self):
+        """Hottest thermal zone in °C, or None without thermal zones"""
+        zones = self.path('sys', 'class', 'thermal')
+        try:
+            names = [name for name in os.listdir(zones) if name.startswith('thermal_zone')]
+        except OSError:
+            return None
+        readings = []
+        for name in names:
+            text = self.read('sys', 'class', 'thermal', name, 'temp')
+            try:
+                readings.append(int(text) / 1000.0)
+            except (TypeError, ValueError):
+                continue
+        return max(readings) if readings else None
+
+    def cpu_pressure(self):
+        """PSI 'some avg10' for the CPU in percent, or None without PSI"""
+        text = self.read('proc', 'pressure', 'cpu')
+        if not text:
+            return None
+        for line in text.splitlines():
+            if line.startswith('some'):
+                fields = dict(field.split('=', 1) for field in line.split()[1:])
+                try:
+                    return float(fields['avg10'])
+                except (KeyError, ValueError):
+                    return None
+        return None
+
+    def cpu_stat(self):
+        """(periods, throttled periods) for this process's cgroup, or None"""
+        text = self.read('proc', 'self', 'cgroup') or ''
+        for line in text.splitlines():
+            if line.count(':') < 2:
+                continue
+            _, controllers, group = line.split(':', 2)
+            if controllers == '':
+                stat = self.read('sys', 'fs', 'cgroup', group.lstrip('/'), 'cpu.stat')       # cgroup v2
+            elif 'cpu' in controllers.split(','):
+                stat = self.read('sys', 'fs', 'cgroup', controllers, group.lstrip('/'), 'cpu.stat')  # v1
+            else:
+                continue
+            if stat:
+                values = dict(entry.split() for entry in stat.splitlines() if len(entry.split()) == 2)
+                try:
+                    return int(values['nr_periods']), int(values['nr_throttled'])
+                except (KeyError, ValueError):
+                    return None
+        return None
+
+    def quota_throttling(self):
+        """Share of quota periods throttled since the last call, or None"""
+        current = self.cpu_stat()
+        previous, self.last_cpu_stat = self.last_cpu_stat, current
+        if current is None or previous is None:
+            return None
+        periods = current[0] - previous[0]
+        return (current[1] - previous[1]) / periods if periods > 0 else 0.0
+
+    def sample(self):
+        """{signal: reading} for everything available"""
+        return {
+            'temperature': self.temperature(),
+            'pressure': self.cpu_pressure(),
+            'throttling': self.quota_throttling(),
+        }
+
+    def back_off(self, sample):
+        """How hard to back off, 0 (not at all) to 1 (fully), from the worst signal"""
+        return max(ramp(sample['temperature'], *THERMAL_RANGE),
+                   ramp(sample['pressure'], *PRESSURE_RANGE),
+                   ramp(sample['throttling'], *THROTTLE_RANGE))
+
+
+class FramePacer:
+    def __init__(self, target_fps, load=None, interval=SAMPLE_INTERVAL, min_scale=MIN_SCALE,
+                 smoothing=SMOOTHING, enabled=None, lcd=None, idle_after=IDLE_AFTER, idle_fps=IDLE_FPS):
+        self.target_fps = target_fps
+        self.load = load or SystemLoad()
+        self.interval = interval
+        self.min_scale = min_scale
+        self.smoothing = smoothing
+        self.enabled = os.environ.get('M5_PACING', 'on') != 'off' if enabled is None else enabled
+
+        self.lcd = lcd                # Anything counting static_frames: the driver or a daemon client
+        self.idle_after = idle_after
+        self.idle_fps = idle_fps
+
+        self.scale = 1.0              # Fraction of the target FPS currently allowed
+        self.last_sample = {}
+        self.next_sample = 0.0
+        self.last_change = time.monotonic()
+        self.idling = False
+
+    @property
+    def fps(self):
+        return self.target_fps * self.scale
+
+    def update(self, now=None):
+        """Re-read the system every interval and ease the scale toward it; returns the scale"""
+        now = time.monotonic() if now is None else now
+        if not self.enabled or now < self.next_sample:
+            return self.scale
+        self.next_sample = now + self.interval
+        self.last_sample = self.load.sample()
+        wanted = 1.0 - (1.0 - self.min_scale) * self.load.back_off(self.last_sample)
+        self.scale += (wanted - self.scale) * self.smoothing
+        # Settle exactly rather than creeping toward full speed forever
+        if abs(wanted - self.scale) < 0.01:
+            self.scale = wanted
+        return self.scale
+
+    def idle(self, now=None):
+        """True once the LCD has been sent the same frame for idle_after seconds"""
+        if self.lcd is None:
+            return False
+        now = time.monotonic() if now is None else now
+        if getattr(self.lcd, 'static_frames', 0) == 0:
+            self.last_change = now
+        self.idling = now - self.last_change >= self.idle_after
+        return self.idling
+
+    def frame_done(self, frame_seconds):
+        """Record one frame's work time; returns how long to sleep"""
+        self.update()
+        fps = min(self.fps, self.idle_fps) if self.idle() else self.fps
+        return max(0.0, 1.0 / fps - frame_seconds)
+
+    def status(self):
+        """Telemetry string for status lines"""
+        readings = []
+        if self.last_sample.get('temperature') is not None:
+            readings.append(f"{self.last_sample['temperature']:.0f}°C")
+        if self.last_sample.get('pressure') is not None:
+            readings.append(f"psi {self.last_sample['pressure']:.0f}%")
+        if self.last_sample.get('throttling') is not None:
+            readings.append(f"quota {self.last_sample['throttling'] * 100:.0f}% throttled")
+        if self.idling:
+            readings.append("idle, frame unchanged")
+        return f"pacing {self.fps:.1f}/{self.target_fps} FPS" + (f" ({', '.join(readings)})" if readings else "")
+
+
+def main():
+    pacer = FramePacer(20, interval=0)
+    load = pacer.load
+    print(f"🌡️ Reading {load.root}")
+    print(f"   Temperature:    {load.temperature()}")
+    print(f"   CPU pressure:   {load.cpu_pressure()}")
+    print(f"   cgroup cpu.stat: {load.cpu_stat()}")
+    pacer.update()
+    time.sleep(1.0)
+    for _ in range(10):
+        pacer.update()
+    print(f"   {pacer.status()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Frame Ring - Shared-memory frame transport between processes
+An effect process packs RGB565 frames straight into a triple buffer in
+shared memory; the display process maps the same segment and pushes the
+newest complete frame. Nothing is serialized or copied through a socket.
+One writer and one reader per ring.
+"""
+
+import struct
+import numpy as np
+from multiprocessing import shared_memory
+
+RING_MAGIC = b'M5RING01'
+RING_HEADER = struct.Struct('<8sHHII')   # magic, width, height, slots, frame bytes
+SLOTS = 3
+
+# uint64 counters after the header: newest sequence, its slot, the slot being
+# read, then one sequence per slot (odd while the writer is filling it)
+COUNTERS_OFFSET = 64
+LATEST_SEQ, LATEST_SLOT, READING_SLOT, SLOT_SEQ = 0, 1, 2, 3
+DATA_OFFSET = 128
+
+# Segments created by this process (already tracked for unlinking)
+created = set()
+
+
+def pack_rgb565(rgb, out):
+    """Pack an (h, w, 3) uint8 RGB array into out, an (h, w, 2) big-endian RGB565 array"""
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    # Same bit layout as LCD_1in44.image_to_rgb565
+    np.bitwise_or(red & 0xF8, green >> 5, out=out[..., 0])
+    np.bitwise_or((green << 3) & 0xE0, blue >> 3, out=out[..., 1])
+    return out
+
+
+def open_segment(name):
+    """Attach to an existing segment without adopting it for cleanup at exit"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attach registers with the resource tracker,
+        # which would unlink the writer's segment when this process exits
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=name)
+        if shm.name not in created:
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+class FrameRing:
+    def __init__(self, shm, owner=False):
+        self.shm = shm
+        self.owner = owner
+        magic, self.width, self.height, slots, self.frame_bytes = RING_HEADER.unpack_from(shm.buf)
+        if magic != RING_MAGIC or slots != SLOTS:
+            raise ValueError(f"{shm.name} is not a frame ring")
+
+        self.counters = np.ndarray(SLOT_SEQ + SLOTS, dtype=np.uint64, buffer=shm.buf, offset=COUNTERS_OFFSET)
+        self.slots = np.ndarray((SLOTS, self.height, self.width, 2), dtype=np.uint8,
+                                buffer=shm.buf, offset=DATA_OFFSET)
+        self.frame = np.empty(self.frame_bytes, dtype=np.uint8)  # Reader's copy, ready for SPI
+
+    @classmethod
+    def create(cls, width, height, name=None):
+        """New ring owned (and unlinked on close) by the writer"""
+        frame_bytes = width * height * 2
+        shm = shared_memory.SharedMemory(name=name, create=True, size=DATA_OFFSET + SLOTS * frame_bytes)
+        RING_HEADER.pack_into(shm.buf, 0, RING_MAGIC, width, height, SLOTS, frame_bytes)
+        created.add(shm.name)
+        ring = cls(shm, owner=True)
+        ring.counters[:] = 0
+        ring.counters[READING_SLOT] = SLOTS  # Nothing being read yet
+        return ring
+
+    @classmethod
+    def attach(cls, name):
+        """Map a ring created by another process"""
+        return cls(open_segment(name))
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def sequence(self):
+        """Sequence number of the newest complete frame (0 before the first)"""
+        return int(self.counters[LATEST_SEQ])
+
+    def begin_write(self):
+        """Claim a free slot; returns (slot, (h, w, 2) uint8 view to fill)"""
+        busy = (int(self.counters[LATEST_SLOT]), int(self.counters[READING_SLOT]))
+        slot = next(i for i in range(SLOTS) if i not in busy)
+        self.counters[SLOT_SEQ + slot] = 2 * int(self.counters[LATEST_SEQ]) + 1
+        return slot, self.slots[slot]
+
+    def commit(self, slot):
+        """Publish a filled slot as the newest frame; returns its sequence"""
+        sequence = int(self.counters[LATEST_SEQ]) + 1
+        self.counters[SLOT_SEQ + slot] = 2 * sequence
+        self.counters[LATEST_SLOT] = slot
+        self.counters[LATEST_SEQ] = sequence
+        return sequence
+
+    def write(self, data):
+        """Publish one packed RGB565 frame (bytes-like or array)"""
+        slot, view = self.begin_write()
+        data = data if isinstance(data, np.ndarray) else np.frombuffer(data, dtype=np.uint8)
+        view.reshape(-1)[:] = data.reshape(-1).view(np.uint8)
+        return self.commit(slot)
+
+    def write_rgb(self, rgb):
+        """Pack an RGB array or image straight into the ring"""
+        slot, view = self.begin_write()
+        pack_rgb565(np.asarray(rgb), view)
+        return self.commit(slot)
+
+    def read(self, last_seq=0):
+        """Newest complete frame after last_seq: (sequence, frame) or (last_seq, None)"""
+        for _ in range(4):
+            sequence = int(self.counters[LATEST_SEQ])
+            if sequence == last_seq:
+                return last_seq, None
+            slot = int(self.counters[LATEST_SLOT])
+            self.counters[READING_SLOT] = slot  # The writer now skips this slot
+            if self.counters[SLOT_SEQ + slot] != 2 * sequence:
+                continue  # Superseded while we looked; take the newer one
+            np.copyto(self.frame, self.slots[slot].reshape(-1))
+            # Seqlock check: the slot must not have been refilled during the copy
+            if self.counters[SLOT_SEQ + slot] == 2 * sequence:
+                return sequence, self.frame
+        return last_seq, None
+
+    def close(self):
+        self.counters = self.slots = None
+        self.shm.close()
+        if self.owner:
+            created.discard(self.shm.name)
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
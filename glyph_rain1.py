@@ -6,11 +6,12 @@ Matrix-style falling characters
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class GlyphRain:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🌧️ Initializing Glyph Rain with official Waveshare driver...")
         
         # Initialize LCD using official driver
@@ -24,6 +25,8 @@ class GlyphRain:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Glyph characters for the matrix rain
         self.glyphs = '0123456789ABCDEFabcdef!@#$%^&*()[]{}+-=<>?/\\|_~πΩαβγδλμσφ'
         
@@ -34,7 +37,7 @@ class GlyphRain:
             self.columns.append({
                 'x': x,
                 'chars': [],
-                'spawn_timer': random.randint(0, 50)
+                'spawn_timer': self.random.randint(0, 50)
             })
         
         print(f"🌧️ Created {len(self.columns)} falling columns")
@@ -45,12 +48,12 @@ class GlyphRain:
             # Spawn new character at top
             if col['spawn_timer'] <= 0:
                 col['chars'].append({
-                    'char': random.choice(self.glyphs),
+                    'char': self.random.choice(self.glyphs),
                     'y': -10,
                     'brightness': 255,
-                    'speed': random.uniform(0.8, 2.5)
+                    'speed': self.random.uniform(0.8, 2.5)
                 })
-                col['spawn_timer'] = random.randint(25, 100)
+                col['spawn_timer'] = self.random.randint(25, 100)
             else:
                 col['spawn_timer'] -= 1
             
@@ -112,7 +115,9 @@ class GlyphRain:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(30, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 # Update character positions
                 self.update()
                 
@@ -132,7 +137,7 @@ class GlyphRain:
                     print(f"🌧️ {elapsed:.1f}s: {total_chars} glyphs, {fps:.1f} FPS")
                 
                 # Control frame rate (~30 FPS)
-                time.sleep(0.033)
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))
                 
         except KeyboardInterrupt:
             print(f"\n🛑 Glyph Rain stopped after {frame} frames")
@@ -6,12 +6,13 @@ Matrix-style falling characters with memory leak fixes and resource management
 
 import LCD_1in44
 import time
-import random
 import gc
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class GlyphRainFixed:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🌧️ Initializing Fixed Glyph Rain with official Waveshare driver...")
         
         # Initialize LCD using official driver
@@ -25,6 +26,8 @@ class GlyphRainFixed:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Glyph characters for the matrix rain
         self.glyphs = '0123456789ABCDEFabcdef!@#$%^&*()[]{}+-=<>?/\\|_~πΩαβγδλμσφ'
         
@@ -37,7 +40,7 @@ class GlyphRainFixed:
             self.columns.append({
                 'x': x,
                 'chars': [],
-                'spawn_timer': random.randint(0, 50)
+                'spawn_timer': self.random.randint(0, 50)
             })
         
         # Performance tracking
@@ -56,12 +59,12 @@ class GlyphRainFixed:
             # Spawn new character at top (but limit total characters)
             if col['spawn_timer'] <= 0 and len(col['chars']) < self.max_chars_per_column:
                 col['chars'].append({
-                    'char': random.choice(self.glyphs),
+                    'char': self.random.choice(self.glyphs),
                     'y': -10,
                     'brightness': 255,
-                    'speed': random.uniform(0.8, 2.5)
+                    'speed': self.random.uniform(0.8, 2.5)
                 })
-                col['spawn_timer'] = random.randint(25, 100)
+                col['spawn_timer'] = self.random.randint(25, 100)
             else:
                 col['spawn_timer'] -= 1
             
@@ -157,7 +160,9 @@ class GlyphRainFixed:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(30, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 # Update character positions
                 self.update()
                 
@@ -179,7 +184,7 @@ class GlyphRainFixed:
                     print(f"🌧️ {elapsed:.1f}s: {total_chars} glyphs (max {max_chars}/col), {fps:.1f} FPS")
                 
                 # Control frame rate (~30 FPS)
-                time.sleep(0.033)
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))
                 
         except KeyboardInterrupt:
             print(f"\n🛑 Glyph Rain stopped after {self.frame_count} frames ({(self.frame_count * 0.033 / 60):.1f} minutes)")
@@ -6,11 +6,12 @@ Matrix-style falling characters in blue colors
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class GlyphRain2:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🌧️ Initializing Blue Matrix Glyph Rain...")
         
         # Initialize LCD
@@ -24,6 +25,8 @@ class GlyphRain2:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Binary and hex characters for a more digital feel
         self.glyphs = '01ABCDEF0123456789{}[]()<>+-*/=?!@#$%^&|\\~_'
         
@@ -34,7 +37,7 @@ class GlyphRain2:
             self.columns.append({
                 'x': x,
                 'chars': [],
-                'spawn_timer': random.randint(0, 40)
+                'spawn_timer': self.random.randint(0, 40)
             })
         
         print(f"🔵 Created {len(self.columns)} blue matrix columns")
@@ -45,12 +48,12 @@ class GlyphRain2:
             # Spawn new character
             if col['spawn_timer'] <= 0:
                 col['chars'].append({
-                    'char': random.choice(self.glyphs),
+                    'char': self.random.choice(self.glyphs),
                     'y': -10,
                     'brightness': 255,
-                    'speed': random.uniform(1.0, 3.0)  # Faster than original
+                    'speed': self.random.uniform(1.0, 3.0)  # Faster than original
                 })
-                col['spawn_timer'] = random.randint(15, 70)
+                col['spawn_timer'] = self.random.randint(15, 70)
             else:
                 col['spawn_timer'] -= 1
             
@@ -108,7 +111,9 @@ class GlyphRain2:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(40, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -121,7 +126,7 @@ class GlyphRain2:
                     total_chars = sum(len(col['chars']) for col in self.columns)
                     print(f"🔵 {elapsed:.1f}s: {total_chars} glyphs, {fps:.1f} FPS")
                 
-                time.sleep(0.025)  # Slightly faster (~40 FPS)
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # Slightly faster (~40 FPS)
                 
         except KeyboardInterrupt:
             print(f"\n🛑 Blue Matrix stopped after {frame} frames")
@@ -6,12 +6,13 @@ Matrix-style falling characters with rainbow colors
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
 import math
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class GlyphRain3:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🌈 Initializing Rainbow Matrix Glyph Rain...")
         
         # Initialize LCD
@@ -25,6 +26,8 @@ class GlyphRain3:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Unicode and special characters for variety
         self.glyphs = '0123456789ABCDEFabcdef!@#$%^&*()[]{}+-=<>?/\\|_~♦♣♠♥★☆○●△▲'
         
@@ -35,8 +38,8 @@ class GlyphRain3:
             self.columns.append({
                 'x': x,
                 'chars': [],
-                'spawn_timer': random.randint(0, 60),
-                'color_offset': random.randint(0, 360)  # For rainbow effect
+                'spawn_timer': self.random.randint(0, 60),
+                'color_offset': self.random.randint(0, 360)  # For rainbow effect
             })
         
         self.time_offset = 0
@@ -72,13 +75,13 @@ class GlyphRain3:
             # Spawn new character
             if col['spawn_timer'] <= 0:
                 col['chars'].append({
-                    'char': random.choice(self.glyphs),
+                    'char': self.random.choice(self.glyphs),
                     'y': -10,
                     'brightness': 255,
-                    'speed': random.uniform(0.5, 2.0),
+                    'speed': self.random.uniform(0.5, 2.0),
                     'hue': (col['color_offset'] + self.time_offset * 2) % 360
                 })
-                col['spawn_timer'] = random.randint(30, 90)
+                col['spawn_timer'] = self.random.randint(30, 90)
             else:
                 col['spawn_timer'] -= 1
             
@@ -135,7 +138,9 @@ class GlyphRain3:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(25, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -148,7 +153,7 @@ class GlyphRain3:
                     total_chars = sum(len(col['chars']) for col in self.columns)
                     print(f"🌈 {elapsed:.1f}s: {total_chars} glyphs, {fps:.1f} FPS")
                 
-                time.sleep(0.04)  # 25 FPS for smooth color transitions
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 25 FPS for smooth color transitions
                 
         except KeyboardInterrupt:
             print(f"\n🛑 Rainbow Matrix stopped after {frame} frames")
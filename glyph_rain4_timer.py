@@ -7,12 +7,13 @@ The longer it runs, the more the screen fills up like a visual timer
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
 import math
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class GlyphRainTimer:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("⏳ Initializing Accumulating Timer Glyph Rain...")
         
         # Initialize LCD
@@ -26,6 +27,8 @@ class GlyphRainTimer:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Tiny symbols and characters
         self.glyphs = '·•▪▫○●◦◯△▲▽▼◇◆□■☆★♦♣♠♥※◊⋄⌘⊙⊗⊘⊚⊛'
         self.letters = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
@@ -80,15 +83,15 @@ class GlyphRainTimer:
         
         # Spawn new falling characters (more as time goes on)
         spawn_chance = self.spawn_rate + (elapsed_hours * 0.1)  # Increase over time
-        if random.random() < spawn_chance:
-            char_set = self.glyphs if random.random() < 0.7 else self.letters
+        if self.random.random() < spawn_chance:
+            char_set = self.glyphs if self.random.random() < 0.7 else self.letters
             self.falling_chars.append({
-                'char': random.choice(char_set),
-                'x': random.randint(0, self.width - 6),
-                'y': random.randint(-20, -5),
-                'speed': random.uniform(0.2, 1.5),  # Various speeds
-                'color': self.get_time_color(elapsed_hours + random.uniform(-1, 1)),
-                'size': random.choice(['tiny', 'small', 'normal'])
+                'char': self.random.choice(char_set),
+                'x': self.random.randint(0, self.width - 6),
+                'y': self.random.randint(-20, -5),
+                'speed': self.random.uniform(0.2, 1.5),  # Various speeds
+                'color': self.get_time_color(elapsed_hours + self.random.uniform(-1, 1)),
+                'size': self.random.choice(['tiny', 'small', 'normal'])
             })
         
         # Update falling characters
@@ -179,7 +182,9 @@ class GlyphRainTimer:
         frame = 0
         
         try:
+            pacer = FramePacer(6, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -196,7 +201,7 @@ class GlyphRainTimer:
                     print(f"⏳ {elapsed_hours:.2f}h: {total_accumulated} accumulated, "
                           f"{falling_count} falling, height: {self.accumulation_height}")
                 
-                time.sleep(0.167)  # ~6 FPS for gradual effect
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # ~6 FPS for gradual effect
                 
         except KeyboardInterrupt:
             elapsed_time = time.time() - self.start_time
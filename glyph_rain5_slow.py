@@ -7,11 +7,12 @@ Perfect for all-day visual timer
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class SlowAccumulator:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🕰️ Initializing Slow Accumulator...")
         
         # Initialize LCD
@@ -25,6 +26,8 @@ class SlowAccumulator:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Very tiny characters and dots
         self.glyphs = ['·', '•', '▪', '▫', '○', '●', '◦', '◯', '⋅', '∘', '∙', '∴', '∵']
         self.rare_chars = ['☆', '★', '◇', '◆', '△', '▲', '♦']
@@ -74,18 +77,18 @@ class SlowAccumulator:
         # Very low spawn rate - only occasionally
         spawn_chance = 0.05 + (elapsed_hours * 0.01)  # Starts at 5%, slowly increases
         
-        if random.random() < spawn_chance:
+        if self.random.random() < spawn_chance:
             # Occasionally spawn a rare character
-            if random.random() < 0.1:
-                char = random.choice(self.rare_chars)
+            if self.random.random() < 0.1:
+                char = self.random.choice(self.rare_chars)
             else:
-                char = random.choice(self.glyphs)
+                char = self.random.choice(self.glyphs)
             
             self.falling.append({
                 'char': char,
-                'x': random.randint(0, self.width - 4),
-                'y': random.randint(-30, -5),
-                'speed': random.uniform(0.1, 0.8),  # Very slow
+                'x': self.random.randint(0, self.width - 4),
+                'y': self.random.randint(-30, -5),
+                'speed': self.random.uniform(0.1, 0.8),  # Very slow
                 'color': self.get_subtle_color(elapsed_hours),
                 'birth_time': elapsed_time
             })
@@ -142,7 +145,7 @@ class SlowAccumulator:
             )
             
             # Add subtle brightness variation
-            brightness_var = 0.8 + 0.4 * random.random()
+            brightness_var = 0.8 + 0.4 * self.random.random()
             final_color = (
                 int(aged_color[0] * brightness_var),
                 int(aged_color[1] * brightness_var),
@@ -174,7 +177,9 @@ class SlowAccumulator:
         print("   Press Ctrl+C to stop")
         
         try:
+            pacer = FramePacer(1, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -194,7 +199,7 @@ class SlowAccumulator:
                     print(f"🕰️ {elapsed_hours:.1f}h: {settled_count} settled, "
                           f"{falling_count} falling, height: {max_height}")
                 
-                time.sleep(1.0)  # 1 FPS for very slow effect
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 1 FPS for very slow effect
                 
         except KeyboardInterrupt:
             elapsed_time = time.time() - self.start_time
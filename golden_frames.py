@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Golden Frames - Regression check for effect renderers
+Runs each effect headless with a fixed seed, captures frames at fixed
+indices and compares them to stored golden PNGs by PSNR and max channel
+delta, with ms/frame against the timing recorded alongside the goldens.
+
+Effects meant to render exactly as before the performance work have
+their goldens captured from that code (a checkout of BASELINE), with the
+random module swapped for the same seeded stream the effects draw from
+now, and must match them pixel for pixel. CHANGED lists the effects whose
+output changed on purpose; their goldens come from the current code and
+only have to stay within MIN_PSNR.
+
+Usage:
+    python3 golden_frames.py check [effect...]            # Compare against the goldens
+    python3 golden_frames.py update [effect...]           # Re-capture the goldens
+    python3 golden_frames.py baseline TREE [effect...]    # Capture from a BASELINE checkout
+    python3 golden_frames.py list                         # List covered effects
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import random
+import inspect
+import importlib
+import contextlib
+import subprocess
+import numpy as np
+from PIL import Image
+
+import headless
+import effect_registry
+from effect_rng import EffectRandom
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+TIMINGS_FILE = os.path.join(GOLDEN_DIR, 'timings.json')
+
+SEED = 1234
+FRAMES = (1, 20, 60)
+# Effects that only reach part of their rendering path later on
+EFFECT_FRAMES = {
+    # Zoom passes DEEP_ZOOM (50x at 1.02 per frame) at frame 198: 240 is a perturbation frame
+    'mandelbrot': (1, 60, 240),
+}
+
+# Frames below this PSNR (dB) fail; identical frames score infinity
+MIN_PSNR = 40.0
+
+# Commit the unchanged effects' goldens are captured from
+BASELINE = '38c26ad'
+
+# Effects whose frames differ from BASELINE on purpose, and why
+CHANGED = {
+    'bouncing_balls': 'trails fade in the float phosphor buffer',
+    'retro_geometry': 'afterglow fades in the float phosphor buffer',
+    'sierpinski': 'old points fade in the phosphor buffer instead of by age',
+    'heavy_rain': 'random values are drawn in batches, in a different order',
+    'micro_dots': 'random values are drawn in batches, in a different order',
+    'micro_dots_dripping': 'random values are drawn in batches, in a different order',
+    'plasma_field': 'renders at 64x64 with bilinear upscaling by default',
+    'mandelbrot': 'smooth coloring, and perturbation deep zoom past 50x with new targets',
+    'julia_set': 'smooth coloring',
+}
+
+# Per-frame calls in BASELINE where effects.json names a method added since
+BASELINE_STEPS = {
+    'kaleidoscope': ('update', 'draw_frame'),
+}
+
+# Effects: module, class, per-frame method calls (the last returns the image),
+# for every effect effects.json gives frame steps
+EFFECTS = {info['key']: (info['module'], info['class'], tuple(info['frame']))
+           for info in effect_registry.effects().values() if 'frame' in info}
+
+# Settings that change what an effect renders, pinned while capturing
+PINNED_ENV = ('M5_RENDER_SCALE', 'M5_SEED')
+
+
+def golden_path(effect_name, frame):
+    """Where the golden PNG for one captured frame lives"""
+    return os.path.join(GOLDEN_DIR, f"{effect_name}_{frame:03d}.png")
+
+
+def effect_frames(effect_name):
+    """Frame indices captured for an effect"""
+    return EFFECT_FRAMES.get(effect_name, FRAMES)
+
+
+def import_effect(module_name, tree=None):
+    """Effect module, from another checkout's tree if given (once per process)"""
+    if tree is None:
+        return importlib.import_module(module_name)
+    sys.path.insert(0, os.path.abspath(tree))
+    try:
+        module = importlib.import_module(module_name)
+    finally:
+        sys.path.pop(0)
+    if not os.path.abspath(module.__file__).startswith(os.path.abspath(tree)):
+        raise ImportError(f"{module_name} was already imported from {module.__file__}")
+    return module
+
+
+def render_frames(effect_name, frames=None, seed=SEED, tree=None):
+    """Run an effect headless; return {frame: RGB array} and ms per frame"""
+    headless.install()
+    frames = frames or effect_frames(effect_name)
+    module_name, class_name, steps = EFFECTS[effect_name]
+    for name in PINNED_ENV:
+        os.environ.pop(name, None)
+
+    module = import_effect(module_name, tree)
+    if tree is not None:
+        steps = BASELINE_STEPS.get(effect_name, steps)
+        # Old effects call the random module; give them the stream new ones are seeded with
+        if getattr(module, 'random', None) is random:
+            module.random = EffectRandom(np.random.default_rng(seed))
+    clock = headless.FrameClock()
+    module.time = clock  # Time-based animation follows the frame count
+
+    effect_class = getattr(module, class_name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if 'rng' in inspect.signature(effect_class).parameters:
+            effect = effect_class(np.random.default_rng(seed))
+        else:
+            effect = effect_class()
+    # The Julia atlas is optional, so goldens are always the live render
+    if hasattr(effect, 'atlas'):
+        effect.atlas = None
+
+    methods = [getattr(effect, name) for name in steps]
+    captured = {}
+    start = time.perf_counter()
+    for frame in range(max(frames) + 1):
+        for method in methods:
+            image = method()
+        if frame in frames:
+            captured[frame] = np.asarray(image.convert('RGB'))
+        clock.tick()
+    elapsed = time.perf_counter() - start
+
+    if hasattr(effect, 'renderer') and effect.renderer:
+        effect.renderer.close()
+    return captured, elapsed * 1000 / (max(frames) + 1)
+
+
+def psnr(expected, actual):
+    """Peak signal-to-noise ratio in dB (inf for identical frames)"""
+    mse = np.mean((expected.astype(np.float64) - actual.astype(np.float64)) ** 2)
+    return float('inf') if mse == 0 else 10 * np.log10(255.0 ** 2 / mse)
+
+
+def max_delta(expected, actual):
+    """Largest per-channel difference"""
+    return int(np.abs(expected.astype(np.int16) - actual.astype(np.int16)).max())
+
+
+def load_timings():
+    """ms/frame recorded when the goldens were captured"""
+    try:
+        with open(TIMINGS_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def min_psnr_for(effect_name):
+    """Unchanged effects must match their baseline goldens exactly"""
+    return MIN_PSNR if effect_name in CHANGED else float('inf')
+
+
+def compare(effect_name, min_psnr=None):
+    """Render an effect and compare to its goldens; return (rows, ms, passed)"""
+    if min_psnr is None:
+        min_psnr = min_psnr_for(effect_name)
+    captured, ms = render_frames(effect_name)
+    rows = []
+    passed = True
+    for frame, actual in captured.items():
+        path = golden_path(effect_name, frame)
+        if not os.path.exists(path):
+            rows.append((frame, None, None))
+            passed = False
+            continue
+        expected = np.asarray(Image.open(path).convert('RGB'))
+        score = psnr(expected, actual)
+        rows.append((frame, score, max_delta(expected, actual)))
+        passed = passed and score >= min_psnr
+    return rows, ms, passed
+
+
+def update_goldens(names):
+    """Re-capture golden PNGs (CHANGED effects only) and timings for the named effects"""
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    timings = load_timings()
+    for name in names:
+        captured, ms = render_frames(name)
+        timings[name] = round(ms, 3)
+        if name not in CHANGED:
+            print(f"⏱️  {name:<22} timing only - its goldens come from {BASELINE}; list it in CHANGED first")
+            continue
+        for frame, pixels in captured.items():
+            Image.fromarray(pixels, 'RGB').save(golden_path(name, frame))
+        print(f"📸 {name:<22} {len(captured)} frames, {ms:7.2f} ms/frame")
+
+    with open(TIMINGS_FILE, 'w') as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def capture_baseline(tree, names):
+    """Capture golden PNGs for unchanged effects from a BASELINE checkout
+
+    Each effect runs in its own process, since the old modules share
+    their names with the current ones. Timings are left to 'update'.
+    """
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    for name in names:
+        if name in CHANGED:
+            print(f"⏭️  {name:<22} changed on purpose: {CHANGED[name]}")
+            continue
+        subprocess.run([sys.executable, os.path.abspath(__file__), 'baseline-one', tree, name], check=True)
+
+
+def capture_one_baseline(tree, name):
+    captured, ms = render_frames(name, tree=tree)
+    for frame, pixels in captured.items():
+        Image.fromarray(pixels, 'RGB').save(golden_path(name, frame))
+    print(f"📸 {name:<22} {len(captured)} frames from {tree}")
+
+
+def check_goldens(names):
+    """Print the diff and speedup table; return True when every frame passes"""
+    timings = load_timings()
+    print(f"🔍 GOLDEN FRAMES (seed {SEED}, frames {', '.join(map(str, FRAMES))} unless listed in EFFECT_FRAMES, "
+          f"exact unless CHANGED, then min PSNR {MIN_PSNR:g} dB)")
+    print("-" * 72)
+    all_passed = True
+    for name in names:
+        rows, ms, passed = compare(name)
+        all_passed = all_passed and passed
+
+        diffs = []
+        for frame, score, delta in rows:
+            if score is None:
+                diffs.append(f"#{frame} missing")
+            else:
+                diffs.append(f"#{frame} {'=' if score == float('inf') else f'{score:.1f}dB'}/{delta}")
+        golden_ms = timings.get(name)
+        speedup = f"{golden_ms / ms:5.2f}x" if golden_ms and ms > 0 else "  n/a"
+        print(f"{'✅' if passed else '❌'} {name:<22} {ms:7.2f} ms {speedup}  {'  '.join(diffs)}")
+    return all_passed
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'check'
+    tree = None
+    if command in ('baseline', 'baseline-one'):
+        if len(sys.argv) < 3:
+            print(f"❌ Give a checkout of {BASELINE}: git worktree add /tmp/baseline {BASELINE}")
+            sys.exit(2)
+        tree = sys.argv[2]
+        del sys.argv[2]
+    names = sys.argv[2:] or list(EFFECTS)
+    for name in names:
+        if name not in EFFECTS:
+            print(f"❌ Unknown effect: {name}")
+            print("Use 'list' to see covered effects")
+            sys.exit(2)
+
+    if command == 'list':
+        for name, (module_name, class_name, steps) in EFFECTS.items():
+            changed = f" (changed: {CHANGED[name]})" if name in CHANGED else ""
+            print(f"{name:<22} - {module_name}.{class_name}{changed}")
+    elif command == 'update':
+        update_goldens(names)
+    elif command == 'baseline':
+        capture_baseline(tree, names)
+    elif command == 'baseline-one':
+        capture_one_baseline(tree, names[0])
+    elif command == 'check':
+        sys.exit(0 if check_goldens(names) else 1)
+    else:
+        print("Usage:")
+        print("  python3 golden_frames.py check [effect...]")
+        print("  python3 golden_frames.py update [effect...]")
+        print("  python3 golden_frames.py baseline TREE [effect...]")
+        print("  python3 golden_frames.py list")
+
+
+if __name__ == "__main__":
+    main()
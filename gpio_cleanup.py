@@ -1,96 +1,248 @@
 #!/usr/bin/env python3
 """
 GPIO Cleanup Utility for Waveshare LCD HAT
-Kills all conflicting processes and clears GPIO locks
+Kills all conflicting processes and clears GPIO locks. One /proc scan finds
+every matching process, signals go out directly, active services stop in a
+single systemctl call, and the wait ends as soon as the HAT's GPIO lines
+are actually released instead of after a fixed sleep.
 """
 
-import subprocess
-import time
 import os
+import re
+import sys
+import time
+import fcntl
+import signal
+import struct
+import subprocess
 
-def cleanup_gpio():
-    """Clean up all GPIO-using processes and services"""
-    print("🧹 Starting GPIO cleanup...")
-    
-    # Kill all Python screensaver processes
-    processes_to_kill = [
-        'glyph_rain',
-        'matrix_',
-        'screensaver',
-        'button_',
-        'micro_dots',
-        'flames',
-        'plasma',
-        'bouncing',
-        'kaleidoscope',
-        'raindrops',
-        'neon_rain',
-        'mandelbrot',
-        'julia_set',
-        'sierpinski',
-        'dragon_curve',
-        'campfire',
-        'retro_geometry'
-    ]
-    
-    killed_processes = 0
-    for process in processes_to_kill:
+# Kill all Python screensaver processes
+PROCESS_PATTERNS = [
+    'glyph_rain', 'matrix_', 'screensaver', 'button_', 'micro_dots', 'flames',
+    'plasma', 'bouncing', 'kaleidoscope', 'raindrops', 'neon_rain', 'mandelbrot',
+    'julia_set', 'sierpinski', 'dragon_curve', 'campfire', 'retro_geometry',
+    'frame_clip', 'playlist', 'display_daemon'
+]
+
+# Stop all LCD-related services
+LCD_SERVICES = [
+    'lcd-stable.service', 'lcd-random.service', 'lcd-screensaver.service',
+    'lcd-glyph-locked.service', 'lcd-button-switcher.service'
+]
+
+# BCM lines the HAT claims: LCD reset, data/command, backlight, then the joystick and keys
+HAT_LINES = (27, 25, 24, 6, 19, 5, 26, 13, 21, 20, 16)
+
+# Signalled processes get this long to exit before SIGKILL
+TERM_GRACE = 1.0
+RELEASE_TIMEOUT = 3.0
+POLL_INTERVAL = 0.02
+# Lines still held this long after every stopped process is gone belong to something else
+LINE_SETTLE = 0.25
+
+# GPIO character device uAPI (linux/gpio.h)
+GPIOCHIP_INFO = struct.Struct('32s32sI')
+GPIOCHIP_INFO_IOCTL = 0x8044B401                # _IOR(0xB4, 0x01, gpiochip_info)
+GPIO_V2_LINE_INFO = struct.Struct('32s32sIIQ160x16x')
+GPIO_V2_GET_LINEINFO_IOCTL = 0xC100B405         # _IOWR(0xB4, 0x05, gpio_v2_line_info)
+GPIO_V2_LINE_FLAG_USED = 1
+GPIOLINE_INFO = struct.Struct('II32s32s')
+GPIO_GET_LINEINFO_IOCTL = 0xC048B402            # _IOWR(0xB4, 0x02, gpioline_info), v1 fallback
+GPIOLINE_FLAG_KERNEL = 1
+
+
+def protected_pids():
+    """This process and its ancestors, which must never be signalled"""
+    pids = set()
+    pid = os.getpid()
+    while pid > 1 and pid not in pids:
+        pids.add(pid)
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                pid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            break
+    return pids
+
+
+def find_processes(patterns, proc_root='/proc', exclude=()):
+    """One pass over /proc: {pid: command line} for every process matching any pattern"""
+    matcher = re.compile('|'.join(re.escape(pattern) for pattern in patterns))
+    found = {}
+    for entry in os.listdir(proc_root):
+        if not entry.isdigit() or int(entry) in exclude:
+            continue
         try:
-            result = subprocess.run(['pkill', '-f', process], capture_output=True)
-            if result.returncode == 0:
-                killed_processes += 1
-                print(f"  ❌ Killed process matching: {process}")
-        except:
-            pass
-    
-    # Stop all LCD-related services
-    services_to_stop = [
-        'lcd-stable.service',
-        'lcd-random.service', 
-        'lcd-screensaver.service',
-        'lcd-glyph-locked.service',
-        'lcd-button-switcher.service'
-    ]
-    
-    stopped_services = 0
-    for service in services_to_stop:
+            with open(os.path.join(proc_root, entry, 'cmdline'), 'rb') as f:
+                cmdline = f.read().replace(b'\0', b' ').decode('utf-8', 'replace').strip()
+        except OSError:
+            continue  # Exited mid-scan, or a kernel thread we cannot read
+        if cmdline and matcher.search(cmdline):
+            found[int(entry)] = cmdline
+    return found
+
+
+def process_name(cmdline):
+    """Script name from a command line, for messages"""
+    words = cmdline.split()
+    scripts = [word for word in words if word.endswith('.py')]
+    return os.path.basename(scripts[0] if scripts else words[0])
+
+
+def signal_processes(pids, signum):
+    """Signal each PID directly; returns the ones that could be signalled"""
+    signalled = []
+    for pid in pids:
         try:
-            result = subprocess.run(['sudo', 'systemctl', 'stop', service], 
-                                  capture_output=True)
-            if result.returncode == 0:
-                stopped_services += 1
-                print(f"  🛑 Stopped service: {service}")
-        except:
-            pass
-    
-    # Wait a moment for cleanup
-    if killed_processes > 0 or stopped_services > 0:
-        print("  ⏳ Waiting for GPIO release...")
-        time.sleep(2)
-    
-    # Check if any Python processes are still running
+            os.kill(pid, signum)
+            signalled.append(pid)
+        except ProcessLookupError:
+            pass  # Already gone
+        except PermissionError:
+            print(f"  ⚠️ No permission to stop PID {pid}")
+    return signalled
+
+
+def alive(pid):
+    """True while a PID exists and is not a zombie"""
     try:
-        result = subprocess.run(['pgrep', '-f', 'python3.*\.py'], 
-                              capture_output=True, text=True)
-        remaining = result.stdout.strip().split('\n') if result.stdout.strip() else []
-        remaining = [p for p in remaining if p and 'screensaver_manager' not in p]
-        
-        if remaining:
-            print(f"  ⚠️ Warning: {len(remaining)} Python processes still running")
-            # Force kill them
-            for pid in remaining:
-                try:
-                    subprocess.run(['kill', '-9', pid], capture_output=True)
-                    print(f"  💀 Force killed PID: {pid}")
-                except:
-                    pass
-    except:
-        pass
-    
-    print("✅ GPIO cleanup complete!")
-    print(f"   Processes killed: {killed_processes}")
-    print(f"   Services stopped: {stopped_services}")
+        with open(f'/proc/{pid}/stat') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except (OSError, IndexError):
+        return False
+
+
+def active_services(services):
+    """The services currently active, from a single systemctl call"""
+    if not services:
+        return []
+    try:
+        result = subprocess.run(['systemctl', 'is-active'] + list(services),
+                              capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    states = result.stdout.split()
+    return [service for service, state in zip(services, states) if state in ('active', 'activating', 'reloading')]
+
+
+def find_gpiochip():
+    """Path of the gpiochip driving the 40-pin header, or None without GPIO access"""
+    override = os.environ.get('M5_GPIOCHIP')
+    if override:
+        return override
+    chips = sorted(name for name in os.listdir('/dev') if name.startswith('gpiochip')) if os.path.isdir('/dev') else []
+    for name in chips:
+        path = os.path.join('/dev', name)
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            info = bytearray(GPIOCHIP_INFO.size)
+            fcntl.ioctl(fd, GPIOCHIP_INFO_IOCTL, info)
+            label = GPIOCHIP_INFO.unpack(info)[1].split(b'\0', 1)[0]
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+        # pinctrl-bcm2835/-bcm2711 on Pi 1-4, pinctrl-rp1 on Pi 5
+        if label.startswith(b'pinctrl-'):
+            return path
+    return os.path.join('/dev', chips[0]) if chips else None
+
+
+def busy_lines(chip, lines=HAT_LINES):
+    """{line: consumer} for HAT lines still requested, or None if the chip can't be read"""
+    try:
+        fd = os.open(chip, os.O_RDONLY)
+    except (OSError, TypeError):
+        return None
+    busy = {}
+    try:
+        for line in lines:
+            try:
+                info = bytearray(GPIO_V2_LINE_INFO.size)
+                struct.pack_into('I', info, 64, line)
+                fcntl.ioctl(fd, GPIO_V2_GET_LINEINFO_IOCTL, info)
+                _, consumer, _, _, flags = GPIO_V2_LINE_INFO.unpack(info)
+                used = flags & GPIO_V2_LINE_FLAG_USED
+            except OSError:
+                # Kernels before 5.10 only have the v1 line info
+                info = bytearray(GPIOLINE_INFO.pack(line, 0, b'', b''))
+                fcntl.ioctl(fd, GPIO_GET_LINEINFO_IOCTL, info)
+                _, flags, _, consumer = GPIOLINE_INFO.unpack(info)
+                used = flags & GPIOLINE_FLAG_KERNEL
+            if used:
+                busy[line] = consumer.split(b'\0', 1)[0].decode('utf-8', 'replace') or '?'
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    return busy
+
+
+def release_gpio(patterns=PROCESS_PATTERNS, services=LCD_SERVICES, lines=HAT_LINES,
+                 timeout=RELEASE_TIMEOUT, proc_root='/proc'):
+    """Stop everything holding the HAT and wait until its GPIO lines are free"""
+    start = time.perf_counter()
+    report = {'killed': [], 'forced': [], 'services': [], 'busy_lines': {}}
+
+    targets = find_processes(patterns, proc_root, exclude=protected_pids())
+    report['killed'] = signal_processes(sorted(targets), signal.SIGTERM)
+    for pid in report['killed']:
+        print(f"  🔄 Stopped {process_name(targets[pid])} (PID: {pid})")
+
+    # Only active services need stopping, all in one call that runs while processes exit
+    stopping = None
+    report['services'] = active_services(services)
+    if report['services']:
+        stopping = subprocess.Popen(['sudo', 'systemctl', 'stop'] + report['services'],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    chip = find_gpiochip()
+    waiting = set(report['killed'])
+    stopped_at = None
+    while True:
+        waiting = {pid for pid in waiting if alive(pid)}
+        busy = busy_lines(chip, lines) if chip else None
+        now = time.perf_counter()
+        if not waiting and (stopping is None or stopping.poll() is not None):
+            stopped_at = stopped_at or now
+            if not busy or now - stopped_at > LINE_SETTLE:
+                report['busy_lines'] = busy or {}
+                break
+
+        if waiting and not report['forced'] and now - start > TERM_GRACE:
+            report['forced'] += signal_processes(sorted(waiting), signal.SIGKILL)
+        if now - start > timeout:
+            report['busy_lines'] = busy or {}
+            break
+        time.sleep(POLL_INTERVAL)
+
+    if stopping is not None and stopping.poll() is None:
+        stopping.kill()
+    for service in report['services']:
+        print(f"  🛑 Stopped {service}")
+    for pid in report['forced']:
+        print(f"  💀 Force killed PID: {pid}")
+    for line, consumer in report['busy_lines'].items():
+        print(f"  ⚠️ GPIO {line} still held by {consumer}")
+    report['elapsed'] = time.perf_counter() - start
+    return report
+
+
+def cleanup_gpio():
+    """Clean up all GPIO-using processes and services"""
+    print("🧹 Starting GPIO cleanup...")
+    report = release_gpio()
+
+    print("✅ GPIO cleanup complete!" if not report['busy_lines'] else "⚠️ GPIO cleanup incomplete")
+    print(f"   Processes killed: {len(report['killed'])}")
+    print(f"   Services stopped: {len(report['services'])}")
+    print(f"   Took {report['elapsed'] * 1000:.0f} ms")
     print()
+    return not report['busy_lines']
+
 
 if __name__ == "__main__":
-    cleanup_gpio()
\ No newline at end of file
+    sys.exit(0 if cleanup_gpio() else 1)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Headless - Run effects without the LCD
+Registers a stand-in LCD_1in44 module that keeps the last frame instead of
+driving SPI, and a frame clock that replaces an effect module's time so
+time-based animation advances by frame rather than by wall clock.
+Import and install() before importing any effect module.
+"""
+
+import sys
+import time
+import types
+
+WIDTH = 128
+HEIGHT = 128
+
+
+class HeadlessLCD:
+    width = WIDTH
+    height = HEIGHT
+
+    def __init__(self):
+        self.frames_shown = 0
+        self.last_image = None
+        self.last_rgb565 = None
+
+    def LCD_Init(self, scan_dir):
+        pass
+
+    def LCD_Clear(self):
+        pass
+
+    def LCD_Invalidate(self):
+        pass
+
+    def LCD_ShowImage(self, image, x_start, y_start):
+        """Keep the frame instead of sending it"""
+        self.last_image = image
+        self.frames_shown += 1
+
+    def LCD_ShowRGB565(self, data):
+        self.last_rgb565 = bytes(data)
+        self.frames_shown += 1
+
+
+class FrameClock:
+    def __init__(self, fps=20.0):
+        self.fps = fps
+        self.frame = 0
+
+    def time(self):
+        """Seconds of animation elapsed, advanced by tick()"""
+        return self.frame / self.fps
+
+    def sleep(self, seconds):
+        pass
+
+    def perf_counter(self):
+        return time.perf_counter()
+
+    def tick(self):
+        """Advance one frame"""
+        self.frame += 1
+
+
+def install(lcd_class=HeadlessLCD):
+    """Register a stand-in LCD_1in44 module whose LCD is lcd_class"""
+    current = sys.modules.get('LCD_1in44')
+    if current is not None and getattr(current, 'LCD', None) is lcd_class:
+        return current
+
+    module = types.ModuleType('LCD_1in44')
+    module.LCD = lcd_class
+    module.LCD_WIDTH = WIDTH
+    module.LCD_HEIGHT = HEIGHT
+    # Scan directions, as in the driver
+    module.L2R_U2D, module.L2R_D2U, module.R2L_U2D, module.R2L_D2U = 1, 2, 3, 4
+    module.U2D_L2R, module.U2D_R2L, module.D2U_L2R, module.D2U_R2L = 5, 6, 7, 8
+    module.SCAN_DIR_DFT = module.U2D_R2L
+    sys.modules['LCD_1in44'] = module
+    return module
@@ -6,11 +6,13 @@ Very heavy rainfall with intense splashing and rapid puddle formation
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from quality_governor import QualityGovernor
+from frame_pacer import FramePacer
+from effect_rng import EffectRandom
 
 class HeavyRain:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("⛈️ Initializing Heavy Rain...")
         
         # Initialize LCD
@@ -24,17 +26,16 @@ class HeavyRain:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # HEAVY RAIN - Much denser streams
         self.raindrop_streams = []
-        stream_spacing = 4  # Much tighter spacing for heavy rain
-        for x in range(0, self.width, stream_spacing):
-            self.raindrop_streams.append({
-                'x': x,
-                'drops': [],
-                'spawn_timer': random.randint(0, 15),  # Much shorter delays
-                'wind_offset': random.uniform(-3, 3),  # Stronger wind
-                'intensity': random.uniform(0.8, 1.5)  # Variable intensity per stream
-            })
+        self.stream_spacing = 4  # Much tighter spacing for heavy rain
+        
+        # Stream spacing adapts to hold the target FPS (wider = cheaper)
+        self.governor = QualityGovernor('stream_spacing', [8, 6, 5, 4, 3], target_fps=25,
+                                        apply=self.set_stream_spacing, start=self.stream_spacing,
+                                        pacer=FramePacer(25, lcd=self.LCD))
         
         # Puddles form faster and bigger in heavy rain
         self.puddles = {}
@@ -57,19 +58,38 @@ class HeavyRain:
         
         print(f"⛈️ Created {len(self.raindrop_streams)} heavy rain streams")
     
+    def create_stream(self, x):
+        """Create one raindrop stream"""
+        return {
+            'x': x,
+            'drops': [],
+            'spawn_timer': self.random.randint(0, 15),  # Much shorter delays
+            'wind_offset': self.random.uniform(-3, 3),  # Stronger wind
+            'intensity': self.random.uniform(0.8, 1.5)  # Variable intensity per stream
+        }
+    
+    def set_stream_spacing(self, spacing):
+        """Quality knob: spacing between rain streams"""
+        self.stream_spacing = spacing
+        
+        # Keep streams that still sit on the new grid so drops in flight survive
+        existing = {stream['x']: stream for stream in self.raindrop_streams}
+        self.raindrop_streams = [existing.get(x) or self.create_stream(x)
+                                 for x in range(0, self.width, spacing)]
+    
     def create_heavy_raindrop(self, stream):
         """Create a heavy raindrop - bigger and faster"""
         # Heavy rain has more large drops
         size_weights = ['small'] * 2 + ['medium'] * 4 + ['large'] * 4
         
         return {
-            'y': random.uniform(-8, -3),
-            'size': random.choice(size_weights),
-            'color': random.choice(self.storm_colors),
-            'speed': random.uniform(3.0, 7.0) * stream['intensity'],  # Much faster
-            'brightness': random.randint(200, 255),
-            'wind_drift': stream['wind_offset'] * random.uniform(0.8, 2.0),
-            'trail_length': random.randint(5, 12)  # Longer trails
+            'y': self.random.uniform(-8, -3),
+            'size': self.random.choice(size_weights),
+            'color': self.random.choice(self.storm_colors),
+            'speed': self.random.uniform(3.0, 7.0) * stream['intensity'],  # Much faster
+            'brightness': self.random.randint(200, 255),
+            'wind_drift': stream['wind_offset'] * self.random.uniform(0.8, 2.0),
+            'trail_length': self.random.randint(5, 12)  # Longer trails
         }
     
     def create_heavy_splash(self, x, y, intensity):
@@ -82,17 +102,18 @@ class HeavyRain:
             'intensity': intensity * 2  # Double intensity
         }
         
-        # Create more splash particles
-        for i in range(intensity * 3):  # Triple the particles
-            angle = random.uniform(0, 3.14159)
-            speed = random.uniform(2, 5)  # Faster splash particles
-            splash['particles'].append({
-                'dx': speed * random.uniform(-1.5, 1.5),
-                'dy': -speed * random.uniform(1, 3),  # Higher splash
-                'life': random.randint(15, 35),
-                'size': random.choice(['tiny', 'small', 'medium']),
-                'color': random.choice(self.storm_colors)
-            })
+        # Create more splash particles, drawn in one batch
+        count = intensity * 3  # Triple the particles
+        speed = self.random.uniform(2, 5, count)  # Faster splash particles
+        dx = speed * self.random.uniform(-1.5, 1.5, count)
+        dy = -speed * self.random.uniform(1, 3, count)  # Higher splash
+        life = self.random.randint(15, 35, count)
+        sizes = self.random.choice(['tiny', 'small', 'medium'], count)
+        colors = self.random.choice(self.storm_colors, count)
+        splash['particles'] = [
+            {'dx': px, 'dy': py, 'life': pl, 'size': size, 'color': color}
+            for px, py, pl, size, color in zip(dx.tolist(), dy.tolist(), life.tolist(), sizes, colors)
+        ]
         
         self.splashes.append(splash)
     
@@ -116,14 +137,14 @@ class HeavyRain:
         for stream in self.raindrop_streams:
             # Spawn raindrops very frequently
             if stream['spawn_timer'] <= 0:
-                if random.random() < 0.9:  # 90% chance - very frequent
+                if self.random.random() < 0.9:  # 90% chance - very frequent
                     stream['drops'].append(self.create_heavy_raindrop(stream))
                     
                     # Sometimes spawn multiple drops at once
-                    if random.random() < 0.4:
+                    if self.random.random() < 0.4:
                         stream['drops'].append(self.create_heavy_raindrop(stream))
                 
-                stream['spawn_timer'] = random.randint(3, 15)  # Very short delays
+                stream['spawn_timer'] = self.random.randint(3, 15)  # Very short delays
             else:
                 stream['spawn_timer'] -= 1
             
@@ -282,6 +303,7 @@ class HeavyRain:
         
         try:
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -296,9 +318,11 @@ class HeavyRain:
                     puddle_count = len(self.puddles)
                     avg_puddle_depth = sum(self.puddles.values()) / max(1, len(self.puddles))
                     print(f"⛈️ {elapsed:.1f}s: {total_drops} drops, {active_splashes} splashes, "
-                          f"{puddle_count} puddles (avg depth: {avg_puddle_depth:.1f})")
+                          f"{puddle_count} puddles (avg depth: {avg_puddle_depth:.1f}), "
+                          f"{self.governor.status()}")
                 
-                time.sleep(0.04)  # 25 FPS for intense motion
+                # 25 FPS target for intense motion
+                time.sleep(self.governor.frame_done(time.perf_counter() - frame_start))
                 
         except KeyboardInterrupt:
             print(f"\n⛈️ Storm passed")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Julia Atlas - Precomputed Julia parameter sweep
+The Julia effect walks c along a closed sin/cos path, so the same frames
+come round every period. This renders the iteration field for a sampled
+grid of c along that path (plus the interesting_c jump targets) into a
+uint8 file once; the effect memory-maps it and only does palette lookups.
+
+Usage:
+    python3 julia_atlas.py build [samples]   # Render the atlas (default 2048 samples)
+    python3 julia_atlas.py info              # Show the current atlas
+"""
+
+import sys
+import os
+import math
+import time
+import struct
+import numpy as np
+
+import fractal
+
+ATLAS_MAGIC = b'M5JATL01'
+ATLAS_HEADER = struct.Struct('<8sHHIHHH')  # magic, width, height, path samples, jumps, max_iter, scale
+
+ATLAS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'clips', 'julia_atlas.bin')
+
+PANEL_SIZE = 128
+
+# The path closes after 20*pi: sin(0.5t) repeats every 4*pi, cos(0.7t) every 20*pi/7
+PATH_PERIOD = 20 * math.pi
+
+# Parameters the effect occasionally jumps to
+INTERESTING_C = [
+    (-0.7269, 0.1889),
+    (-0.8, 0.156),
+    (-0.4, 0.6),
+    (0.285, 0.01),
+    (-0.75, 0.11),
+    (-0.1, 0.651),
+]
+
+# Stored values are smooth iteration counts in eighths, so max_iter 25 fits a uint8
+ATLAS_STEPS = 8
+
+
+def path_c(t):
+    """Julia parameter at animation time t"""
+    return (-0.7 + 0.3 * math.sin(t * 0.5),
+            0.27015 + 0.2 * math.cos(t * 0.7))
+
+
+def build_atlas(samples=2048, max_iter=25, scale=2, path=ATLAS_PATH):
+    """Render every path sample and jump target into an atlas file"""
+    if max_iter * ATLAS_STEPS > 255:
+        raise ValueError(f"max_iter {max_iter} doesn't fit a uint8 atlas")
+
+    xs = ys = np.arange(0, PANEL_SIZE, scale)
+    c_values = [complex(*path_c(PATH_PERIOD * i / samples)) for i in range(samples)]
+    c_values += [complex(*c) for c in INTERESTING_C]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    start = time.time()
+
+    with open(temp_path, 'wb') as f:
+        f.write(ATLAS_HEADER.pack(ATLAS_MAGIC, len(xs), len(ys), samples, len(INTERESTING_C),
+                                  max_iter, scale))
+        f.write(np.array(c_values, dtype=np.complex128).tobytes())
+
+        for i, c in enumerate(c_values):
+            counts = fractal.julia_iterations(c, PANEL_SIZE, PANEL_SIZE, max_iter, xs, ys, smooth=True)
+            f.write((counts * ATLAS_STEPS // fractal.SMOOTH_SCALE).astype(np.uint8).tobytes())
+            if (i + 1) % 256 == 0:
+                print(f"   {i + 1}/{len(c_values)} slices ({time.time() - start:.1f}s)")
+
+    os.replace(temp_path, path)
+    size = os.path.getsize(path)
+    print(f"✅ Atlas saved: {path} ({len(c_values)} slices, {size / 1e6:.1f} MB, {time.time() - start:.1f}s)")
+    return path
+
+
+class JuliaAtlas:
+    def __init__(self, path=ATLAS_PATH):
+        with open(path, 'rb') as f:
+            header = f.read(ATLAS_HEADER.size)
+        if len(header) < ATLAS_HEADER.size:
+            raise ValueError(f"{path} is not a Julia atlas")
+
+        (magic, self.width, self.height, self.samples, self.jumps,
+         self.max_iter, self.scale) = ATLAS_HEADER.unpack(header)
+        if magic != ATLAS_MAGIC:
+            raise ValueError(f"{path} is not a Julia atlas")
+
+        slices = self.samples + self.jumps
+        self.c_values = np.fromfile(path, dtype=np.complex128, count=slices, offset=ATLAS_HEADER.size)
+        self.fields = np.memmap(path, dtype=np.uint8, mode='r',
+                                offset=ATLAS_HEADER.size + slices * 16,
+                                shape=(slices, self.height, self.width))
+
+    @classmethod
+    def open(cls, path=ATLAS_PATH):
+        """The atlas at path, or None when it hasn't been built"""
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            return None
+
+    @property
+    def inside(self):
+        """Stored value for points that never escape"""
+        return self.max_iter * ATLAS_STEPS
+
+    def path_field(self, t):
+        """Field for the path sample nearest to animation time t"""
+        index = round((t % PATH_PERIOD) / PATH_PERIOD * self.samples) % self.samples
+        return self.fields[index]
+
+    def jump_field(self, jump):
+        """Field for INTERESTING_C[jump]"""
+        return self.fields[self.samples + jump]
+
+    def info(self):
+        """Print what the atlas holds"""
+        print(f"🗺️ Julia atlas: {self.width}x{self.height} (scale {self.scale}), max_iter={self.max_iter}")
+        print(f"   {self.samples} path samples ({PATH_PERIOD / self.samples:.4f} time units apart)"
+              f" + {self.jumps} jump targets")
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == 'build':
+        samples = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+        print(f"🗺️ Building Julia atlas ({samples} path samples)...")
+        build_atlas(samples)
+    elif len(sys.argv) == 2 and sys.argv[1] == 'info':
+        atlas = JuliaAtlas.open()
+        if atlas:
+            atlas.info()
+        else:
+            print("⚫ No atlas built yet - run: python3 julia_atlas.py build")
+    else:
+        print("Usage:")
+        print("  python3 julia_atlas.py build [samples]")
+        print("  python3 julia_atlas.py info")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,19 @@ Animated Julia sets with varying parameters
 
 import LCD_1in44
 import time
-import random
 import math
+import numpy as np
 from PIL import Image
+import fractal
+from render_scale import RenderScale
+from fractal_pool import TiledFractalRenderer, worker_count
+from quality_governor import QualityGovernor
+from frame_pacer import FramePacer
+from julia_atlas import JuliaAtlas, INTERESTING_C, path_c
+from effect_rng import EffectRandom
 
 class JuliaSet:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🎭 Initializing Julia Set...")
         
         # Initialize LCD
@@ -25,11 +32,24 @@ class JuliaSet:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Julia set parameters
         self.c_real = -0.7
         self.c_imag = 0.27015
         self.max_iter = 25
         self.time = 0
+        self.jump = None  # Index into INTERESTING_C for a one-frame jump
+        
+        # Full resolution unless M5_RENDER_SCALE says otherwise - SIGUSR1 cycles 128/64/32
+        self.render_scale = RenderScale(self.width, self.height)
+        self.render_scale.install_signal_handler()
+        
+        # Iteration count adapts to hold the target FPS, then the render resolution
+        self.governor = QualityGovernor('max_iter', range(10, 51, 5), target_fps=12,
+                                        apply=self.set_max_iter, start=self.max_iter,
+                                        pacer=FramePacer(12, lcd=self.LCD),
+                                        render_scale=self.render_scale)
         
         # Animated parameters
         self.param_speed = 0.01
@@ -42,66 +62,98 @@ class JuliaSet:
             g = int(255 * (0.5 + 0.5 * math.cos(t * 6.28 + 2.09)))
             b = int(255 * (0.5 + 0.5 * math.cos(t * 6.28 + 4.18)))
             self.colors.append((r, g, b))
+        # Smooth coloring indexes a palette blended between the colors above
+        self.palette = fractal.interpolate_palette(self.colors)
+        self.palette_steps = len(self.palette) // len(self.colors)
+        
+        # 'julia_subdivided' renders by rectangle subdivision, but measured slower
+        # at 25 iterations (little interior to fill) and can miss thin filaments
+        self.kernel = 'julia_iterations'
+        
+        # Worker processes for tiled rendering (1 = render in this process). A 64x64
+        # frame at 25 iterations is cheaper in-process; M5_FRACTAL_WORKERS overrides
+        self.workers = worker_count(1)
+        self.renderer = None
+        if self.workers > 1:
+            try:
+                self.renderer = TiledFractalRenderer(self.width, self.height, self.workers)
+                print(f"⚙️ Rendering in {self.renderer.bands} bands on {self.workers} workers")
+            except OSError as e:
+                print(f"⚠️ Tiled renderer unavailable, rendering in-process: {e}")
+        
+        # Precomputed fields for the whole parameter path (python3 julia_atlas.py build)
+        self.atlas = JuliaAtlas.open()
+        if self.atlas:
+            print(f"🗺️ Julia atlas loaded: {self.atlas.samples} path samples at {self.atlas.width}x{self.atlas.height}")
         
         print(f"🎭 Julia set ready")
     
-    def julia(self, z, c):
-        """Calculate Julia set iterations"""
-        for n in range(self.max_iter):
-            if abs(z) > 2:
-                return n
-            z = z*z + c
-        return self.max_iter
+    def set_max_iter(self, max_iter):
+        """Quality knob: iteration limit"""
+        self.max_iter = max_iter
+    
+    def using_atlas(self):
+        """Whether frames come from the atlas: same render scale and iteration count"""
+        return (self.atlas is not None and self.atlas.scale == self.render_scale.scale
+                and self.max_iter == self.atlas.max_iter)
+    
+    def hold_for_atlas(self):
+        """Keep the governor at the atlas's iteration count while the render scale matches it"""
+        if self.atlas is None:
+            return
+        if self.atlas.scale == self.render_scale.scale and self.atlas.max_iter in self.governor.levels:
+            self.governor.hold(self.atlas.max_iter)
+        else:
+            self.governor.hold(None)
     
     def draw_frame(self):
         """Draw Julia set"""
-        image = Image.new('RGB', (self.width, self.height), (0, 0, 0))
+        steps = self.palette_steps
+        # Cheap atlas frames would otherwise let the governor raise max_iter past it
+        self.hold_for_atlas()
+        if self.using_atlas():
+            # Nearest precomputed slice, already in eighths of an iteration
+            if self.jump is not None:
+                field = self.atlas.jump_field(self.jump)
+            else:
+                field = self.atlas.path_field(self.time)
+            color_index = field.astype(np.int32) * steps + int(self.time * 50) * steps
+            inside = field == self.atlas.inside
+        else:
+            xs, ys = self.render_scale.pixel_coords()
+            c = complex(self.c_real, self.c_imag)
+            args = (c, self.width, self.height, self.max_iter)
+            if self.renderer:
+                iterations = self.renderer.render(self.kernel, args, xs, ys, smooth=True)
+            else:
+                iterations = getattr(fractal, self.kernel)(*args, xs, ys, smooth=True)
+            color_index = iterations * 8 * steps // fractal.SMOOTH_SCALE + int(self.time * 50) * steps
+            inside = iterations == self.max_iter * fractal.SMOOTH_SCALE
         
-        # Julia set bounds
-        x_min, x_max = -2.0, 2.0
-        y_min, y_max = -2.0, 2.0
+        # Color based on smooth iterations with time offset, inside set = dark blue
+        pixels = self.palette[color_index % len(self.palette)]
+        pixels[inside] = (0, 0, 50)
         
-        c = complex(self.c_real, self.c_imag)
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                # Map pixel to complex plane
-                real = x_min + (x / self.width) * (x_max - x_min)
-                imag = y_min + (y / self.height) * (y_max - y_min)
-                
-                z = complex(real, imag)
-                iterations = self.julia(z, c)
-                
-                if iterations == self.max_iter:
-                    color = (0, 0, 50)  # Inside set = dark blue
-                else:
-                    # Color based on iterations with time offset
-                    color_index = (iterations * 8 + int(self.time * 50)) % len(self.colors)
-                    color = self.colors[color_index]
-                
-                image.putpixel((x, y), color)
-        
-        return image
+        return Image.fromarray(self.render_scale.upscale(pixels), 'RGB')
     
     def update(self):
         """Update Julia set parameters"""
         self.time += self.param_speed
         
         # Animate the Julia set parameter
-        self.c_real = -0.7 + 0.3 * math.sin(self.time * 0.5)
-        self.c_imag = 0.27015 + 0.2 * math.cos(self.time * 0.7)
+        self.c_real, self.c_imag = path_c(self.time)
+        self.jump = None
         
         # Occasionally jump to interesting Julia parameters
-        if random.random() < 0.002:  # 0.2% chance
-            interesting_c = [
-                (-0.7269, 0.1889),
-                (-0.8, 0.156),
-                (-0.4, 0.6),
-                (0.285, 0.01),
-                (-0.75, 0.11),
-                (-0.1, 0.651),
-            ]
-            self.c_real, self.c_imag = random.choice(interesting_c)
+        if self.random.random() < 0.002:  # 0.2% chance
+            self.jump = self.random.randrange(len(INTERESTING_C))
+            self.c_real, self.c_imag = INTERESTING_C[self.jump]
+    
+    def next_frame(self):
+        """Render the current frame and advance the animation"""
+        image = self.draw_frame()
+        self.update()
+        return image
     
     def run(self):
         """Main animation loop"""
@@ -114,17 +166,17 @@ class JuliaSet:
         
         try:
             while True:
-                image = self.draw_frame()
+                frame_start = time.perf_counter()
+                image = self.next_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
-                self.update()
                 
                 frame += 1
                 
                 if frame % 50 == 0:
                     elapsed = time.time() - start_time
-                    print(f"🎭 {elapsed:.1f}s: c=({self.c_real:.3f}, {self.c_imag:.3f})")
+                    print(f"🎭 {elapsed:.1f}s: c=({self.c_real:.3f}, {self.c_imag:.3f}), {self.governor.status()}, {self.render_scale.status()}{', atlas' if self.using_atlas() else ''}")
                 
-                time.sleep(0.08)  # ~12 FPS
+                time.sleep(self.governor.frame_done(time.perf_counter() - frame_start))  # ~12 FPS
                 
         except KeyboardInterrupt:
             print(f"\n🎭 Julia set stopped")
@@ -133,6 +185,8 @@ class JuliaSet:
     def cleanup(self):
         """Clean up resources"""
         try:
+            if self.renderer:
+                self.renderer.close()
             print("🧹 Clearing screen...")
             self.LCD.LCD_Clear()
             print("✅ Cleanup complete")
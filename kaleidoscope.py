@@ -6,12 +6,13 @@ Rotating kaleidoscope with mirrored patterns and colors
 
 import LCD_1in44
 import time
-import random
 import math
 from PIL import Image, ImageDraw
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class Kaleidoscope:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🔮 Initializing Kaleidoscope...")
         
         # Initialize LCD
@@ -24,6 +25,8 @@ class Kaleidoscope:
         
         self.width = self.LCD.width
         self.height = self.LCD.height
+        
+        self.random = EffectRandom(rng)
         self.center_x = self.width // 2
         self.center_y = self.height // 2
         self.radius = min(self.width, self.height) // 2 - 5
@@ -62,20 +65,20 @@ class Kaleidoscope:
     def create_pattern_element(self):
         """Create a pattern element for the kaleidoscope"""
         # Position in one segment (will be mirrored)
-        angle = random.uniform(0, 2 * math.pi / self.segments)
-        distance = random.uniform(5, self.radius * 0.8)
+        angle = self.random.uniform(0, 2 * math.pi / self.segments)
+        distance = self.random.uniform(5, self.radius * 0.8)
         
         return {
             'angle': angle,
             'distance': distance,
-            'color': random.choice(self.kaleido_colors),
-            'size': random.randint(2, 6),
-            'shape': random.choice(['circle', 'square', 'diamond', 'star']),
-            'rotation': random.uniform(0, 2 * math.pi),
-            'rotation_speed': random.uniform(-0.1, 0.1),
-            'pulse_phase': random.uniform(0, 2 * math.pi),
-            'pulse_speed': random.uniform(0.05, 0.15),
-            'life': random.randint(200, 600)
+            'color': self.random.choice(self.kaleido_colors),
+            'size': self.random.randint(2, 6),
+            'shape': self.random.choice(['circle', 'square', 'diamond', 'star']),
+            'rotation': self.random.uniform(0, 2 * math.pi),
+            'rotation_speed': self.random.uniform(-0.1, 0.1),
+            'pulse_phase': self.random.uniform(0, 2 * math.pi),
+            'pulse_speed': self.random.uniform(0.05, 0.15),
+            'life': self.random.randint(200, 600)
         }
     
     def update(self):
@@ -91,8 +94,8 @@ class Kaleidoscope:
             element['life'] -= 1
             
             # Slowly drift elements
-            element['angle'] += random.uniform(-0.005, 0.005)
-            element['distance'] += random.uniform(-0.2, 0.2)
+            element['angle'] += self.random.uniform(-0.005, 0.005)
+            element['distance'] += self.random.uniform(-0.2, 0.2)
             element['distance'] = max(5, min(self.radius * 0.8, element['distance']))
             
             # Remove old elements
@@ -192,7 +195,7 @@ class Kaleidoscope:
         draw = ImageDraw.Draw(image)
         
         # Draw kaleidoscope boundary (optional)
-        if random.random() < 0.1:  # Occasionally show boundary
+        if self.random.random() < 0.1:  # Occasionally show boundary
             draw.ellipse([
                 self.center_x - self.radius, self.center_y - self.radius,
                 self.center_x + self.radius, self.center_y + self.radius
@@ -212,6 +215,11 @@ class Kaleidoscope:
         
         return image
     
+    def next_frame(self):
+        """Advance the animation and render the new frame"""
+        self.update()
+        return self.draw_frame()
+    
     def run(self):
         """Main animation loop"""
         print("🔮 Starting Kaleidoscope...")
@@ -222,9 +230,10 @@ class Kaleidoscope:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(17, lcd=self.LCD)
             while True:
-                self.update()
-                image = self.draw_frame()
+                frame_start = time.perf_counter()
+                image = self.next_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
                 
                 frame += 1
@@ -236,7 +245,7 @@ class Kaleidoscope:
                     element_count = len(self.pattern_elements)
                     print(f"🔮 {elapsed:.1f}s: {rotation_degrees:.1f}° rotation, {element_count} elements")
                 
-                time.sleep(0.06)  # ~17 FPS for smooth rotation
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # ~17 FPS for smooth rotation
                 
         except KeyboardInterrupt:
             print(f"\n🔮 Kaleidoscope stopped")
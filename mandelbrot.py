@@ -2,16 +2,37 @@
 """
 Mandelbrot Set - Classic Fractal
 Animated Mandelbrot set with zooming and color cycling
+Past 50x the view switches to perturbation rendering around a Decimal
+reference orbit, so the zoom keeps going for minutes
 """
 
 import LCD_1in44
 import time
-import random
 import math
 from PIL import Image
+import fractal
+from render_scale import RenderScale
+from fractal_pool import TiledFractalRenderer, worker_count
+from fractal_zoom import IncrementalZoom
+from quality_governor import QualityGovernor
+from frame_pacer import FramePacer
+from effect_rng import EffectRandom
+
+# Zoom targets on the boundary (Misiurewicz points), precise enough for deep zooms
+INTERESTING_POINTS = [
+    ("-0.2306185488094149258366498672466233051", "0.8160764508988396612991868716560091980"),  # Spiral area
+    ("-0.2397161902231344106662340904922112597", "0.8455033137002887225928533487108295921"),  # Spiral arm
+    ("-0.1010963638456221610257854457386225655", "0.9562865108091415007710960577299774358"),  # Branch point
+    ("-1.543689012692076361570855971801747987", "0"),  # Antenna junction
+    ("0", "1"),  # Dendrite tip
+]
+
+DEEP_ZOOM = 50           # Switch to perturbation rendering past this zoom
+MAX_ZOOM = 1e30          # Pick a new target after ~6 minutes of zooming
+DEEP_ITER_BUDGET = 6     # Deep iterations past the series skip, per unit of max_iter
 
 class MandelbrotSet:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🌀 Initializing Mandelbrot Set...")
         
         # Initialize LCD
@@ -25,12 +46,24 @@ class MandelbrotSet:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Mandelbrot parameters
         self.zoom = 1.0
         self.zoom_speed = 1.02
-        self.center_x = -0.5
-        self.center_y = 0.0
+        self.set_target(self.random.choice(INTERESTING_POINTS))
         self.max_iter = 30
+        self.iter_limit = self.max_iter
+        
+        # Full resolution unless M5_RENDER_SCALE says otherwise - SIGUSR1 cycles 128/64/32
+        self.render_scale = RenderScale(self.width, self.height)
+        self.render_scale.install_signal_handler()
+        
+        # Iteration count adapts to hold the target FPS, then the render resolution
+        self.governor = QualityGovernor('max_iter', range(12, 61, 6), target_fps=10,
+                                        apply=self.set_max_iter, start=self.max_iter,
+                                        pacer=FramePacer(10, lcd=self.LCD),
+                                        render_scale=self.render_scale)
         
         # Color palette
         self.colors = []
@@ -40,47 +73,99 @@ class MandelbrotSet:
             g = int(255 * (0.5 + 0.5 * math.sin(t * 6.28 + 2.09)))
             b = int(255 * (0.5 + 0.5 * math.sin(t * 6.28 + 4.18)))
             self.colors.append((r, g, b))
+        # Smooth coloring indexes a palette blended between the colors above
+        self.palette = fractal.interpolate_palette(self.colors)
+        self.palette_steps = len(self.palette) // len(self.colors)
+        
+        # Worker processes for tiled rendering (1 = render in this process)
+        self.workers = worker_count(3)
+        self.renderer = None
+        if self.workers > 1:
+            try:
+                self.renderer = TiledFractalRenderer(self.width, self.height, self.workers)
+                print(f"⚙️ Rendering in {self.renderer.bands} bands on {self.workers} workers")
+            except OSError as e:
+                print(f"⚠️ Tiled renderer unavailable, rendering in-process: {e}")
+        
+        # Deep frames reproject the previous frame and only recompute what the
+        # zoom exposed (shallow frames are cheaper to render outright)
+        self.zoom_reuse = IncrementalZoom(self.width, self.height, tolerance=fractal.SMOOTH_SCALE)
         
         self.color_offset = 0
         print(f"🌀 Mandelbrot set ready")
     
-    def mandelbrot(self, c):
-        """Calculate Mandelbrot iterations for complex number c"""
-        z = 0
-        for n in range(self.max_iter):
-            if abs(z) > 2:
-                return n
-            z = z*z + c
-        return self.max_iter
+    def set_max_iter(self, max_iter):
+        """Quality knob: iteration limit"""
+        self.max_iter = max_iter
+    
+    def set_target(self, target):
+        """Zoom towards a (real, imag) pair of decimal strings"""
+        self.center = target
+        self.center_x, self.center_y = float(target[0]), float(target[1])
+        self.orbit = None
+        self.orbit_digits = 0
+        self.exhausted = False
+    
+    def reference_orbit(self, length):
+        """Decimal reference orbit at the center, recomputed only when it runs short"""
+        digits = 20 + 10 * math.ceil(math.log10(self.zoom) / 10)
+        orbit_escaped = self.orbit is not None and len(self.orbit) - 1 < self.orbit_length
+        if (self.orbit is None or digits > self.orbit_digits
+                or (length > len(self.orbit) - 1 and not orbit_escaped)):
+            self.orbit_length = max(length * 2, 256)
+            self.orbit_digits = digits
+            self.orbit = fractal.reference_orbit(self.center[0], self.center[1],
+                                                 self.orbit_length, digits)
+        return self.orbit
+    
+    def render_full(self, kernel, args, xs, ys):
+        """Whole-view smooth render, on the worker pool when there is one"""
+        if self.renderer:
+            return self.renderer.render(kernel, args, xs, ys, smooth=True)
+        return getattr(fractal, kernel)(*args, xs, ys, smooth=True)
+    
+    def render_shallow(self, xs, ys):
+        """Whole view in float64; shallow frames change too much to reuse pixels"""
+        self.iter_limit = self.max_iter
+        args = (self.center_x, self.center_y, self.zoom, self.width, self.height, self.max_iter)
+        # Per-pixel: 'mandelbrot_subdivided' is faster at full resolution but fills
+        # over filaments thinner than a block in some frames this zoom passes through
+        return self.render_full('mandelbrot_iterations', args, xs, ys)
+    
+    def deep_renderers(self, xs, ys):
+        """Perturbation renderers with the series approximation skipping shared iterations"""
+        budget = self.max_iter * DEEP_ITER_BUDGET
+        orbit = self.reference_orbit(budget)
+        radius = fractal.view_radius(self.zoom, self.width, self.height)
+        series = fractal.series_approximation(orbit, radius)
+        self.iter_limit = series[0] + budget
+        
+        args = (orbit, series, self.zoom, self.width, self.height, self.iter_limit)
+        return (lambda: self.render_full('perturbation_iterations', args, xs, ys),
+                lambda dc: fractal.perturbation_escape(orbit, dc, self.iter_limit, series, smooth=True))
     
     def draw_frame(self):
         """Draw Mandelbrot set"""
-        image = Image.new('RGB', (self.width, self.height), (0, 0, 0))
-        
-        # Calculate bounds
-        aspect = self.width / self.height
-        half_width = 2.0 / self.zoom
-        half_height = half_width / aspect
-        
-        for y in range(self.height):
-            for x in range(self.width):
-                # Map pixel to complex plane
-                real = self.center_x + (x - self.width/2) * half_width / (self.width/2)
-                imag = self.center_y + (y - self.height/2) * half_height / (self.height/2)
-                
-                c = complex(real, imag)
-                iterations = self.mandelbrot(c)
-                
-                if iterations == self.max_iter:
-                    color = (0, 0, 0)  # Inside set = black
-                else:
-                    # Color based on iterations
-                    color_index = (iterations + self.color_offset) % len(self.colors)
-                    color = self.colors[color_index]
-                
-                image.putpixel((x, y), color)
+        xs, ys = self.render_scale.pixel_coords()
+        if self.zoom > DEEP_ZOOM:
+            render_full, render_points = self.deep_renderers(xs, ys)
+            iterations = self.zoom_reuse.render(self.center, self.zoom,
+                                                self.iter_limit * fractal.SMOOTH_SCALE,
+                                                xs, ys, render_full, render_points)
+        else:
+            iterations = self.render_shallow(xs, ys)
+            self.zoom_reuse.invalidate()
         
-        return image
+        # A flat frame means the zoom has run out of detail
+        self.exhausted = iterations.min() == iterations.max()
+        
+        # Color based on iterations, inside set = black
+        steps = self.palette_steps
+        index = iterations * steps // fractal.SMOOTH_SCALE + self.color_offset * steps
+        pixels = self.palette[index % len(self.palette)]
+        pixels[iterations == self.iter_limit * fractal.SMOOTH_SCALE] = 0
+        
+        return Image.fromarray(self.render_scale.upscale(pixels), 'RGB')
     
     def update(self):
         """Update fractal parameters"""
@@ -88,18 +173,16 @@ class MandelbrotSet:
         self.zoom *= self.zoom_speed
         self.color_offset = (self.color_offset + 1) % len(self.colors)
         
-        # Reset zoom and move to new area when too zoomed
-        if self.zoom > 50:
+        # Move to a new area after a full deep zoom or when detail runs out
+        if self.zoom > MAX_ZOOM or self.exhausted:
             self.zoom = 1.0
-            # Move to interesting Mandelbrot coordinates
-            interesting_points = [
-                (-0.5, 0.0),      # Main bulb
-                (-0.75, 0.1),     # Edge detail
-                (-0.235125, 0.827215),  # Spiral area
-                (-0.8, 0.156),    # Tendril
-                (-0.74529, 0.11307),  # Mini Mandelbrot
-            ]
-            self.center_x, self.center_y = random.choice(interesting_points)
+            self.set_target(self.random.choice(INTERESTING_POINTS))
+    
+    def next_frame(self):
+        """Render the current frame and advance the animation"""
+        image = self.draw_frame()
+        self.update()
+        return image
     
     def run(self):
         """Main animation loop"""
@@ -112,17 +195,20 @@ class MandelbrotSet:
         
         try:
             while True:
-                image = self.draw_frame()
+                frame_start = time.perf_counter()
+                image = self.next_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
-                self.update()
                 
                 frame += 1
                 
                 if frame % 50 == 0:
                     elapsed = time.time() - start_time
-                    print(f"🌀 {elapsed:.1f}s: zoom={self.zoom:.2f}, center=({self.center_x:.3f}, {self.center_y:.3f})")
+                    print(f"🌀 {elapsed:.1f}s: zoom={self.zoom:.3g}, center=({self.center_x:.3f}, {self.center_y:.3f}), "
+                          f"iterations={self.iter_limit}, {self.zoom_reuse.status()}, {self.governor.status()}, "
+                          f"{self.render_scale.status()}")
                 
-                time.sleep(0.1)  # 10 FPS (fractal calculation is intensive)
+                # 10 FPS target (fractal calculation is intensive)
+                time.sleep(self.governor.frame_done(time.perf_counter() - frame_start))
                 
         except KeyboardInterrupt:
             print(f"\n🌀 Mandelbrot set stopped")
@@ -131,6 +217,8 @@ class MandelbrotSet:
     def cleanup(self):
         """Clean up resources"""
         try:
+            if self.renderer:
+                self.renderer.close()
             print("🧹 Clearing screen...")
             self.LCD.LCD_Clear()
             print("✅ Cleanup complete")
@@ -6,11 +6,12 @@ Mostly 1s and 0s falling in green with occasional strange symbols
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class MatrixBinaryRain:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🔋 Initializing Matrix Binary Rain...")
         
         # Initialize LCD
@@ -24,6 +25,8 @@ class MatrixBinaryRain:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Character sets
         self.binary = ['0', '1']  # 90% of characters
         self.matrix_symbols = ['日', '文', '字', 'ﾊ', 'ﾐ', 'ﾋ', 'ｰ', 'ｳ', 'ｼ', 'ﾅ', 'ﾓ', 'ﾆ', 'ｻ', 'ﾜ', 'ﾂ', 'ｵ', 'ﾘ', 'ｱ', 'ﾎ', 'ﾃ', 'ﾏ', 'ｹ', 'ﾒ', 'ｴ', 'ｶ', 'ｷ', 'ﾑ', 'ﾕ', 'ﾗ', 'ｾ', 'ﾈ', 'ｽ', 'ﾀ', 'ﾇ', 'ﾍ']  # Japanese katakana-like
@@ -36,22 +39,22 @@ class MatrixBinaryRain:
             self.columns.append({
                 'x': x,
                 'chars': [],
-                'spawn_timer': random.randint(0, 30),
-                'speed_multiplier': random.uniform(0.8, 1.5)  # Varied column speeds
+                'spawn_timer': self.random.randint(0, 30),
+                'speed_multiplier': self.random.uniform(0.8, 1.5)  # Varied column speeds
             })
         
         print(f"🔋 Created {len(self.columns)} Matrix columns")
     
     def get_character(self):
         """Get character based on Matrix probability"""
-        rand = random.random()
+        rand = self.random.random()
         
         if rand < 0.85:  # 85% binary
-            return random.choice(self.binary)
+            return self.random.choice(self.binary)
         elif rand < 0.98:  # 13% matrix symbols
-            return random.choice(self.matrix_symbols)
+            return self.random.choice(self.matrix_symbols)
         else:  # 2% rare symbols
-            return random.choice(self.rare_symbols)
+            return self.random.choice(self.rare_symbols)
     
     def update(self):
         """Update falling characters"""
@@ -62,10 +65,10 @@ class MatrixBinaryRain:
                     'char': self.get_character(),
                     'y': -8,
                     'brightness': 255,
-                    'speed': random.uniform(1.0, 3.0) * col['speed_multiplier'],
+                    'speed': self.random.uniform(1.0, 3.0) * col['speed_multiplier'],
                     'is_lead': True  # Mark as leading character
                 })
-                col['spawn_timer'] = random.randint(5, 25)  # Frequent spawning
+                col['spawn_timer'] = self.random.randint(5, 25)  # Frequent spawning
             else:
                 col['spawn_timer'] -= 1
             
@@ -132,7 +135,7 @@ class MatrixBinaryRain:
                     except:
                         # Fallback for unsupported characters
                         draw.text((col['x'], int(char['y'])), 
-                                 random.choice(self.binary), fill=color, font=font)
+                                 self.random.choice(self.binary), fill=color, font=font)
         
         return image
     
@@ -146,7 +149,9 @@ class MatrixBinaryRain:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(25, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -159,7 +164,7 @@ class MatrixBinaryRain:
                     total_chars = sum(len(col['chars']) for col in self.columns)
                     print(f"🔋 The Matrix has you... {total_chars} streams active")
                 
-                time.sleep(0.04)  # 25 FPS for smooth Matrix feel
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 25 FPS for smooth Matrix feel
                 
         except KeyboardInterrupt:
             print(f"\n🔋 You chose the red pill... Exiting the Matrix")
@@ -6,11 +6,12 @@ Maximum density of 1-pixel dots in neon green and blue
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class MicroDots:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🔬 Initializing Micro Dots...")
         
         # Initialize LCD
@@ -24,14 +25,16 @@ class MicroDots:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Ultra-dense pixel streams - every other pixel
         self.pixel_streams = []
         for x in range(0, self.width, 2):  # Every 2 pixels
             self.pixel_streams.append({
                 'x': x,
                 'dots': [],
-                'spawn_timer': random.randint(0, 8),
-                'intensity': random.uniform(0.3, 1.0)
+                'spawn_timer': self.random.randint(0, 8),
+                'intensity': self.random.uniform(0.3, 1.0)
             })
         
         # Color palettes
@@ -53,33 +56,40 @@ class MicroDots:
         
         print(f"🔬 Created {len(self.pixel_streams)} micro dot streams")
     
-    def spawn_dot(self, stream):
-        """Spawn a new micro dot"""
+    def spawn_dots(self, streams):
+        """Spawn a new micro dot in each stream, drawing all of them in one batch"""
+        count = len(streams)
         # 70% green, 30% blue
-        if random.random() < 0.7:
-            color = random.choice(self.neon_greens)
-        else:
-            color = random.choice(self.neon_blues)
+        green = self.random.random(count) < 0.7
+        greens = self.random.choice(self.neon_greens, count)
+        blues = self.random.choice(self.neon_blues, count)
+        ys = self.random.uniform(-3, 0, count).tolist()
+        speeds = self.random.uniform(0.3, 1.8, count).tolist()
+        trails = self.random.randint(2, 6, count).tolist()
         
-        return {
-            'y': random.uniform(-3, 0),
-            'color': color,
-            'brightness': 255,
-            'speed': random.uniform(0.3, 1.8) * stream['intensity'],
-            'trail_length': random.randint(2, 6)
-        }
+        for i, stream in enumerate(streams):
+            stream['dots'].append({
+                'y': ys[i],
+                'color': greens[i] if green[i] else blues[i],
+                'brightness': 255,
+                'speed': speeds[i] * stream['intensity'],
+                'trail_length': trails[i]
+            })
     
     def update(self):
         """Update all micro dots"""
+        spawning = []
         for stream in self.pixel_streams:
             # High frequency spawning for maximum density
             if stream['spawn_timer'] <= 0:
-                if random.random() < 0.8:  # 80% chance to spawn
-                    stream['dots'].append(self.spawn_dot(stream))
-                stream['spawn_timer'] = random.randint(2, 8)
+                if self.random.random() < 0.8:  # 80% chance to spawn
+                    spawning.append(stream)
+                stream['spawn_timer'] = self.random.randint(2, 8)
             else:
                 stream['spawn_timer'] -= 1
-            
+        self.spawn_dots(spawning)
+        
+        for stream in self.pixel_streams:
             # Update existing dots
             for dot in stream['dots'][:]:
                 dot['y'] += dot['speed']
@@ -115,7 +125,7 @@ class MicroDots:
                         image.putpixel((x, y), faded_color)
                     
                     # Sometimes add a second pixel for slightly larger dots
-                    if random.random() < 0.4 and dot['brightness'] > 150:
+                    if self.random.random() < 0.4 and dot['brightness'] > 150:
                         # Add neighboring pixel
                         for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
                             nx, ny = x + dx, y + dy
@@ -141,7 +151,9 @@ class MicroDots:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(40, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -154,7 +166,7 @@ class MicroDots:
                     total_dots = sum(len(s['dots']) for s in self.pixel_streams)
                     print(f"🔬 {elapsed:.1f}s: {total_dots} micro dots active")
                 
-                time.sleep(0.025)  # 40 FPS for ultra-smooth tiny motion
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 40 FPS for ultra-smooth tiny motion
                 
         except KeyboardInterrupt:
             print(f"\n🔬 Micro dots stopped")
@@ -6,11 +6,14 @@ Maximum density dots that accumulate and drip down through the bottom
 
 import LCD_1in44
 import time
-import random
+import numpy as np
 from PIL import Image, ImageDraw
+import accel
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class MicroDotsDripping:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("💧 Initializing Micro Dots Dripping...")
         
         # Initialize LCD
@@ -24,17 +27,26 @@ class MicroDotsDripping:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Ultra-dense pixel streams
         self.pixel_streams = []
         for x in range(0, self.width, 2):
             self.pixel_streams.append({
                 'x': x,
-                'dots': [],
-                'spawn_timer': random.randint(0, 8),
-                'intensity': random.uniform(0.3, 1.0),
-                'drip_accumulator': []  # Dots that pile up at bottom
+                'spawn_timer': self.random.randint(0, 8),
+                'intensity': self.random.uniform(0.3, 1.0),
             })
         
+        # Falling dots of every stream as parallel arrays, in spawn order
+        self.dot_stream = np.empty(0, dtype=np.int64)
+        self.dot_y = np.empty(0, dtype=np.float64)
+        self.dot_speed = np.empty(0, dtype=np.float64)
+        self.dot_brightness = np.empty(0, dtype=np.int64)
+        self.dot_color = np.empty((0, 3), dtype=np.int64)
+        self.dot_dripping = np.empty(0, dtype=np.bool_)
+        self.new_dots = []  # (stream, y, speed, brightness, color, dripping) added this frame
+        
         # Bottom accumulation layer - tracks dots that have "settled"
         self.bottom_layer = {}  # {x: [dots]} - stacked dots
         
@@ -53,22 +65,42 @@ class MicroDotsDripping:
         
         print(f"💧 Created {len(self.pixel_streams)} dripping streams")
     
-    def spawn_dot(self, stream):
-        """Spawn a new micro dot"""
-        if random.random() < 0.7:
-            color = random.choice(self.neon_greens)
-        else:
-            color = random.choice(self.neon_blues)
+    def spawn_dots(self, stream_indices):
+        """Spawn a new micro dot in each stream, drawing all of them in one batch"""
+        count = len(stream_indices)
+        green = self.random.random(count) < 0.7
+        greens = self.random.choice(self.neon_greens, count)
+        blues = self.random.choice(self.neon_blues, count)
+        ys = self.random.uniform(-3, 0, count).tolist()
+        intensity = [self.pixel_streams[i]['intensity'] for i in stream_indices]
+        speeds = (self.random.uniform(0.3, 1.8, count) * intensity).tolist()
         
-        return {
-            'y': random.uniform(-3, 0),
-            'color': color,
-            'brightness': 255,
-            'speed': random.uniform(0.3, 1.8) * stream['intensity'],
-            'settled': False
-        }
+        colors = [greens[i] if green[i] else blues[i] for i in range(count)]
+        self.new_dots.extend(zip(stream_indices, ys, speeds, [255] * count, colors, [False] * count))
     
-    def settle_dot_at_bottom(self, stream_x, dot):
+    def add_new_dots(self):
+        """Append this frame's spawned and dripping dots to the falling arrays"""
+        if not self.new_dots:
+            return
+        stream, y, speed, brightness, color, dripping = zip(*self.new_dots)
+        self.dot_stream = np.concatenate((self.dot_stream, stream))
+        self.dot_y = np.concatenate((self.dot_y, y))
+        self.dot_speed = np.concatenate((self.dot_speed, speed))
+        self.dot_brightness = np.concatenate((self.dot_brightness, brightness))
+        self.dot_color = np.concatenate((self.dot_color, np.array(color, dtype=np.int64)))
+        self.dot_dripping = np.concatenate((self.dot_dripping, dripping))
+        self.new_dots = []
+    
+    def keep_dots(self, keep):
+        """Drop falling dots where keep is False"""
+        self.dot_stream = self.dot_stream[keep]
+        self.dot_y = self.dot_y[keep]
+        self.dot_speed = self.dot_speed[keep]
+        self.dot_brightness = self.dot_brightness[keep]
+        self.dot_color = self.dot_color[keep]
+        self.dot_dripping = self.dot_dripping[keep]
+    
+    def settle_dot_at_bottom(self, stream_x, color, brightness):
         """Add dot to bottom accumulation"""
         if stream_x not in self.bottom_layer:
             self.bottom_layer[stream_x] = []
@@ -76,11 +108,11 @@ class MicroDotsDripping:
         # Add dot to stack with position based on how many are already there
         stack_height = len(self.bottom_layer[stream_x])
         settled_dot = {
-            'color': dot['color'],
-            'brightness': dot['brightness'],
+            'color': color,
+            'brightness': brightness,
             'y': self.height - 1 - stack_height,
             'age': 0,
-            'drip_chance': random.uniform(0.001, 0.005)  # Chance to drip per frame
+            'drip_chance': self.random.uniform(0.001, 0.005)  # Chance to drip per frame
         }
         
         self.bottom_layer[stream_x].append(settled_dot)
@@ -101,25 +133,13 @@ class MicroDotsDripping:
                     # Chance to drip increases with age
                     drip_chance = dot['drip_chance'] * (1 + dot['age'] * 0.01)
                     
-                    if random.random() < drip_chance:
+                    if self.random.random() < drip_chance:
                         # Remove from bottom layer and create dripping dot
                         dot_stack.remove(dot)
                         
                         # Create a new falling dot that starts from bottom
-                        dripping_dot = {
-                            'y': self.height,
-                            'color': dot['color'],
-                            'brightness': max(100, dot['brightness']),
-                            'speed': random.uniform(0.5, 1.5),
-                            'settled': False,
-                            'is_dripping': True
-                        }
-                        
-                        # Find the stream and add the dripping dot
-                        for stream in self.pixel_streams:
-                            if stream['x'] == stream_x:
-                                stream['dots'].append(dripping_dot)
-                                break
+                        self.new_dots.append((stream_x // 2, self.height, self.random.uniform(0.5, 1.5),
+                                              max(100, dot['brightness']), dot['color'], True))
                         
                         # Reposition remaining dots in stack
                         for i, remaining_dot in enumerate(dot_stack):
@@ -130,42 +150,38 @@ class MicroDotsDripping:
         # Process dripping from bottom accumulation
         self.process_dripping()
         
-        for stream in self.pixel_streams:
+        spawning = []
+        for index, stream in enumerate(self.pixel_streams):
             # Spawn new dots
             if stream['spawn_timer'] <= 0:
-                if random.random() < 0.8:
-                    stream['dots'].append(self.spawn_dot(stream))
-                stream['spawn_timer'] = random.randint(2, 8)
+                if self.random.random() < 0.8:
+                    spawning.append(index)
+                stream['spawn_timer'] = self.random.randint(2, 8)
             else:
                 stream['spawn_timer'] -= 1
-            
-            # Update existing dots
-            for dot in stream['dots'][:]:
-                if not dot['settled']:
-                    dot['y'] += dot['speed']
-                    
-                    # Check if dot hits bottom or accumulated dots
-                    hit_bottom = dot['y'] >= self.height - 1
-                    hit_stack = False
-                    
-                    if stream['x'] in self.bottom_layer and self.bottom_layer[stream['x']]:
-                        top_dot_y = min(d['y'] for d in self.bottom_layer[stream['x']])
-                        hit_stack = dot['y'] >= top_dot_y - 1
-                    
-                    if hit_bottom or hit_stack:
-                        # Settle the dot
-                        if not dot.get('is_dripping', False):  # Don't re-settle dripping dots
-                            self.settle_dot_at_bottom(stream['x'], dot)
-                        stream['dots'].remove(dot)
-                    else:
-                        # Normal fading for falling dots
-                        dot['brightness'] = max(0, dot['brightness'] - 3)
-                        if dot['brightness'] <= 0:
-                            stream['dots'].remove(dot)
-                
-                # Remove dots that drip completely off screen
-                if dot.get('is_dripping', False) and dot['y'] > self.height + 10:
-                    stream['dots'].remove(dot)
+        self.spawn_dots(spawning)
+        self.add_new_dots()
+        
+        # Top of each stream's accumulated stack (inf when empty) and its height
+        top = np.full(len(self.pixel_streams), np.inf)
+        count = np.zeros(len(self.pixel_streams), dtype=np.int64)
+        for stream_x, dot_stack in self.bottom_layer.items():
+            if dot_stack:
+                top[stream_x // 2] = min(d['y'] for d in dot_stack)
+                count[stream_x // 2] = len(dot_stack)
+        
+        # Move every dot; ones hitting the bottom or the stack settle in order (fading the rest)
+        settled, hit = accel.drip_collide(self.dot_stream, self.dot_y, self.dot_speed, self.dot_brightness,
+                                          self.dot_dripping, top, count, self.height, self.height // 3)
+        
+        # Dripping dots aren't re-settled
+        for i in settled:
+            self.settle_dot_at_bottom(self.pixel_streams[self.dot_stream[i]]['x'],
+                                      tuple(self.dot_color[i].tolist()), int(self.dot_brightness[i]))
+        
+        # Remove settled and faded dots, and dots that drip completely off screen
+        self.keep_dots(~hit & (self.dot_brightness > 0) &
+                       ~(self.dot_dripping & (self.dot_y > self.height + 10)))
     
     def draw_frame(self):
         """Draw ultra-tiny dots with dripping effect"""
@@ -183,34 +199,33 @@ class MicroDotsDripping:
                         image.putpixel((stream_x, int(dot['y'])), color)
         
         # Draw falling dots
-        for stream in self.pixel_streams:
-            for dot in stream['dots']:
-                if 0 <= dot['y'] <= self.height + 5:  # Allow dripping dots to show slightly below
-                    x = stream['x']
-                    y = int(dot['y'])
-                    
-                    fade = dot['brightness'] / 255.0
-                    r, g, b = dot['color']
-                    color = (int(r * fade), int(g * fade), int(b * fade))
-                    
-                    # Draw main pixel
-                    if 0 <= x < self.width and 0 <= y < self.height:
-                        image.putpixel((x, y), color)
-                    
-                    # Add slight glow for brighter dots
-                    if dot['brightness'] > 150 and random.random() < 0.3:
-                        for dx, dy in [(1, 0), (-1, 0), (0, 1)]:
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.width and 0 <= ny < self.height:
-                                glow_color = (
-                                    int(r * fade * 0.4),
-                                    int(g * fade * 0.4),
-                                    int(b * fade * 0.4)
-                                )
-                                # Only add glow if pixel is currently black
-                                if image.getpixel((nx, ny)) == (0, 0, 0):
-                                    image.putpixel((nx, ny), glow_color)
-                                break
+        for stream_index, dot_y, brightness, (r, g, b) in zip(self.dot_stream.tolist(), self.dot_y.tolist(),
+                                                            self.dot_brightness.tolist(), self.dot_color.tolist()):
+            if 0 <= dot_y <= self.height + 5:  # Allow dripping dots to show slightly below
+                x = self.pixel_streams[stream_index]['x']
+                y = int(dot_y)
+                
+                fade = brightness / 255.0
+                color = (int(r * fade), int(g * fade), int(b * fade))
+                
+                # Draw main pixel
+                if 0 <= x < self.width and 0 <= y < self.height:
+                    image.putpixel((x, y), color)
+                
+                # Add slight glow for brighter dots
+                if brightness > 150 and self.random.random() < 0.3:
+                    for dx, dy in [(1, 0), (-1, 0), (0, 1)]:
+                        nx, ny = x + dx, y + dy
+                        if 0 <= nx < self.width and 0 <= ny < self.height:
+                            glow_color = (
+                                int(r * fade * 0.4),
+                                int(g * fade * 0.4),
+                                int(b * fade * 0.4)
+                            )
+                            # Only add glow if pixel is currently black
+                            if image.getpixel((nx, ny)) == (0, 0, 0):
+                                image.putpixel((nx, ny), glow_color)
+                            break
         
         return image
     
@@ -224,7 +239,9 @@ class MicroDotsDripping:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(40, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -234,11 +251,11 @@ class MicroDotsDripping:
                 # Status update
                 if frame % 600 == 0:
                     elapsed = time.time() - start_time
-                    falling_dots = sum(len(s['dots']) for s in self.pixel_streams)
+                    falling_dots = len(self.dot_y)
                     accumulated_dots = sum(len(stack) for stack in self.bottom_layer.values())
                     print(f"💧 {elapsed:.1f}s: {falling_dots} falling, {accumulated_dots} accumulated")
                 
-                time.sleep(0.025)  # 40 FPS
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 40 FPS
                 
         except KeyboardInterrupt:
             print(f"\n💧 Dripping dots stopped")
@@ -6,11 +6,12 @@ Very small neon green shapes with blue accents falling densely
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class NeonRain:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("💚 Initializing Neon Rain...")
         
         # Initialize LCD
@@ -24,6 +25,8 @@ class NeonRain:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Tiny symbols and shapes - very small
         self.tiny_shapes = [
             '·', '•', '▪', '▫', '○', '●', '◦', '◯', '⋅', '∘', '∙',
@@ -40,8 +43,8 @@ class NeonRain:
             self.streams.append({
                 'x': x,
                 'particles': [],
-                'spawn_timer': random.randint(0, 10),
-                'color_bias': random.choice(['green', 'blue', 'mixed'])
+                'spawn_timer': self.random.randint(0, 10),
+                'color_bias': self.random.choice(['green', 'blue', 'mixed'])
             })
         
         print(f"💚 Created {len(self.streams)} neon streams")
@@ -50,7 +53,7 @@ class NeonRain:
         """Get neon green or blue color"""
         fade_factor = brightness / 255.0
         
-        if stream_bias == 'green' or (stream_bias == 'mixed' and random.random() < 0.7):
+        if stream_bias == 'green' or (stream_bias == 'mixed' and self.random.random() < 0.7):
             # Neon green variants
             base_colors = [
                 (0, 255, 0),      # Pure neon green
@@ -69,7 +72,7 @@ class NeonRain:
                 (100, 150, 255),  # Purple-blue
             ]
         
-        r, g, b = random.choice(base_colors)
+        r, g, b = self.random.choice(base_colors)
         
         # Apply brightness fade
         return (
@@ -84,13 +87,13 @@ class NeonRain:
             # Spawn new particles frequently for dense effect
             if stream['spawn_timer'] <= 0:
                 stream['particles'].append({
-                    'shape': random.choice(self.tiny_shapes),
-                    'y': random.uniform(-5, -1),
+                    'shape': self.random.choice(self.tiny_shapes),
+                    'y': self.random.uniform(-5, -1),
                     'brightness': 255,
-                    'speed': random.uniform(0.5, 2.5),
-                    'size_var': random.uniform(0.8, 1.2)  # Slight size variation
+                    'speed': self.random.uniform(0.5, 2.5),
+                    'size_var': self.random.uniform(0.8, 1.2)  # Slight size variation
                 })
-                stream['spawn_timer'] = random.randint(3, 12)  # Very frequent
+                stream['spawn_timer'] = self.random.randint(3, 12)  # Very frequent
             else:
                 stream['spawn_timer'] -= 1
             
@@ -125,7 +128,7 @@ class NeonRain:
                     y = int(particle['y'])
                     
                     # For very tiny effect, sometimes just draw pixels instead of text
-                    if random.random() < 0.3:  # 30% chance for pixel dots
+                    if self.random.random() < 0.3:  # 30% chance for pixel dots
                         # Draw tiny pixel cluster (1-2 pixels)
                         size = int(particle['size_var'])
                         for px in range(size):
@@ -153,7 +156,9 @@ class NeonRain:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(33, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -166,7 +171,7 @@ class NeonRain:
                     total_particles = sum(len(s['particles']) for s in self.streams)
                     print(f"💚 {elapsed:.1f}s: {total_particles} neon particles falling")
                 
-                time.sleep(0.03)  # ~33 FPS for smooth neon effect
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # ~33 FPS for smooth neon effect
                 
         except KeyboardInterrupt:
             print(f"\n💚 Neon rain stopped")
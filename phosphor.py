@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Phosphor Buffer - Shared persistence stage for trail effects
+Keeps the previous frame and fades it with one vectorized multiply,
+so effects only draw what is new each frame
+"""
+
+import numpy as np
+from PIL import Image
+
+
+class PhosphorBuffer:
+    def __init__(self, width, height, decay=0.85, background=(0, 0, 0)):
+        self.width = width
+        self.height = height
+        self.background = np.array(background, dtype=np.float32)
+
+        # Previous frame, kept as float so slow decays don't stall on rounding
+        self.buffer = np.empty((height, width, 3), dtype=np.float32)
+        self.set_decay(decay)
+        self.clear()
+
+    def set_decay(self, decay):
+        """Set per-frame decay - one factor or an (r, g, b) tuple"""
+        self.decay = np.broadcast_to(np.asarray(decay, dtype=np.float32), (3,)).copy()
+        # Fading toward the background colour is buffer*decay + bg*(1-decay)
+        self.floor = self.background * (1.0 - self.decay)
+
+    def clear(self):
+        """Reset the buffer to the background colour"""
+        self.buffer[...] = self.background
+
+    def fade(self):
+        """Decay the previous frame before new primitives are drawn"""
+        self.buffer *= self.decay
+        self.buffer += self.floor
+
+    def canvas(self):
+        """Transparent layer for this frame's ImageDraw primitives"""
+        return Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
+
+    def commit(self, layer):
+        """Copy the pixels drawn on a canvas layer into the buffer; returns the frame"""
+        layer = np.asarray(layer)
+        # Only drawn pixels are replaced, so the fading rest keeps its precision
+        drawn = layer[:, :, 3] > 0
+        self.buffer[drawn] = layer[:, :, :3][drawn]
+        return self.to_image()
+
+    def plot(self, xs, ys, colors):
+        """Write points straight into the buffer (clipped to the screen)"""
+        xs = np.asarray(xs, dtype=np.int32)
+        ys = np.asarray(ys, dtype=np.int32)
+        colors = np.asarray(colors, dtype=np.float32)
+
+        visible = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        if colors.ndim == 2:
+            colors = colors[visible]
+        self.buffer[ys[visible], xs[visible]] = colors
+
+    def to_image(self):
+        """Current buffer as a PIL image ready for the LCD"""
+        return Image.fromarray(self.buffer.astype(np.uint8), 'RGB')
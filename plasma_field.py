@@ -8,7 +8,10 @@ import LCD_1in44
 import time
 import random
 import math
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image
+from render_scale import RenderScale
+from frame_pacer import FramePacer
 
 class PlasmaField:
     def __init__(self):
@@ -31,6 +34,11 @@ class PlasmaField:
         
         # Classic 1990s palette generation
         self.palette = self.generate_retro_palette()
+        self.palette_array = np.array(self.palette, dtype=np.uint8)
+        
+        # Smooth plasma survives 64x64 with bilinear upscaling - SIGUSR1 cycles
+        self.render_scale = RenderScale(self.width, self.height, default=2, mode='bilinear')
+        self.render_scale.install_signal_handler()
         
         print(f"🌈 Plasma field initialized")
     
@@ -60,48 +68,47 @@ class PlasmaField:
         return palette
     
     def plasma_function(self, x, y, time):
-        """Calculate plasma value for given coordinates"""
-        # Multiple sine waves for classic plasma effect
-        value = 0
+        """Calculate plasma value for given coordinates (scalars or arrays)"""
+        # Multiple sine waves for classic plasma effect (x and y may be a row and a column)
+        value = np.zeros(np.broadcast(x, y).shape)
         
         # Wave 1 - horizontal movement
-        value += math.sin((x + time * 30) / 16)
+        value += np.sin((x + time * 30) / 16)
         
         # Wave 2 - vertical movement
-        value += math.sin((y + time * 20) / 8)
+        value += np.sin((y + time * 20) / 8)
         
         # Wave 3 - diagonal movement
-        value += math.sin((x + y + time * 25) / 16)
+        value += np.sin((x + y + time * 25) / 16)
         
         # Wave 4 - circular patterns
         cx, cy = self.width // 2, self.height // 2
-        dist = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-        value += math.sin(dist / 8 + time * 15)
+        dist = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
+        value += np.sin(dist / 8 + time * 15)
         
         # Wave 5 - rotating pattern
-        angle = math.atan2(y - cy, x - cx)
-        value += math.sin(angle * 3 + time * 10)
+        angle = np.arctan2(y - cy, x - cx)
+        value += np.sin(angle * 3 + time * 10)
         
         # Normalize to 0-1 range
         return (value + 5) / 10
     
     def draw_frame(self):
         """Draw plasma field"""
-        image = Image.new('RGB', (self.width, self.height), (0, 0, 0))
+        # Calculate plasma for every rendered pixel at once
+        xs, ys = self.render_scale.pixel_coords()
+        plasma_value = self.plasma_function(xs[np.newaxis, :], ys[:, np.newaxis], self.time)
         
-        # Calculate plasma for each pixel
-        for y in range(self.height):
-            for x in range(self.width):
-                # Calculate plasma value
-                plasma_value = self.plasma_function(x, y, self.time)
-                
-                # Map to palette index
-                palette_index = int(plasma_value * 255) % 256
-                color = self.palette[palette_index]
-                
-                # Set pixel
-                image.putpixel((x, y), color)
+        # Map to palette index
+        palette_index = (plasma_value * 255).astype(np.int32) % 256
+        pixels = self.palette_array[palette_index]
         
+        return Image.fromarray(self.render_scale.upscale(pixels), 'RGB')
+    
+    def next_frame(self):
+        """Render the current frame and advance the animation"""
+        image = self.draw_frame()
+        self.time += self.plasma_speed
         return image
     
     def run(self):
@@ -114,20 +121,20 @@ class PlasmaField:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(20, lcd=self.LCD)
             while True:
-                image = self.draw_frame()
+                frame_start = time.perf_counter()
+                image = self.next_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
                 
-                # Update time for animation
-                self.time += self.plasma_speed
                 frame += 1
                 
                 # Status update
                 if frame % 300 == 0:
                     elapsed = time.time() - start_time
-                    print(f"🌈 {elapsed:.1f}s: Plasma time = {self.time:.2f}")
+                    print(f"🌈 {elapsed:.1f}s: Plasma time = {self.time:.2f}, {self.render_scale.status()}")
                 
-                time.sleep(0.05)  # 20 FPS
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 20 FPS
                 
         except KeyboardInterrupt:
             print(f"\n🌈 Plasma field stopped")
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Playlist - Rotate through effects in one process, warming each next one
+Items from playlist.json say which effect to show, for how long (dwell),
+how often (weight) and at what time of day (hours, e.g. "22:00-07:00").
+Effects run in this process on one shared panel. A few seconds before the
+current effect's dwell is up, the next one is picked, constructed and run
+for a few frames on a background thread, so its tables, atlases and
+particle state are built before it goes on screen and its first frame is
+a full-quality one with no start-up stall.
+
+Usage:
+    python3 playlist.py              # Play the playlist
+    python3 playlist.py show         # What can play right now, with weights
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import datetime
+import threading
+
+import effect_registry
+from effect_rng import make_rng
+from frame_pacer import FramePacer
+
+PLAYLIST_FILE = os.environ.get(
+    'M5_PLAYLIST', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'playlist.json'))
+
+DWELL = 120.0        # Seconds per item unless it says otherwise
+PREWARM_LEAD = 5.0   # Seconds before a switch that the next effect starts warming
+WARM_FRAMES = 3      # Frames simulated while warming
+
+# Held while an effect module's LCD_1in44 is swapped for the player's screens
+SCREEN_SWAP = threading.Lock()
+
+
+def parse_hours(hours):
+    """'HH:MM-HH:MM' to (start, end) minutes after midnight; None means all day"""
+    if not hours:
+        return None
+    try:
+        start, end = (int(h) * 60 + int(m) for h, m in (part.split(':') for part in hours.split('-')))
+    except ValueError:
+        raise ValueError(f"Hours must look like '22:00-07:00', not {hours!r}")
+    return start, end
+
+
+def in_hours(window, now):
+    """True if now (a datetime) falls in a (start, end) window, which may wrap past midnight"""
+    if window is None:
+        return True
+    minute = now.hour * 60 + now.minute
+    start, end = window
+    if start <= end:
+        return start <= minute < end
+    return minute >= start or minute < end
+
+
+class Playlist:
+    def __init__(self, items, dwell=DWELL, rng=None):
+        self.rng = rng if rng is not None else make_rng()
+        self.items = []
+        for item in items:
+            info = effect_registry.find(item['effect'])
+            if info is None:
+                raise ValueError(f"Unknown effect in playlist: {item['effect']}")
+            if 'frame' not in info:
+                raise ValueError(f"{info['key']} has no frame steps in effects.json and can't be played")
+            self.items.append({
+                'info': info,
+                'dwell': float(item.get('dwell', dwell)),
+                'weight': float(item.get('weight', 1.0)),
+                'hours': parse_hours(item.get('hours')),
+            })
+        if not self.items:
+            raise ValueError("Playlist is empty")
+
+    def eligible(self, now=None):
+        """Items whose hours include now (all of them if none do)"""
+        now = now or datetime.datetime.now()
+        items = [item for item in self.items if in_hours(item['hours'], now) and item['weight'] > 0]
+        return items or self.items
+
+    def pick(self, now=None, previous=None):
+        """Weighted random choice among the eligible items, not repeating previous if avoidable"""
+        items = self.eligible(now)
+        if len(items) > 1:
+            items = [item for item in items if item is not previous] or items
+        weights = [item['weight'] for item in items]
+        total = sum(weights)
+        if total <= 0:
+            return items[self.rng.integers(len(items))]
+        return items[self.rng.choice(len(items), p=[weight / total for weight in weights])]
+
+
+def load(path=PLAYLIST_FILE, rng=None):
+    """Playlist from path, or every playable effect at equal weight if there is no file"""
+    if not os.path.exists(path):
+        items = [{'effect': info['key']} for info in effect_registry.effects().values()
+                 if 'frame' in info and info['available']]
+        return Playlist(items, rng=rng)
+    with open(path) as f:
+        data = json.load(f)
+    return Playlist(data['items'], data.get('dwell', DWELL), rng)
+
+
+class PlaylistScreen:
+    """What an effect gets for LCD_1in44.LCD() inside the player; only the player draws"""
+
+    def __init__(self, lcd):
+        self.lcd = lcd
+        self.width = lcd.width
+        self.height = lcd.height
+
+    def LCD_Init(self, scan_dir):
+        pass
+
+    def LCD_Clear(self):
+        pass  # The incoming effect's first frame covers the panel
+
+    def LCD_ShowImage(self, image, x_start, y_start):
+        pass  # A warming effect must not draw over the one on screen
+
+    def LCD_ShowRGB565(self, data):
+        pass
+
+    def __getattr__(self, name):
+        # static_frames and the like, for an effect's own pacer
+        return getattr(self.lcd, name)
+
+
+class WarmEffect:
+    """One playlist item's effect, constructed and run a few frames on a background thread"""
+
+    def __init__(self, item, screens, frames=WARM_FRAMES):
+        self.item = item
+        self.info = item['info']
+        self.screens = screens
+        self.frames = frames
+        self.effect = None
+        self.steps = []
+        self.image = None      # Next frame to show; the first is ready when warming ends
+        self.error = None
+        self.seconds = 0.0
+        self.thread = threading.Thread(target=self.build, name=f"warm-{self.info['key']}", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def build(self):
+        start = time.perf_counter()
+        try:
+            effect_class = effect_registry.effect_class(self.info)
+            effect = self.construct(effect_class, sys.modules[self.info['module']])
+            steps = [getattr(effect, name) for name in self.info['frame']]
+            for _ in range(max(1, self.frames)):
+                for step in steps:
+                    image = step()
+            self.effect, self.steps, self.image = effect, steps, image
+        except Exception as e:
+            self.error = e
+        self.seconds = time.perf_counter() - start
+
+    def construct(self, effect_class, module):
+        """effect_class() with the player's screens as module's LCD_1in44, only while it runs"""
+        with SCREEN_SWAP:
+            original = module.LCD_1in44
+            module.LCD_1in44 = self.screens
+            try:
+                return effect_class()
+            finally:
+                module.LCD_1in44 = original
+
+    def wait(self):
+        """Block until warming is done; True if the effect is ready"""
+        self.thread.join()
+        return self.error is None
+
+    def next_frame(self):
+        for step in self.steps:
+            image = step()
+        self.image = image
+
+    def close(self):
+        renderer = getattr(self.effect, 'renderer', None)
+        if renderer:
+            renderer.close()
+
+
+def open_display():
+    """The panel: a display daemon client when one owns it, else the LCD driver"""
+    import display_daemon
+    if display_daemon.daemon_running():
+        return display_daemon.DisplayClient('playlist')
+    import LCD_1in44
+    lcd = LCD_1in44.LCD()
+    lcd.LCD_Init(LCD_1in44.U2D_L2R)
+    return lcd
+
+
+class PlaylistPlayer:
+    def __init__(self, playlist, lcd=None, lead=PREWARM_LEAD, warm_frames=WARM_FRAMES, clock=time):
+        self.playlist = playlist
+        self.lcd = lcd
+        self.lead = lead
+        self.warm_frames = warm_frames
+        self.clock = clock              # time() and sleep(); a fake one in tests
+        self.screens = None
+        self.current = None
+        self.upcoming = None
+        self.played = []                # Effect keys in the order they went on screen
+        self.stalls = 0.0               # Seconds spent waiting on a warm-up at a switch
+
+    def screen_module(self):
+        """LCD_1in44 as effect modules see it in the player: LCD() hands out the shared panel"""
+        import LCD_1in44
+        module = types.ModuleType('LCD_1in44')
+        module.__dict__.update(vars(LCD_1in44))
+        module.LCD = lambda: PlaylistScreen(self.lcd)
+        return module
+
+    def warm(self, previous=None):
+        """Pick the next item and start warming it"""
+        item = self.playlist.pick(previous=previous)
+        return WarmEffect(item, self.screens, self.warm_frames).start()
+
+    def ready(self, warm):
+        """Wait for warm to finish, replacing it until an effect builds"""
+        for _ in range(len(self.playlist.items) + 1):
+            start = time.perf_counter()
+            if warm.wait():
+                self.stalls += time.perf_counter() - start
+                return warm
+            print(f"❌ {warm.info['key']} failed to start: {warm.error}")
+            warm = self.warm(warm.item)
+        raise RuntimeError("No effect in the playlist could start")
+
+    def play(self, warm):
+        """Show warm's effect for its dwell, warming the next one near the end"""
+        until = self.clock.time() + warm.item['dwell']
+        pacer = getattr(warm.effect, 'governor', None) or FramePacer(warm.info['fps'], lcd=self.lcd)
+        self.played.append(warm.info['key'])
+        print(f"🎬 {warm.info['name']} for {warm.item['dwell']:.0f}s (warmed in {warm.seconds * 1000:.0f} ms)")
+        while self.clock.time() < until:
+            frame_start = time.perf_counter()
+            self.lcd.LCD_ShowImage(warm.image, 0, 0)
+            if self.upcoming is None and self.clock.time() >= until - self.lead:
+                self.upcoming = self.warm(warm.item)
+            warm.next_frame()
+            self.clock.sleep(pacer.frame_done(time.perf_counter() - frame_start))
+
+    def run(self, items=None):
+        """Play items (forever if None) until Ctrl+C"""
+        if self.lcd is None:
+            self.lcd = open_display()
+        self.screens = self.screen_module()
+        print(f"🎞️ Playlist of {len(self.playlist.items)} effects")
+        try:
+            self.upcoming = self.warm()
+            while items is None or len(self.played) < items:
+                self.current, self.upcoming = self.ready(self.upcoming), None
+                self.play(self.current)
+                previous, self.current = self.current, None
+                previous.close()
+                if self.upcoming is None:
+                    self.upcoming = self.warm(previous.item)
+        except KeyboardInterrupt:
+            print("\n🎞️ Playlist stopped")
+            self.lcd.LCD_Clear()
+        finally:
+            for warm in (self.current, self.upcoming):
+                if warm is not None:
+                    warm.thread.join()
+                    warm.close()
+
+
+def main():
+    playlist = load()
+    if sys.argv[1:] == ['show']:
+        now = datetime.datetime.now()
+        eligible = playlist.eligible(now)
+        print(f"🎞️ {PLAYLIST_FILE} at {now:%H:%M}")
+        for item in playlist.items:
+            mark = '▶' if item in eligible else ' '
+            hours = '%02d:%02d-%02d:%02d' % (*divmod(item['hours'][0], 60), *divmod(item['hours'][1], 60)) \
+                if item['hours'] else 'all day'
+            print(f" {mark} {item['info']['key']:<22} {item['dwell']:5.0f}s  weight {item['weight']:<4g} {hours}")
+    elif not sys.argv[1:]:
+        PlaylistPlayer(playlist).run()
+    else:
+        print("Usage: python3 playlist.py [show]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Quality Governor - Adaptive quality tied to measured frame time
+Watches a rolling window of frame times and moves an effect's quality
+knob (iterations, particle cap, render resolution) between declared
+levels so the effect holds its target FPS on slow or throttled Pis.
+With a FramePacer it also reacts to temperature, CPU pressure and
+CPUQuota throttling: quality steps down first, FPS only once it can't.
+Given a RenderScale, the governor drops the render resolution once the
+knob is at its cheapest level, and restores it before raising the knob.
+"""
+
+from collections import deque
+
+
+class QualityGovernor:
+    def __init__(self, knob, levels, target_fps, apply, start=None, window=15,
+                 headroom=0.7, pacer=None, render_scale=None):
+        # Levels are ordered cheapest first, richest last
+        self.knob = knob
+        self.levels = list(levels)
+        self.target_fps = target_fps
+        self.frame_budget = 1.0 / target_fps
+        self.apply = apply
+        self.headroom = headroom
+        self.pacer = pacer
+        self.render_scale = render_scale
+        self.coarsened = 0          # Resolution steps taken by the governor, not the user
+
+        self.frame_times = deque(maxlen=window)
+        self.cooldown = 0
+        self.changes = 0
+        self.held = False
+
+        if start is None:
+            start = self.levels[-1]
+        self.level = self.levels.index(start)
+        self.apply(self.value)
+
+    @property
+    def value(self):
+        """Current knob value"""
+        return self.levels[self.level]
+
+    def average_frame_time(self):
+        """Rolling average of work time per frame"""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+
+    def measured_fps(self):
+        """FPS the effect would reach with no sleeping"""
+        average = self.average_frame_time()
+        return 1.0 / average if average > 0 else float(self.target_fps)
+
+    def set_level(self, level):
+        """Move to a level index and tell the effect"""
+        level = max(0, min(len(self.levels) - 1, level))
+        if level != self.level:
+            self.level = level
+            self.changes += 1
+            self.apply(self.value)
+            self.settle()
+
+    def settle(self):
+        """Let a fresh window of frames build up after a change"""
+        self.frame_times.clear()
+        self.cooldown = self.frame_times.maxlen
+
+    def step_resolution(self, coarser):
+        """Move the render scale one step; False if there is nowhere to go"""
+        render_scale = self.render_scale
+        if render_scale is None or (not coarser and not self.coarsened):
+            return False
+        index = render_scale.scales.index(render_scale.scale) + (1 if coarser else -1)
+        if not 0 <= index < len(render_scale.scales):
+            return False
+        render_scale.set_scale(render_scale.scales[index])
+        self.coarsened += 1 if coarser else -1
+        self.changes += 1
+        self.settle()
+        return True
+
+    def hold(self, value):
+        """Pin the knob at value until hold(None), e.g. while frames come from a cache"""
+        if value is None:
+            self.held = False
+            return
+        self.set_level(self.levels.index(value))
+        self.held = True
+
+    def frame_done(self, frame_seconds):
+        """Record one frame's work time; returns how long to sleep"""
+        self.frame_times.append(frame_seconds)
+        # A throttled system shrinks the budget quality is judged against
+        scale = self.pacer.update() if self.pacer else 1.0
+        budget = self.frame_budget * scale
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+        elif not self.held and len(self.frame_times) == self.frame_times.maxlen:
+            average = self.average_frame_time()
+            if average > budget:
+                if self.level > 0 or not self.step_resolution(coarser=True):
+                    self.set_level(self.level - 1)
+            elif average < budget * self.headroom:
+                if not self.step_resolution(coarser=False):
+                    self.set_level(self.level + 1)
+
+        # Nothing on screen is changing: tick slowly until it does
+        if self.pacer and self.pacer.idle():
+            return max(0.0, 1.0 / self.pacer.idle_fps - frame_seconds)
+        # Already at the cheapest level: slow the frame rate instead
+        if self.level == 0 and scale < 1.0:
+            return max(0.0, self.frame_budget / scale - frame_seconds)
+        return max(0.0, self.frame_budget - frame_seconds)
+
+    def status(self):
+        """Telemetry string for status lines"""
+        status = (f"{self.knob}={self.value} [{self.level + 1}/{len(self.levels)}], "
+                  f"{min(self.measured_fps(), 999):.1f}/{self.target_fps} FPS capacity")
+        if self.held:
+            status += ", held"
+        if self.pacer and (self.pacer.scale < 1.0 or self.pacer.idling):
+            status += f", {self.pacer.status()}"
+        return status
@@ -5,35 +5,12 @@ Usage: python3 quick_launch.py [screensaver_number]
 """
 
 import sys
-import os
 import subprocess
 import time
+import effect_registry
 
 # Screensaver mapping
-SCREENSAVERS = {
-    1: 'glyph_rain1_fixed.py',
-    2: 'glyph_rain1.py',
-    3: 'glyph_rain2.py',
-    4: 'glyph_rain3.py',
-    5: 'matrix_binary.py',
-    6: 'neon_rain.py',
-    7: 'glyph_rain4_timer.py',
-    8: 'glyph_rain5_slow.py',
-    9: 'raindrops.py',
-    10: 'heavy_rain.py',
-    11: 'micro_dots.py',
-    12: 'micro_dots_dripping.py',
-    13: 'simple_flames.py',
-    14: 'campfire.py',
-    15: 'retro_geometry.py',
-    16: 'plasma_field.py',
-    17: 'bouncing_balls.py',
-    18: 'kaleidoscope.py',
-    19: 'mandelbrot.py',
-    20: 'julia_set.py',
-    21: 'sierpinski.py',
-    22: 'dragon_curve.py'
-}
+SCREENSAVERS = effect_registry.effects()
 
 def quick_cleanup():
     """Quick targeted cleanup"""
@@ -64,8 +41,8 @@ def launch_screensaver(num):
         print("Available: 1-22")
         return False
     
-    filepath = SCREENSAVERS[num]
-    if not os.path.exists(filepath):
+    filepath = SCREENSAVERS[num]['file']
+    if not SCREENSAVERS[num]['available']:
         print(f"❌ File not found: {filepath}")
         return False
     
@@ -6,11 +6,12 @@ Falling raindrops with water-like appearance and splashing
 
 import LCD_1in44
 import time
-import random
 from PIL import Image, ImageDraw, ImageFont
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class Raindrops:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🌧️ Initializing Raindrops...")
         
         # Initialize LCD
@@ -24,6 +25,8 @@ class Raindrops:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Raindrop streams - less dense than micro dots for realistic effect
         self.raindrop_streams = []
         stream_spacing = 8  # More space between drops
@@ -31,8 +34,8 @@ class Raindrops:
             self.raindrop_streams.append({
                 'x': x,
                 'drops': [],
-                'spawn_timer': random.randint(0, 60),  # Longer delays
-                'wind_offset': random.uniform(-2, 2)  # Slight wind effect
+                'spawn_timer': self.random.randint(0, 60),  # Longer delays
+                'wind_offset': self.random.uniform(-2, 2)  # Slight wind effect
             })
         
         # Water puddles at bottom - where drops collect
@@ -56,13 +59,13 @@ class Raindrops:
     def create_raindrop(self, stream):
         """Create a realistic raindrop"""
         return {
-            'y': random.uniform(-10, -5),
-            'size': random.choice(['small', 'medium', 'large']),
-            'color': random.choice(self.water_colors),
-            'speed': random.uniform(1.5, 4.0),
-            'brightness': random.randint(180, 255),
-            'wind_drift': stream['wind_offset'] * random.uniform(0.5, 1.5),
-            'trail_length': random.randint(3, 8)
+            'y': self.random.uniform(-10, -5),
+            'size': self.random.choice(['small', 'medium', 'large']),
+            'color': self.random.choice(self.water_colors),
+            'speed': self.random.uniform(1.5, 4.0),
+            'brightness': self.random.randint(180, 255),
+            'wind_drift': stream['wind_offset'] * self.random.uniform(0.5, 1.5),
+            'trail_length': self.random.randint(3, 8)
         }
     
     def create_splash(self, x, y, intensity):
@@ -77,14 +80,14 @@ class Raindrops:
         
         # Create splash particles
         for i in range(intensity):
-            angle = random.uniform(0, 3.14159)  # Half circle upward
-            speed = random.uniform(1, 3)
+            angle = self.random.uniform(0, 3.14159)  # Half circle upward
+            speed = self.random.uniform(1, 3)
             splash['particles'].append({
-                'dx': speed * random.uniform(-1, 1),
-                'dy': -speed * random.uniform(0.5, 2),  # Upward motion
-                'life': random.randint(10, 25),
-                'size': random.choice(['tiny', 'small']),
-                'color': random.choice(self.water_colors)
+                'dx': speed * self.random.uniform(-1, 1),
+                'dy': -speed * self.random.uniform(0.5, 2),  # Upward motion
+                'life': self.random.randint(10, 25),
+                'size': self.random.choice(['tiny', 'small']),
+                'color': self.random.choice(self.water_colors)
             })
         
         self.splashes.append(splash)
@@ -109,9 +112,9 @@ class Raindrops:
         for stream in self.raindrop_streams:
             # Spawn new raindrops occasionally
             if stream['spawn_timer'] <= 0:
-                if random.random() < 0.3:  # 30% chance
+                if self.random.random() < 0.3:  # 30% chance
                     stream['drops'].append(self.create_raindrop(stream))
-                stream['spawn_timer'] = random.randint(30, 120)  # Varied timing
+                stream['spawn_timer'] = self.random.randint(30, 120)  # Varied timing
             else:
                 stream['spawn_timer'] -= 1
             
@@ -195,7 +198,7 @@ class Raindrops:
                             if 0 <= px < self.width and 0 <= py < self.height:
                                 image.putpixel((px, py), drop['color'])
                         # Add side pixels occasionally
-                        if random.random() < 0.5:
+                        if self.random.random() < 0.5:
                             for dx in [-1, 1]:
                                 px, py = x + dx, y
                                 if 0 <= px < self.width and 0 <= py < self.height:
@@ -251,7 +254,9 @@ class Raindrops:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(20, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -266,7 +271,7 @@ class Raindrops:
                     puddle_count = len(self.puddles)
                     print(f"🌧️ {elapsed:.1f}s: {total_drops} drops, {active_splashes} splashes, {puddle_count} puddles")
                 
-                time.sleep(0.05)  # 20 FPS for realistic motion
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 20 FPS for realistic motion
                 
         except KeyboardInterrupt:
             print(f"\n🌧️ Rain stopped")
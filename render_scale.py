@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Render Scale - Reduced-resolution rendering with fast integer upscaling
+Effects render at 64x64 or 32x32 into a NumPy array and upscale to the
+panel before RGB565 packing. The scale can be switched at runtime with
+SIGUSR1 (the button switcher sends it) or set with M5_RENDER_SCALE.
+"""
+
+import os
+import signal
+import numpy as np
+
+
+def upscale_nearest(pixels, factor):
+    """Integer nearest-neighbour upscale with np.repeat"""
+    if factor == 1:
+        return pixels
+    return np.repeat(np.repeat(pixels, factor, axis=0), factor, axis=1)
+
+
+def upscale_bilinear(pixels, factor):
+    """Cheap separable bilinear upscale for (H, W) or (H, W, C) arrays"""
+    if factor == 1:
+        return pixels
+
+    def axis_weights(size):
+        # Sample centres of the big grid expressed in small-grid coordinates
+        pos = np.clip((np.arange(size * factor) + 0.5) / factor - 0.5, 0, size - 1)
+        low = np.floor(pos).astype(np.intp)
+        high = np.minimum(low + 1, size - 1)
+        return low, high, (pos - low).astype(np.float32)
+
+    source = pixels.astype(np.float32)
+    extra = (np.newaxis,) * (source.ndim - 2)
+
+    low, high, weight = axis_weights(source.shape[0])
+    weight = weight[(slice(None), np.newaxis) + extra]
+    rows = source[low] * (1 - weight) + source[high] * weight
+
+    low, high, weight = axis_weights(source.shape[1])
+    weight = weight[(np.newaxis, slice(None)) + extra]
+    result = rows[:, low] * (1 - weight) + rows[:, high] * weight
+
+    return result.astype(pixels.dtype) if pixels.dtype == np.uint8 else result
+
+
+class RenderScale:
+    def __init__(self, width, height, default=1, scales=(1, 2, 4), mode='nearest'):
+        self.width = width
+        self.height = height
+        self.scales = tuple(s for s in scales if width % s == 0 and height % s == 0)
+        self.mode = mode
+
+        try:
+            requested = int(os.environ.get('M5_RENDER_SCALE', default))
+        except ValueError:
+            print(f"⚠️ Ignoring M5_RENDER_SCALE={os.environ['M5_RENDER_SCALE']!r}, using {default}")
+            requested = default
+        self.scale = requested if requested in self.scales else self.scales[0]
+
+    @property
+    def render_size(self):
+        """Width and height the effect should render at"""
+        return self.width // self.scale, self.height // self.scale
+
+    def pixel_coords(self):
+        """Panel x and y coordinates of each rendered sample"""
+        return (np.arange(0, self.width, self.scale),
+                np.arange(0, self.height, self.scale))
+
+    def set_scale(self, scale):
+        """Switch render scale (1 = full resolution)"""
+        if scale in self.scales:
+            self.scale = scale
+
+    def cycle(self):
+        """Step to the next supported scale"""
+        index = self.scales.index(self.scale)
+        self.scale = self.scales[(index + 1) % len(self.scales)]
+        print(f"🔍 Render resolution: {self.render_size[0]}x{self.render_size[1]}")
+        return self.scale
+
+    def install_signal_handler(self, signum=signal.SIGUSR1):
+        """Cycle the render scale whenever the process receives SIGUSR1"""
+        signal.signal(signum, lambda signum, frame: self.cycle())
+
+    def upscale(self, pixels):
+        """Upscale a rendered array to panel size"""
+        if self.mode == 'bilinear':
+            return upscale_bilinear(pixels, self.scale)
+        return upscale_nearest(pixels, self.scale)
+
+    def status(self):
+        """Telemetry string for status lines"""
+        width, height = self.render_size
+        return f"render {width}x{height} ({self.mode})"
@@ -6,12 +6,14 @@ Classic geometric shapes with retro colors and animations
 
 import LCD_1in44
 import time
-import random
 import math
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
+from phosphor import PhosphorBuffer
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class RetroGeometry:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("📺 Initializing Retro Geometry...")
         
         # Initialize LCD
@@ -25,6 +27,8 @@ class RetroGeometry:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Classic 1990s color palette
         self.retro_colors = [
             (255, 0, 255),    # Magenta
@@ -48,19 +52,22 @@ class RetroGeometry:
         # Animation time
         self.time = 0
         
+        # CRT-style phosphor persistence - moving shapes leave short afterglow
+        self.phosphor = PhosphorBuffer(self.width, self.height, decay=(0.6, 0.6, 0.65))
+        
         print(f"📺 Retro geometry initialized")
     
     def create_random_shape(self):
         """Create a random geometric shape"""
-        shape_type = random.choice(['circle', 'rectangle', 'triangle', 'line', 'polygon'])
-        color = random.choice(self.retro_colors)
+        shape_type = self.random.choice(['circle', 'rectangle', 'triangle', 'line', 'polygon'])
+        color = self.random.choice(self.retro_colors)
         
         # Random position
-        x = random.randint(0, self.width)
-        y = random.randint(0, self.height)
+        x = self.random.randint(0, self.width)
+        y = self.random.randint(0, self.height)
         
         # Random size
-        size = random.randint(5, 30)
+        size = self.random.randint(5, 30)
         
         shape = {
             'type': shape_type,
@@ -68,15 +75,15 @@ class RetroGeometry:
             'y': y,
             'size': size,
             'color': color,
-            'angle': random.uniform(0, 2 * math.pi),
-            'speed': random.uniform(0.5, 3.0),
-            'rotation_speed': random.uniform(-0.1, 0.1),
-            'direction': random.uniform(0, 2 * math.pi),
-            'life': random.randint(100, 400),
-            'max_life': random.randint(100, 400),
-            'pulse_speed': random.uniform(0.05, 0.2),
-            'width': random.randint(5, 25),
-            'height': random.randint(5, 25)
+            'angle': self.random.uniform(0, 2 * math.pi),
+            'speed': self.random.uniform(0.5, 3.0),
+            'rotation_speed': self.random.uniform(-0.1, 0.1),
+            'direction': self.random.uniform(0, 2 * math.pi),
+            'life': self.random.randint(100, 400),
+            'max_life': self.random.randint(100, 400),
+            'pulse_speed': self.random.uniform(0.05, 0.2),
+            'width': self.random.randint(5, 25),
+            'height': self.random.randint(5, 25)
         }
         
         return shape
@@ -89,7 +96,7 @@ class RetroGeometry:
         self.shapes = [s for s in self.shapes if s['life'] > 0]
         
         # Add new shapes
-        if len(self.shapes) < self.max_shapes and random.random() < 0.1:
+        if len(self.shapes) < self.max_shapes and self.random.random() < 0.1:
             self.shapes.append(self.create_random_shape())
         
         # Update existing shapes
@@ -189,9 +196,10 @@ class RetroGeometry:
     
     def draw_frame(self):
         """Draw the current frame"""
-        # Classic 1990s dark background
-        image = Image.new('RGB', (self.width, self.height), (0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        # Classic 1990s dark background, with last frame's afterglow fading out
+        self.phosphor.fade()
+        layer = self.phosphor.canvas()
+        draw = ImageDraw.Draw(layer)
         
         # Add some retro grid lines occasionally
         if self.time % 200 < 50:  # Show grid periodically
@@ -211,13 +219,13 @@ class RetroGeometry:
             self.draw_shape(draw, shape)
         
         # Add some retro scan lines effect
-        if random.random() < 0.1:
+        if self.random.random() < 0.1:
             for y in range(0, self.height, 4):
-                if random.random() < 0.3:
+                if self.random.random() < 0.3:
                     scan_color = (20, 20, 20)
                     draw.line([(0, y), (self.width, y)], fill=scan_color, width=1)
         
-        return image
+        return self.phosphor.commit(layer)
     
     def run(self):
         """Main animation loop"""
@@ -229,7 +237,9 @@ class RetroGeometry:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(17, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update_shapes()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -242,7 +252,7 @@ class RetroGeometry:
                     active_shapes = len(self.shapes)
                     print(f"📺 {elapsed:.1f}s: {active_shapes} geometric shapes active")
                 
-                time.sleep(0.06)  # ~17 FPS for classic feel
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # ~17 FPS for classic feel
                 
         except KeyboardInterrupt:
             print(f"\n📺 Retro geometry stopped")
@@ -1,166 +1,24 @@
 #!/usr/bin/env python3
 """
 Waveshare 1.44" LCD HAT Screensavers
-A collection of 22 animated screensavers for the Waveshare 1.44" LCD HAT
+A collection of animated screensavers for the Waveshare 1.44" LCD HAT
 
 Usage:
     python3 screensaver_launcher.py                    # Show menu
-    python3 screensaver_launcher.py random             # Run random screensaver
+    python3 screensaver_launcher.py random             # Rotate through the playlist
     python3 screensaver_launcher.py <screensaver_name> # Run specific screensaver
     python3 screensaver_launcher.py list               # List all screensavers
 """
 
 import sys
-import random
 import time
 import subprocess
-import os
+import effect_registry
 
 class ScreensaverLauncher:
     def __init__(self):
-        self.screensavers = {
-            # Matrix/Rain Effects
-            'glyph_rain1': {
-                'file': 'glyph_rain1.py',
-                'name': 'Classic Matrix Rain',
-                'description': 'Green falling characters in Matrix style',
-                'category': 'Matrix/Rain'
-            },
-            'glyph_rain2': {
-                'file': 'glyph_rain2.py', 
-                'name': 'Blue Matrix Rain',
-                'description': 'Blue matrix theme with faster movement',
-                'category': 'Matrix/Rain'
-            },
-            'glyph_rain3': {
-                'file': 'glyph_rain3.py',
-                'name': 'Rainbow Matrix Rain', 
-                'description': 'Rainbow colored matrix with shifting hues',
-                'category': 'Matrix/Rain'
-            },
-            'matrix_binary': {
-                'file': 'matrix_binary.py',
-                'name': 'Binary Matrix',
-                'description': 'Matrix with 1s, 0s and Japanese symbols',
-                'category': 'Matrix/Rain'
-            },
-            'neon_rain': {
-                'file': 'neon_rain.py',
-                'name': 'Neon Rain',
-                'description': 'Tiny neon shapes in green and blue',
-                'category': 'Matrix/Rain'
-            },
-            
-            # Timer/Accumulation Effects
-            'timer_medium': {
-                'file': 'glyph_rain4_timer.py',
-                'name': 'Medium Timer',
-                'description': 'Characters accumulate over several hours',
-                'category': 'Timer'
-            },
-            'timer_slow': {
-                'file': 'glyph_rain5_slow.py',
-                'name': 'All-Day Timer',
-                'description': 'Very slow accumulation for 8+ hour periods',
-                'category': 'Timer'
-            },
-            
-            # Water Effects
-            'raindrops': {
-                'file': 'raindrops.py',
-                'name': 'Raindrops',
-                'description': 'Realistic rain with splashes and puddles',
-                'category': 'Water'
-            },
-            'heavy_rain': {
-                'file': 'heavy_rain.py',
-                'name': 'Heavy Rain',
-                'description': 'Intense downpour with flooding',
-                'category': 'Water'
-            },
-            
-            # Micro Particles
-            'micro_dots': {
-                'file': 'micro_dots.py',
-                'name': 'Micro Dots',
-                'description': 'Ultra-tiny pixel dots at maximum density',
-                'category': 'Particles'
-            },
-            'micro_drip': {
-                'file': 'micro_dots_dripping.py',
-                'name': 'Dripping Dots',
-                'description': 'Dots that accumulate and drip through bottom',
-                'category': 'Particles'
-            },
-            
-            # Fire Effects
-            'simple_flames': {
-                'file': 'simple_flames.py',
-                'name': 'Simple Flames',
-                'description': 'Simple stable flame effect',
-                'category': 'Fire'
-            },
-            'campfire': {
-                'file': 'campfire.py',
-                'name': 'Campfire',
-                'description': 'Cozy flickering campfire',
-                'category': 'Fire'
-            },
-            
-            # 1990s Retro
-            'retro_geometry': {
-                'file': 'retro_geometry.py',
-                'name': 'Retro Geometry',
-                'description': 'Classic 1990s geometric shapes',
-                'category': 'Retro'
-            },
-            'plasma_field': {
-                'file': 'plasma_field.py',
-                'name': 'Plasma Field',
-                'description': 'Mathematical plasma effect',
-                'category': 'Retro'
-            },
-            'bouncing_balls': {
-                'file': 'bouncing_balls.py',
-                'name': 'Bouncing Balls',
-                'description': 'Classic bouncing balls with trails',
-                'category': 'Retro'
-            },
-            
-            # Visual Effects
-            'kaleidoscope': {
-                'file': 'kaleidoscope.py',
-                'name': 'Kaleidoscope',
-                'description': 'Symmetrical rotating patterns',
-                'category': 'Visual'
-            },
-            
-            # Fractals
-            'mandelbrot': {
-                'file': 'mandelbrot.py',
-                'name': 'Mandelbrot Set',
-                'description': 'Classic fractal with zooming animation',
-                'category': 'Fractals'
-            },
-            'julia_set': {
-                'file': 'julia_set.py',
-                'name': 'Julia Set',
-                'description': 'Dynamic Julia sets with morphing parameters',
-                'category': 'Fractals'
-            },
-            'sierpinski': {
-                'file': 'sierpinski.py',
-                'name': 'Sierpinski Triangle',
-                'description': 'Fractal generation using chaos game',
-                'category': 'Fractals'
-            },
-            'dragon_curve': {
-                'file': 'dragon_curve.py',
-                'name': 'Dragon Curve',
-                'description': 'L-system fractal with growing complexity',
-                'category': 'Fractals'
-            }
-        }
+        # Keyed by effect name; metadata only, nothing is imported until it runs
+        self.screensavers = {info['key']: info for info in effect_registry.effects().values()}
     
     def show_menu(self):
         """Display interactive menu"""
@@ -170,23 +28,15 @@ class ScreensaverLauncher:
         print(f"📊 Total screensavers available: {len(self.screensavers)}")
         print()
         
-        # Group by category
-        categories = {}
-        for key, info in self.screensavers.items():
-            cat = info['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append((key, info))
-        
         # Display by category
-        for category, items in categories.items():
+        for category, items in effect_registry.categories().items():
             print(f"📁 {category.upper()}:")
-            for key, info in items:
-                print(f"   {key:<15} - {info['name']}")
+            for info in items:
+                print(f"   {info['key']:<19} - {info['name']}")
             print()
         
         print("COMMANDS:")
-        print("   random                    - Run random screensaver")
+        print("   random                    - Rotate through the playlist")
         print("   list                      - List all screensavers") 
         print("   <screensaver_name>        - Run specific screensaver")
         print("   help                      - Show this menu")
@@ -205,7 +55,7 @@ class ScreensaverLauncher:
             elif choice == 'help':
                 self.show_menu()
                 break
-            elif choice in self.screensavers:
+            elif effect_registry.find(choice):
                 self.run_screensaver(choice)
                 break
             else:
@@ -218,26 +68,28 @@ class ScreensaverLauncher:
         print("-" * 50)
         
         for key, info in sorted(self.screensavers.items()):
-            print(f"{key:<15} - {info['name']}")
-            print(f"{'':>15}   {info['description']}")
+            print(f"{key:<19} - {info['name']}")
+            print(f"{'':>19}   {info['description']} ({info['fps']} FPS, {info['cost']})")
             print()
     
     def run_random(self):
-        """Run a random screensaver"""
-        choice = random.choice(list(self.screensavers.keys()))
-        print(f"🎲 Randomly selected: {choice}")
-        self.run_screensaver(choice)
+        """Rotate through playlist.json, warming each next screensaver in the background"""
+        # Imported here: the playlist loads effect modules, the menu doesn't
+        import playlist
+        print("🎲 Rotating through the playlist (python3 playlist.py show to see it)")
+        playlist.PlaylistPlayer(playlist.load()).run()
     
     def run_screensaver(self, name):
         """Run specific screensaver"""
-        if name not in self.screensavers:
+        # Names, old aliases (timer_medium, micro_drip...) and menu numbers all resolve
+        info = effect_registry.find(name)
+        if info is None or info['key'] not in self.screensavers:
             print(f"❌ Screensaver '{name}' not found")
             return
         
-        info = self.screensavers[name]
-        filepath = info['file']
+        filepath = info['path']
         
-        if not os.path.exists(filepath):
+        if not info['available']:
             print(f"❌ File not found: {filepath}")
             return
         
@@ -268,7 +120,7 @@ def main():
             launcher.list_screensavers()
         elif command in ['help', '--help', '-h']:
             launcher.show_menu()
-        elif command in launcher.screensavers:
+        elif effect_registry.find(command):
             launcher.run_screensaver(command)
         else:
             print(f"❌ Unknown command: {command}")
@@ -9,180 +9,13 @@ import os
 import subprocess
 import time
 import signal
+import gpio_cleanup
+import effect_registry
 
 class ScreensaverManager:
     def __init__(self):
-        self.screensavers = {
-            # Matrix/Rain Effects - Fixed and Original
-            1: {
-                'file': 'glyph_rain1_fixed.py',
-                'name': 'Fixed Matrix Rain (Stable)',
-                'description': 'Memory-leak-free classic matrix rain - RECOMMENDED',
-                'category': 'Matrix/Rain',
-                'stability': '🟢 STABLE'
-            },
-            2: {
-                'file': 'glyph_rain1.py',
-                'name': 'Classic Matrix Rain (Original)',
-                'description': 'Original green falling characters - may have memory leaks',
-                'category': 'Matrix/Rain',
-                'stability': '🟡 ORIGINAL'
-            },
-            3: {
-                'file': 'glyph_rain2.py', 
-                'name': 'Blue Matrix Rain',
-                'description': 'Blue matrix theme with faster movement',
-                'category': 'Matrix/Rain',
-                'stability': '🟡 ORIGINAL'
-            },
-            4: {
-                'file': 'glyph_rain3.py',
-                'name': 'Rainbow Matrix Rain', 
-                'description': 'Rainbow colored matrix with shifting hues',
-                'category': 'Matrix/Rain',
-                'stability': '🟡 ORIGINAL'
-            },
-            5: {
-                'file': 'matrix_binary.py',
-                'name': 'Binary Matrix',
-                'description': 'Matrix with 1s, 0s and Japanese symbols',
-                'category': 'Matrix/Rain',
-                'stability': '🟡 ORIGINAL'
-            },
-            6: {
-                'file': 'neon_rain.py',
-                'name': 'Neon Rain',
-                'description': 'Tiny neon shapes in green and blue',
-                'category': 'Matrix/Rain',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # Timer/Accumulation Effects
-            7: {
-                'file': 'glyph_rain4_timer.py',
-                'name': 'Medium Timer Rain',
-                'description': 'Characters accumulate over several hours',
-                'category': 'Timer',
-                'stability': '🟡 ORIGINAL'
-            },
-            8: {
-                'file': 'glyph_rain5_slow.py',
-                'name': 'All-Day Timer Rain',
-                'description': 'Very slow accumulation for 8+ hour periods',
-                'category': 'Timer',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # Water Effects
-            9: {
-                'file': 'raindrops.py',
-                'name': 'Raindrops',
-                'description': 'Realistic rain with splashes and puddles',
-                'category': 'Water',
-                'stability': '🟡 ORIGINAL'
-            },
-            10: {
-                'file': 'heavy_rain.py',
-                'name': 'Heavy Rain',
-                'description': 'Intense downpour with flooding',
-                'category': 'Water',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # Micro Particles
-            11: {
-                'file': 'micro_dots.py',
-                'name': 'Micro Dots',
-                'description': 'Ultra-tiny pixel dots at maximum density',
-                'category': 'Particles',
-                'stability': '🟡 ORIGINAL'
-            },
-            12: {
-                'file': 'micro_dots_dripping.py',
-                'name': 'Dripping Dots',
-                'description': 'Dots that accumulate and drip through bottom',
-                'category': 'Particles',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # Fire Effects
-            13: {
-                'file': 'simple_flames.py',
-                'name': 'Simple Flames',
-                'description': 'Simple stable flame effect',
-                'category': 'Fire',
-                'stability': '🟡 ORIGINAL'
-            },
-            14: {
-                'file': 'campfire.py',
-                'name': 'Campfire',
-                'description': 'Cozy flickering campfire',
-                'category': 'Fire',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # 1990s Retro
-            15: {
-                'file': 'retro_geometry.py',
-                'name': 'Retro Geometry',
-                'description': 'Classic 1990s geometric shapes',
-                'category': 'Retro',
-                'stability': '🟡 ORIGINAL'
-            },
-            16: {
-                'file': 'plasma_field.py',
-                'name': 'Plasma Field',
-                'description': 'Mathematical plasma effect',
-                'category': 'Retro',
-                'stability': '🟡 ORIGINAL'
-            },
-            17: {
-                'file': 'bouncing_balls.py',
-                'name': 'Bouncing Balls',
-                'description': 'Classic bouncing balls with trails',
-                'category': 'Retro',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # Visual Effects
-            18: {
-                'file': 'kaleidoscope.py',
-                'name': 'Kaleidoscope',
-                'description': 'Symmetrical rotating patterns',
-                'category': 'Visual',
-                'stability': '🟡 ORIGINAL'
-            },
-            
-            # Fractals
-            19: {
-                'file': 'mandelbrot.py',
-                'name': 'Mandelbrot Set',
-                'description': 'Classic fractal with zooming animation',
-                'category': 'Fractals',
-                'stability': '🟡 ORIGINAL'
-            },
-            20: {
-                'file': 'julia_set.py',
-                'name': 'Julia Set',
-                'description': 'Dynamic Julia sets with morphing parameters',
-                'category': 'Fractals',
-                'stability': '🟡 ORIGINAL'
-            },
-            21: {
-                'file': 'sierpinski.py',
-                'name': 'Sierpinski Triangle',
-                'description': 'Fractal generation using chaos game',
-                'category': 'Fractals',
-                'stability': '🟡 ORIGINAL'
-            },
-            22: {
-                'file': 'dragon_curve.py',
-                'name': 'Dragon Curve',
-                'description': 'L-system fractal with growing complexity',
-                'category': 'Fractals',
-                'stability': '🟡 ORIGINAL'
-            }
-        }
+        # Effect metadata comes from effects.json; no effect module is imported here
+        self.screensavers = effect_registry.effects()
         
         # Service management options
         self.service_options = {
@@ -210,6 +43,16 @@ class ScreensaverManager:
                 'action': 'cleanup_gpio_standalone',
                 'name': 'Fix GPIO Conflicts',
                 'description': 'Stop all screensavers and clear GPIO locks'
+            },
+            95: {
+                'action': 'start_display_daemon',
+                'name': 'Start Display Daemon',
+                'description': 'Open the LCD once; effects launch and switch without GPIO cleanup'
+            },
+            96: {
+                'action': 'stop_display_daemon',
+                'name': 'Stop Display Daemon',
+                'description': 'Hand the LCD back to standalone effects'
             }
         }
         
@@ -248,6 +91,26 @@ class ScreensaverManager:
                 'action': 'run_background_buttons',
                 'name': 'Background Button Switcher',
                 'description': 'Run button switcher in background'
+            },
+            53: {
+                'action': 'record_loop',
+                'name': 'Record Animation Loop',
+                'description': 'Pre-bake a few seconds of an effect into a loop clip'
+            },
+            54: {
+                'action': 'play_loop',
+                'name': 'Play Recorded Loop',
+                'description': 'Play a recorded loop with near-zero CPU'
+            },
+            55: {
+                'action': 'build_julia_atlas',
+                'name': 'Build Julia Atlas',
+                'description': 'Precompute the Julia set sweep so it runs on palette lookups'
+            },
+            56: {
+                'action': 'set_random_seed',
+                'name': 'Set Random Seed',
+                'description': 'Replay effects identically (for benchmarking)'
             }
         }
 
@@ -304,62 +167,40 @@ class ScreensaverManager:
             print(f"🔧 Stability: {info['stability']}")
             print(f"📝 Description: {info['description']}")
             print(f"📄 File: {info['file']}")
-            print(f"📍 Status: {'✅ Available' if os.path.exists(info['file']) else '❌ File missing'}")
+            print(f"🎞️ Target: {info['fps']} FPS, {info['cost']} render cost")
+            print(f"📍 Status: {'✅ Available' if info['available'] else '❌ File missing'}")
             print()
 
     def cleanup_gpio_conflicts(self):
         """Clean up GPIO conflicts before starting screensavers"""
-        print("🧹 Cleaning up GPIO conflicts...")
+        import display_daemon  # Pulls in NumPy, so only once the menu is up and in use
+        # The display daemon owns the pins; effects connect to it instead
+        if display_daemon.daemon_running():
+            print("🖥️ Display daemon owns the LCD - no GPIO cleanup needed")
+            return
         
-        # Get current process info to avoid killing ourselves
-        current_pid = os.getpid()
+        print("🧹 Cleaning up GPIO conflicts...")
         
         # Kill specific conflicting processes but avoid the manager
         processes = ['glyph_rain', 'matrix_', 'micro_dots', 'flames', 'plasma', 
                     'bouncing', 'kaleidoscope', 'raindrops', 'neon_rain', 'mandelbrot',
                     'julia_set', 'sierpinski', 'dragon_curve', 'campfire', 'retro_geometry',
-                    'simple_button_switcher', 'button_screensaver']
-        
-        for process in processes:
-            try:
-                # Use pgrep to get PIDs first, then filter out our own process
-                result = subprocess.run(['pgrep', '-f', process], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.stdout.strip():
-                    pids = result.stdout.strip().split('\n')
-                    for pid in pids:
-                        try:
-                            if int(pid) != current_pid:  # Don't kill ourselves
-                                subprocess.run(['kill', pid], capture_output=True, timeout=2)
-                                print(f"  🔄 Stopped {process} (PID: {pid})")
-                        except (ValueError, subprocess.TimeoutExpired):
-                            pass
-            except subprocess.TimeoutExpired:
-                pass
-            except Exception:
-                pass
+                    'simple_button_switcher', 'button_screensaver', 'frame_clip', 'playlist']
         
         # Stop conflicting services  
         services = ['lcd-stable.service', 'lcd-glyph-locked.service', 
                    'lcd-button-switcher.service', 'lcd-random.service']
         
-        for service in services:
-            try:
-                result = subprocess.run(['sudo', 'systemctl', 'stop', service], 
-                                      capture_output=True, timeout=10)
-                if result.returncode == 0:
-                    print(f"  🛑 Stopped {service}")
-            except subprocess.TimeoutExpired:
-                pass
-            except Exception:
-                pass
-        
-        # Wait for GPIO release
-        time.sleep(1)
+        # One /proc scan, direct signals, one systemctl call; returns once the pins are free
+        report = gpio_cleanup.release_gpio(processes, services)
+        if report['busy_lines']:
+            print("⚠️ Some GPIO lines are still in use")
+            return
         print("✅ GPIO cleanup complete")
 
     def run_screensaver(self, choice, test_mode=False, duration=None):
         """Run a specific screensaver"""
+        import display_daemon
         if choice not in self.screensavers:
             print(f"❌ Invalid screensaver number: {choice}")
             return False
@@ -367,7 +208,7 @@ class ScreensaverManager:
         info = self.screensavers[choice]
         filepath = info['file']
         
-        if not os.path.exists(filepath):
+        if not info['available']:
             print(f"❌ File not found: {filepath}")
             return False
         
@@ -385,10 +226,15 @@ class ScreensaverManager:
         
         print("-" * 60)
         
+        # Route the effect's frames through the display daemon when it is up
+        command = ['python3', filepath]
+        if display_daemon.daemon_running():
+            command = ['python3', 'display_daemon.py', 'run', filepath]
+        
         try:
             if test_mode and duration:
                 # Use timeout for test mode
-                result = subprocess.run(['timeout', f'{duration}s', 'python3', filepath], 
+                result = subprocess.run(['timeout', f'{duration}s'] + command, 
                                       capture_output=False)
                 if result.returncode == 124:  # timeout exit code
                     print(f"\n✅ {duration}-second test completed successfully!")
@@ -396,7 +242,7 @@ class ScreensaverManager:
                     print(f"\n⚠️  Test ended with exit code: {result.returncode}")
             else:
                 # Normal run
-                subprocess.run(['python3', filepath])
+                subprocess.run(command)
                 
         except KeyboardInterrupt:
             print(f"\n✅ Screensaver stopped by user")
@@ -514,7 +360,7 @@ WantedBy=multi-user.target"""
             subprocess.run(['sudo', 'systemctl', 'start', 'lcd-random.service'], check=True)
             
             print("✅ Random screensaver service installed and started!")
-            print("   Note: May experience memory issues with some screensavers")
+            print("   Effects rotate by playlist.json (dwell, weights, hours)")
             
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to setup service: {e}")
@@ -716,6 +562,51 @@ WantedBy=multi-user.target"""
         
         print("\n🔌 GPIO pins should now be available for new screensavers!")
 
+    def start_display_daemon(self):
+        """Start the display daemon in the background"""
+        import display_daemon
+        print("\n🖥️ START DISPLAY DAEMON")
+        print("="*40)
+        
+        if display_daemon.daemon_running():
+            print(f"✅ Already running on {display_daemon.SOCKET_PATH}")
+            return
+        
+        # Last time the pins need clearing: the daemon keeps them from here on
+        self.cleanup_gpio_conflicts()
+        
+        log_file = '/tmp/m5-display.log'
+        try:
+            with open(log_file, 'a') as log:
+                subprocess.Popen(['python3', 'display_daemon.py', 'serve'],
+                               stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+        except Exception as e:
+            print(f"❌ Error starting display daemon: {e}")
+            return
+        
+        # Wait for the socket rather than a fixed sleep
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            if display_daemon.daemon_running():
+                print(f"✅ Display daemon ready on {display_daemon.SOCKET_PATH}")
+                print("   Screensavers now launch through it without GPIO cleanup")
+                return
+            time.sleep(0.1)
+        print(f"❌ Display daemon did not start - see {log_file}")
+
+    def stop_display_daemon(self):
+        """Stop the display daemon"""
+        import display_daemon
+        if not display_daemon.daemon_running():
+            print("ℹ️ Display daemon is not running")
+            return
+        
+        display_daemon.request(display_daemon.QUIT)
+        deadline = time.time() + 5
+        while display_daemon.daemon_running() and time.time() < deadline:
+            time.sleep(0.1)
+        print("✅ Display daemon stopped")
+
     def run_background_launcher(self):
         """Show background launcher menu"""
         print("\n🔄 BACKGROUND MODE - Survive Terminal Closing")
@@ -777,6 +668,104 @@ WantedBy=multi-user.target"""
         except Exception as e:
             print(f"❌ Error starting background button switcher: {e}")
 
+    def record_loop(self):
+        """Record an effect into a pre-baked loop clip"""
+        print("\n🔴 RECORD ANIMATION LOOP")
+        print("="*50)
+        print("Periodic effects can be recorded once and played back")
+        print("forever from the clip instead of recomputing every frame.")
+        print()
+        
+        import frame_clip
+        effects = list(frame_clip.RECORDABLE)
+        for i, name in enumerate(effects, 1):
+            print(f"   {i}) {name}")
+        print()
+        
+        try:
+            choice = int(input("Effect to record (or 0 to cancel): ").strip())
+            if choice == 0:
+                return
+            if not 1 <= choice <= len(effects):
+                raise IndexError(choice)  # 0 cancels; negatives would index from the end
+            effect_name = effects[choice - 1]
+            seconds = float(input("Seconds to record [20]: ").strip() or 20)
+        except (ValueError, IndexError):
+            print("❌ Invalid choice")
+            return
+        
+        self.cleanup_gpio_conflicts()
+        
+        try:
+            subprocess.run(['python3', 'frame_clip.py', 'record', effect_name, str(seconds)])
+        except KeyboardInterrupt:
+            print("\n✅ Recording stopped")
+
+    def play_loop(self):
+        """Play a recorded loop clip"""
+        import frame_clip
+        clips = frame_clip.list_clips()
+        if not clips:
+            print("   Use option 53 to record one first")
+            return
+        print()
+        
+        for i, name in enumerate(clips, 1):
+            print(f"   {i}) {name}")
+        
+        try:
+            choice = int(input("Clip to play (or 0 to cancel): ").strip())
+            if choice == 0:
+                return
+            if not 1 <= choice <= len(clips):
+                raise IndexError(choice)  # 0 cancels; negatives would index from the end
+            clip = os.path.join(frame_clip.CLIP_DIR, clips[choice - 1])
+        except (ValueError, IndexError):
+            print("❌ Invalid choice")
+            return
+        
+        self.cleanup_gpio_conflicts()
+        
+        try:
+            subprocess.run(['python3', 'frame_clip.py', 'play', clip])
+        except KeyboardInterrupt:
+            print("\n✅ Playback stopped")
+
+    def build_julia_atlas(self):
+        """Precompute the Julia parameter atlas"""
+        print("\n🗺️ BUILD JULIA ATLAS")
+        print("="*50)
+        print("Renders every frame of the Julia set's parameter sweep once,")
+        print("so the effect only does palette lookups afterwards.")
+        print()
+        
+        try:
+            samples = int(input("Path samples [2048]: ").strip() or 2048)
+        except ValueError:
+            print("❌ Invalid choice")
+            return
+        
+        try:
+            subprocess.run(['python3', 'julia_atlas.py', 'build', str(samples)])
+        except KeyboardInterrupt:
+            print("\n⚠️ Atlas build cancelled")
+
+    def set_random_seed(self):
+        """Seed the random streams of effects launched from this menu"""
+        import effect_rng
+        current = os.environ.get(effect_rng.SEED_ENV)
+        print(f"\n🎲 Random seed: {current if current else 'off (fresh each run)'}")
+        
+        seed = input("New seed (blank to turn off): ").strip()
+        if not seed:
+            os.environ.pop(effect_rng.SEED_ENV, None)
+            print("✅ Effects will use a fresh seed each run")
+        elif seed.isdigit():
+            os.environ[effect_rng.SEED_ENV] = seed
+            print(f"✅ Effects launched from here will replay seed {seed}")
+        else:
+            print("❌ Seed must be a whole number")
+
     def run_interactive_menu(self):
         """Main interactive menu loop"""
         while True:
@@ -837,9 +826,27 @@ WantedBy=multi-user.target"""
                 elif choice_num == 52:
                     self.run_background_buttons()
                 
+                elif choice_num == 53:
+                    self.record_loop()
+                
+                elif choice_num == 54:
+                    self.play_loop()
+                
+                elif choice_num == 55:
+                    self.build_julia_atlas()
+                
+                elif choice_num == 56:
+                    self.set_random_seed()
+                
                 elif choice_num == 94:
                     self.cleanup_gpio_standalone()
                 
+                elif choice_num == 95:
+                    self.start_display_daemon()
+                
+                elif choice_num == 96:
+                    self.stop_display_daemon()
+                
                 else:
                     print(f"❌ Invalid choice: {choice_num}")
                     
@@ -6,12 +6,16 @@ Animated Sierpinski triangle with chaos game algorithm
 
 import LCD_1in44
 import time
-import random
 import math
-from PIL import Image
+import numpy as np
+from phosphor import PhosphorBuffer
+from quality_governor import QualityGovernor
+from frame_pacer import FramePacer
+import accel
+from effect_rng import EffectRandom
 
 class SierpinskiTriangle:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🔺 Initializing Sierpinski Triangle...")
         
         # Initialize LCD
@@ -25,6 +29,8 @@ class SierpinskiTriangle:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Triangle vertices
         margin = 10
         self.vertices = [
@@ -35,8 +41,20 @@ class SierpinskiTriangle:
         
         # Chaos game state
         self.current_point = (self.width // 2, self.height // 2)
-        self.points = []
-        self.max_points = 8000
+        self.new_points = []  # (x, y, vertex) arrays generated since the last frame
+        self.points_per_frame = 50
+        self.total_points = 0
+        
+        # Chaos game steps per frame adapt to hold the target FPS
+        self.governor = QualityGovernor('points_per_frame', [10, 20, 35, 50, 75, 100, 150],
+                                        target_fps=33, apply=self.set_points_per_frame,
+                                        start=self.points_per_frame,
+                                        pacer=FramePacer(33, lcd=self.LCD))
+        
+        # Old points fade in the phosphor instead of being aged one by one
+        self.background = (0, 0, 20)
+        self.phosphor = PhosphorBuffer(self.width, self.height, decay=0.985,
+                                       background=self.background)
         
         # Animation parameters
         self.rotation_angle = 0
@@ -55,6 +73,10 @@ class SierpinskiTriangle:
         
         print(f"🔺 Sierpinski triangle ready")
     
+    def set_points_per_frame(self, points_per_frame):
+        """Quality knob: particle cap per frame"""
+        self.points_per_frame = points_per_frame
+    
     def rotate_point(self, point, center, angle):
         """Rotate a point around center by angle"""
         cos_a = math.cos(angle)
@@ -71,40 +93,25 @@ class SierpinskiTriangle:
         # Translate back
         return (new_x + center[0], new_y + center[1])
     
-    def chaos_game_step(self):
-        """Perform one step of the chaos game algorithm"""
-        # Choose random vertex
-        vertex = random.choice(self.vertices)
-        
-        # Move halfway to the chosen vertex
-        new_x = (self.current_point[0] + vertex[0]) / 2
-        new_y = (self.current_point[1] + vertex[1]) / 2
-        
-        self.current_point = (new_x, new_y)
-        
-        # Add point to collection with color info
-        point_data = {
-            'x': int(new_x),
-            'y': int(new_y),
-            'age': 0,
-            'vertex_index': self.vertices.index(vertex)
-        }
-        
-        self.points.append(point_data)
-        
-        # Remove old points
-        if len(self.points) > self.max_points:
-            self.points.pop(0)
+    def chaos_game_step(self, steps=1):
+        """Perform steps of the chaos game algorithm"""
+        # Choose random vertices, then move halfway to each in turn
+        choices = self.random.randrange(len(self.vertices), steps)
+        vertex_x = np.array([v[0] for v in self.vertices], dtype=np.float64)
+        vertex_y = np.array([v[1] for v in self.vertices], dtype=np.float64)
+        xs, ys = accel.chaos_game(float(self.current_point[0]), float(self.current_point[1]),
+                                  vertex_x, vertex_y, choices)
+        
+        self.current_point = (xs[-1], ys[-1])
+        
+        # Queue points for drawing with color info
+        self.new_points.append(np.column_stack((xs.astype(np.int32), ys.astype(np.int32), choices)))
+        self.total_points += steps
     
     def update(self):
         """Update fractal generation and animation"""
         # Generate multiple points per frame for faster filling
-        for _ in range(50):
-            self.chaos_game_step()
-        
-        # Age all points
-        for point in self.points:
-            point['age'] += 1
+        self.chaos_game_step(self.points_per_frame)
         
         # Update animation parameters
         self.rotation_angle += self.rotation_speed
@@ -122,54 +129,31 @@ class SierpinskiTriangle:
     
     def draw_frame(self):
         """Draw Sierpinski triangle"""
-        image = Image.new('RGB', (self.width, self.height), (0, 0, 20))
+        # Fade everything drawn so far, then add only this frame's points
+        self.phosphor.fade()
+        
+        if self.new_points:
+            points = np.concatenate(self.new_points).astype(np.int32)
+            vertex_index = points[:, 2]
+            base_colors = np.array(self.sierpinski_colors, dtype=np.float32)[vertex_index]
+            
+            # Add time-based color variation
+            color_shift = np.sin(self.color_time + vertex_index) * 0.3
+            colors = np.clip(base_colors * (1 + color_shift)[:, None], 0, 255)
+            
+            self.phosphor.plot(points[:, 0], points[:, 1], colors)
+            self.new_points = []
         
-        # Draw triangle vertices
+        # Draw triangle vertices as small circles
+        offsets = [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3) if dx*dx + dy*dy <= 4]
         for i, vertex in enumerate(self.vertices):
             x, y = int(vertex[0]), int(vertex[1])
             if 0 <= x < self.width and 0 <= y < self.height:
                 vertex_color = self.sierpinski_colors[i % len(self.sierpinski_colors)]
-                
-                # Draw vertex as small circle
-                for dx in range(-2, 3):
-                    for dy in range(-2, 3):
-                        if dx*dx + dy*dy <= 4:
-                            px, py = x + dx, y + dy
-                            if 0 <= px < self.width and 0 <= py < self.height:
-                                image.putpixel((px, py), vertex_color)
-        
-        # Draw generated points
-        for point in self.points:
-            x, y = point['x'], point['y']
-            
-            if 0 <= x < self.width and 0 <= y < self.height:
-                # Color based on which vertex was chosen and age
-                vertex_index = point['vertex_index']
-                base_color = self.sierpinski_colors[vertex_index]
-                
-                # Fade with age
-                age_factor = max(0.1, 1.0 - point['age'] / 200.0)
-                
-                # Add time-based color variation
-                color_shift = math.sin(self.color_time + vertex_index) * 0.3
-                
-                r, g, b = base_color
-                final_color = (
-                    int(r * age_factor * (1 + color_shift)),
-                    int(g * age_factor * (1 + color_shift)),
-                    int(b * age_factor * (1 + color_shift))
-                )
-                
-                # Clamp values
-                final_color = (
-                    max(0, min(255, final_color[0])),
-                    max(0, min(255, final_color[1])),
-                    max(0, min(255, final_color[2]))
-                )
-                
-                image.putpixel((x, y), final_color)
+                self.phosphor.plot([x + dx for dx, dy in offsets],
+                                   [y + dy for dx, dy in offsets], vertex_color)
         
-        return image
+        return self.phosphor.to_image()
     
     def run(self):
         """Main animation loop"""
@@ -182,6 +166,7 @@ class SierpinskiTriangle:
         
         try:
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -190,10 +175,9 @@ class SierpinskiTriangle:
                 
                 if frame % 200 == 0:
                     elapsed = time.time() - start_time
-                    point_count = len(self.points)
-                    print(f"🔺 {elapsed:.1f}s: {point_count} points generated")
+                    print(f"🔺 {elapsed:.1f}s: {self.total_points} points generated, {self.governor.status()}")
                 
-                time.sleep(0.03)  # ~33 FPS
+                time.sleep(self.governor.frame_done(time.perf_counter() - frame_start))  # ~33 FPS
                 
         except KeyboardInterrupt:
             print(f"\n🔺 Sierpinski triangle stopped")
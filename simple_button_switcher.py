@@ -10,11 +10,14 @@ Controls:
 """
 
 import time
-import subprocess
-import os
+import asyncio
 from gpiozero import Button
 from PIL import Image, ImageDraw, ImageFont
 import LCD_1in44
+import display_daemon
+import effect_registry
+from effect_controller import EffectController
+from status_overlay import StatusBanner, draw_card, BANNER_HEIGHT
 
 class SimpleButtonSwitcher:
     def __init__(self):
@@ -22,8 +25,11 @@ class SimpleButtonSwitcher:
         print("🔧 Initializing GPIO buttons...")
         
         try:
-            # Initialize LCD first
-            self.LCD = LCD_1in44.LCD()
+            # Initialize LCD first (a display daemon client when one owns the panel)
+            if display_daemon.daemon_running():
+                self.LCD = display_daemon.DisplayClient('simple_button_switcher')
+            else:
+                self.LCD = LCD_1in44.LCD()
             Lcd_ScanDir = LCD_1in44.U2D_L2R
             self.LCD.LCD_Init(Lcd_ScanDir)
             self.LCD.LCD_Clear()
@@ -31,21 +37,21 @@ class SimpleButtonSwitcher:
             
             # Simple 3-button setup with error handling
             try:
-                self.key1 = Button(21, pull_up=True)      # Next →
+                self.key1 = Button(21, pull_up=True, bounce_time=0.05)      # Next →
                 print("✅ KEY1 (Pin 21) initialized")
             except Exception as e:
                 print(f"❌ KEY1 (Pin 21) failed: {e}")
                 self.key1 = None
                 
             try:
-                self.key2 = Button(20, pull_up=True)      # Previous ←
+                self.key2 = Button(20, pull_up=True, bounce_time=0.05)      # Previous ←
                 print("✅ KEY2 (Pin 20) initialized")
             except Exception as e:
                 print(f"❌ KEY2 (Pin 20) failed: {e}")
                 self.key2 = None
                 
             try:
-                self.key3 = Button(16, pull_up=True)      # Exit
+                self.key3 = Button(16, pull_up=True, bounce_time=0.05)      # Exit
                 print("✅ KEY3 (Pin 16) initialized")
             except Exception as e:
                 print(f"❌ KEY3 (Pin 16) failed: {e}")
@@ -55,25 +61,15 @@ class SimpleButtonSwitcher:
             print(f"❌ LCD initialization failed: {e}")
             raise
         
-        # Curated screensaver list - best ones only
-        self.screensavers = [
-            'glyph_rain1_fixed.py',    # 1. Stable matrix rain
-            'glyph_rain2.py',          # 2. Blue matrix
-            'glyph_rain3.py',          # 3. Rainbow matrix
-            'neon_rain.py',            # 4. Neon rain
-            'simple_flames.py',        # 5. Flames
-            'plasma_field.py',         # 6. Plasma
-            'bouncing_balls.py',       # 7. Bouncing balls
-            'kaleidoscope.py',         # 8. Kaleidoscope
-            'micro_dots.py',           # 9. Micro dots
-            'raindrops.py'             # 10. Raindrops
-        ]
+        # Curated screensaver list - best ones only (the 'buttons' set in effects.json)
+        self.screensavers = effect_registry.button_set()
         
-        # State
-        self.current_index = 0
-        self.current_process = None
-        self.running = True
-        self.last_button_time = 0
+        # Presses are queued; the controller switches effects one at a time
+        self.controller = EffectController([saver['file'] for saver in self.screensavers],
+                                           on_switch=self.show_status,
+                                           command=display_daemon.effect_command)
+        # Status cards are drawn once and shown over the starting screensaver
+        self.banner = StatusBanner(self.LCD, self.render_status, hold=self.controller.send_signal)
         
         # Button handlers with null checks
         if self.key1:
@@ -96,104 +92,32 @@ class SimpleButtonSwitcher:
         else:
             print("⚠️ No buttons initialized - check GPIO connections")
         
-    def debounce_check(self):
-        """Prevent button spam"""
-        current_time = time.time()
-        if current_time - self.last_button_time < 0.5:
-            return False
-        self.last_button_time = current_time
-        return True
+    def render_status(self, index):
+        """Status banner for a screensaver"""
+        saver_name = self.screensavers[index]['name']
+        return draw_card([
+            (f"#{index + 1} {saver_name[:16]}", (255, 255, 0)),
+            ("KEY1 Next KEY2 Prev", (100, 255, 100)),
+        ], self.LCD.width, BANNER_HEIGHT, (0, 30, 0))
     
-    def show_status(self):
-        """Show current screensaver number on LCD"""
-        image = Image.new('RGB', (self.LCD.width, self.LCD.height), (0, 30, 0))
-        draw = ImageDraw.Draw(image)
-        font = ImageFont.load_default()
-        
-        # Current screensaver info
-        saver_name = self.screensavers[self.current_index].replace('.py', '').replace('_', ' ').title()
-        
-        # Center the text
-        draw.text((10, 30), f"Screensaver #{self.current_index + 1}", 
-                 fill=(255, 255, 0), font=font)
-        draw.text((10, 50), saver_name[:15], fill=(255, 255, 255), font=font)
-        
-        # Controls
-        draw.text((10, 80), "KEY1: Next →", fill=(100, 255, 100), font=font)
-        draw.text((10, 95), "KEY2: ← Prev", fill=(100, 255, 100), font=font)
-        draw.text((10, 110), "KEY3: Exit", fill=(255, 100, 100), font=font)
-        
-        self.LCD.LCD_ShowImage(image, 0, 0)
-        time.sleep(1.5)
-    
-    def start_screensaver(self, index):
-        """Start screensaver by index"""
-        if index >= len(self.screensavers):
-            return False
-            
-        filepath = self.screensavers[index]
-        if not os.path.exists(filepath):
-            print(f"❌ Missing: {filepath}")
-            return False
-        
-        # Stop current
-        self.stop_current()
-        
-        # Show status
-        self.show_status()
-        
-        try:
-            print(f"🚀 Starting #{index + 1}: {filepath}")
-            self.current_process = subprocess.Popen(['python3', filepath])
-            return True
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return False
-    
-    def stop_current(self):
-        """Stop current screensaver"""
-        if self.current_process:
-            try:
-                self.current_process.terminate()
-                self.current_process.wait(timeout=2)
-            except:
-                try:
-                    self.current_process.kill()
-                except:
-                    pass
-            self.current_process = None
-        
-        # Kill any strays
-        try:
-            subprocess.run(['pkill', '-f', 'glyph_rain'], capture_output=True)
-        except:
-            pass
+    def show_status(self, index):
+        """Show screensaver number over the screen (doesn't wait)"""
+        self.banner.show(index)
     
     def next_screensaver(self):
         """Next screensaver"""
-        if not self.debounce_check():
-            return
-        
-        self.current_index = (self.current_index + 1) % len(self.screensavers)
-        print(f"➡️ Next: #{self.current_index + 1}")
-        self.start_screensaver(self.current_index)
+        print("➡️ Next")
+        self.controller.post('next')
     
     def previous_screensaver(self):
         """Previous screensaver"""
-        if not self.debounce_check():
-            return
-        
-        self.current_index = (self.current_index - 1) % len(self.screensavers)
-        print(f"⬅️ Previous: #{self.current_index + 1}")
-        self.start_screensaver(self.current_index)
+        print("⬅️ Previous")
+        self.controller.post('prev')
     
     def exit_switcher(self):
         """Exit"""
-        if not self.debounce_check():
-            return
-        
         print("🚪 Exit pressed")
-        self.running = False
+        self.controller.post('exit')
     
     def run(self):
         """Main loop"""
@@ -206,24 +130,13 @@ class SimpleButtonSwitcher:
         print(f"  {len(self.screensavers)} screensavers loaded")
         print("="*40)
         
-        # Start first screensaver
-        self.start_screensaver(0)
-        
+        # Start the first screensaver and handle presses until exit
         try:
-            while self.running:
-                time.sleep(0.1)
-                
-                # Restart if crashed
-                if self.current_process and self.current_process.poll() is not None:
-                    print("⚠️ Restarting screensaver...")
-                    time.sleep(1)
-                    self.start_screensaver(self.current_index)
-                    
+            asyncio.run(self.controller.run(0))
         except KeyboardInterrupt:
             print("\n🛑 Keyboard interrupt")
         
         print("🧹 Cleaning up...")
-        self.stop_current()
         
         # Show exit message
         image = Image.new('RGB', (self.LCD.width, self.LCD.height), (0, 0, 0))
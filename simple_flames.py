@@ -6,12 +6,13 @@ Simple animated flames rising from the bottom
 
 import LCD_1in44
 import time
-import random
 import math
 from PIL import Image, ImageDraw
+from effect_rng import EffectRandom
+from frame_pacer import FramePacer
 
 class SimpleFlames:
-    def __init__(self):
+    def __init__(self, rng=None):
         print("🔥 Initializing Simple Flames...")
         
         # Initialize LCD
@@ -25,6 +26,8 @@ class SimpleFlames:
         self.width = self.LCD.width
         self.height = self.LCD.height
         
+        self.random = EffectRandom(rng)
+        
         # Simple flame particles
         self.flames = []
         
@@ -48,13 +51,13 @@ class SimpleFlames:
     def create_flame_particle(self):
         """Create a simple flame particle"""
         return {
-            'x': random.randint(20, self.width - 20),
+            'x': self.random.randint(20, self.width - 20),
             'y': self.height - 1,
-            'vy': random.uniform(-1.5, -3.0),
-            'vx': random.uniform(-0.5, 0.5),
-            'life': random.randint(30, 60),
-            'max_life': random.randint(30, 60),
-            'size': random.randint(1, 3)
+            'vy': self.random.uniform(-1.5, -3.0),
+            'vx': self.random.uniform(-0.5, 0.5),
+            'life': self.random.randint(30, 60),
+            'max_life': self.random.randint(30, 60),
+            'size': self.random.randint(1, 3)
         }
     
     def update(self):
@@ -62,7 +65,7 @@ class SimpleFlames:
         self.time += 1
         
         # Spawn new flames from bottom
-        if random.random() < 0.7:  # 70% chance
+        if self.random.random() < 0.7:  # 70% chance
             self.flames.append(self.create_flame_particle())
         
         # Update existing flames
@@ -72,7 +75,7 @@ class SimpleFlames:
             flame['x'] += flame['vx']
             
             # Add some flickering motion
-            flame['vx'] += random.uniform(-0.1, 0.1)
+            flame['vx'] += self.random.uniform(-0.1, 0.1)
             flame['vx'] = max(-1, min(1, flame['vx']))  # Limit sideways motion
             
             # Age the flame
@@ -138,7 +141,9 @@ class SimpleFlames:
         start_time = time.time()
         
         try:
+            pacer = FramePacer(20, lcd=self.LCD)
             while True:
+                frame_start = time.perf_counter()
                 self.update()
                 image = self.draw_frame()
                 self.LCD.LCD_ShowImage(image, 0, 0)
@@ -151,7 +156,7 @@ class SimpleFlames:
                     flame_count = len(self.flames)
                     print(f"🔥 {elapsed:.1f}s: {flame_count} flame particles")
                 
-                time.sleep(0.05)  # 20 FPS
+                time.sleep(pacer.frame_done(time.perf_counter() - frame_start))  # 20 FPS
                 
         except KeyboardInterrupt:
             print(f"\n🔥 Flames extinguished")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Status Overlay - Switcher cards drawn over the running effect
+Cards are rendered and packed once, then handed to the display daemon,
+which composites them over the effect's frames for a few seconds while
+the next effect starts. Without the daemon the card goes straight to the
+LCD, and the running effect is stopped (SIGSTOP) for the card's duration
+so it can't paint over it, then resumed; its driver repaints the whole
+panel on SIGCONT. Either way the switcher never waits on it.
+"""
+
+import signal
+import threading
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import display_daemon
+from frame_ring import pack_rgb565
+
+BANNER_HEIGHT = 30
+DURATION = 1.5
+
+
+def draw_card(lines, width, height, background):
+    """Card image with one (text, colour) per 12-pixel line"""
+    image = Image.new('RGB', (width, height), background)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+    y = 3
+    for text, color in lines:
+        draw.text((3, y), text, fill=color, font=font)
+        y += 12
+    return image
+
+
+class StatusBanner:
+    def __init__(self, lcd, render, duration=DURATION, hold=None):
+        self.lcd = lcd
+        self.render = render        # key -> card image, called once per key
+        self.duration = duration
+        self.hold = hold            # signum -> True if the running effect got it
+        self.cards = {}             # key -> (image, packed RGB565)
+        self.release = None         # Timer that resumes a held effect
+
+    def card(self, key):
+        """Pre-rendered card for key"""
+        if key not in self.cards:
+            image = self.render(key).convert('RGB')
+            packed = pack_rgb565(np.asarray(image), np.empty((image.height, image.width, 2), np.uint8))
+            self.cards[key] = (image, packed.tobytes())
+        return self.cards[key]
+
+    def show(self, key, duration=None):
+        """Put the card for key up, bottom-aligned, without waiting"""
+        image, packed = self.card(key)
+        x = (self.lcd.width - image.width) // 2
+        y = self.lcd.height - image.height
+        duration = self.duration if duration is None else duration
+        if display_daemon.daemon_running():
+            display_daemon.show_overlay(packed, image.width, image.height, x, y, duration)
+            return
+        # Between effects nothing is running to hold; the next one's first frame replaces it
+        held = self.hold is not None and self.hold(signal.SIGSTOP)
+        frame = Image.new('RGB', (self.lcd.width, self.lcd.height), (0, 0, 0))
+        frame.paste(image, (x, y))
+        self.lcd.LCD_Invalidate()   # The effect has drawn since our last card
+        self.lcd.LCD_ShowImage(frame, 0, 0)
+        if held:
+            if self.release is not None:
+                self.release.cancel()
+            self.release = threading.Timer(duration, self.hold, (signal.SIGCONT,))
+            self.release.daemon = True
+            self.release.start()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Accel kernel tests - the NumPy fallbacks must match the serial loops
+Run with: python3 -m pytest test_accel.py
+"""
+
+import numpy as np
+
+import accel
+
+HEIGHT = 128
+
+
+def test_chaos_game_matches_loop():
+    """Closed-form chunks must follow the serial chaos game across chunk edges"""
+    rng = np.random.default_rng(1)
+    vertex_x = np.array([64.0, 10.0, 118.0])
+    vertex_y = np.array([10.0, 118.0, 118.0])
+    for steps in (1, 50, 64, 150, 1000):
+        choices = rng.integers(0, 3, steps)
+        expected = accel._chaos_game_loop(64.0, 64.0, vertex_x, vertex_y, choices)
+        result = accel._chaos_game_numpy(64.0, 64.0, vertex_x, vertex_y, choices)
+        assert np.allclose(result[0], expected[0], atol=1e-9)
+        assert np.allclose(result[1], expected[1], atol=1e-9)
+
+
+def test_turtle_walk_matches_loop():
+    """Cumulative turns and moves must land on the same vertices as the walk"""
+    commands = "F"
+    for _ in range(5):
+        commands = commands.replace("F", "F+F--F+F")
+    commands = np.frombuffer(commands.encode('ascii'), dtype=np.uint8)
+    for angle, step in ((0.0, 2.0), (37.5, 1.0), (-720.5, 3.0)):
+        expected = accel._turtle_walk_loop(commands, 64.0, 64.0, angle, step)
+        result = accel._turtle_walk_numpy(commands, 64.0, 64.0, angle, step)
+        assert np.array_equal(result[0].astype(int), expected[0].astype(int))
+        assert np.array_equal(result[1].astype(int), expected[1].astype(int))
+
+
+def test_drip_collide_matches_loop():
+    """Collision rounds must settle the same dots in the same per-stream order"""
+    rng = np.random.default_rng(2)
+    streams = 8
+    for trial in range(50):
+        dots = rng.integers(0, 60)
+        stream = rng.integers(0, streams, dots)
+        y = rng.uniform(HEIGHT - 12, HEIGHT, dots)
+        speed = rng.uniform(0.3, 1.8, dots)
+        brightness = rng.integers(0, 256, dots)
+        dripping = rng.random(dots) < 0.1
+        # Stacks of 1-9 dots reach up to HEIGHT - count; empty streams have no top
+        empty = rng.random(streams) < 0.5
+        count = np.where(empty, 0, rng.integers(1, 10, streams))
+        top = np.where(empty, np.inf, HEIGHT - count)
+
+        results = []
+        for kernel in (accel._drip_collide_loop, accel._drip_collide_numpy):
+            state = [y.copy(), brightness.copy(), top.copy(), count.copy()]
+            settled, hit = kernel(stream, state[0], speed, state[1], dripping, state[2], state[3],
+                                  HEIGHT, HEIGHT // 3)
+            results.append((settled, hit, state))
+
+        (loop_settled, loop_hit, loop_state), (settled, hit, state) = results
+        assert np.array_equal(hit, loop_hit), trial
+        assert sorted(settled.tolist()) == sorted(loop_settled.tolist()), trial
+        for s in range(streams):
+            assert settled[stream[settled] == s].tolist() == loop_settled[stream[loop_settled] == s].tolist()
+        for value, expected in zip(state, loop_state):
+            assert np.array_equal(value, expected), trial
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Display daemon tests - frames reach the LCD and the newest client owns it
+Run with: python3 -m pytest test_display_daemon.py
+"""
+
+import os
+import stat
+import signal
+import time
+import socket
+import threading
+import numpy as np
+import pytest
+from PIL import Image
+
+import headless
+import display_daemon
+from display_daemon import DisplayDaemon, DisplayClient
+from frame_ring import pack_rgb565
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def packed(image):
+    return pack_rgb565(np.asarray(image), np.empty((image.height, image.width, 2), np.uint8)).tobytes()
+
+
+def start_daemon(tmp_path):
+    lcd = headless.HeadlessLCD()
+    daemon = DisplayDaemon(lcd, str(tmp_path / 'display.sock'))
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    return lcd, daemon, thread
+
+
+@pytest.mark.parametrize('transport', ['shm', 'socket'])
+def test_frames_reach_the_lcd(tmp_path, transport):
+    """An RGB frame sent by a client is shown unchanged"""
+    lcd, daemon, thread = start_daemon(tmp_path)
+    client = DisplayClient('flames', daemon.path, transport)
+    assert (client.width, client.height) == (headless.WIDTH, headless.HEIGHT)
+
+    image = Image.new('RGB', (client.width, client.height), (200, 40, 10))
+    image.putpixel((5, 7), (1, 2, 3))
+    client.LCD_ShowImage(image, 0, 0)
+    assert wait_for(lambda: lcd.frames_shown == 1)
+    assert lcd.last_rgb565 == packed(image)
+
+    client.close()
+    display_daemon.request(display_daemon.QUIT, path=daemon.path)
+    thread.join(2)
+    assert not thread.is_alive()
+
+
+def test_newest_client_is_on_screen(tmp_path):
+    """A new client hides the previous one, which resumes when it leaves"""
+    lcd, daemon, thread = start_daemon(tmp_path)
+    first = DisplayClient('first', daemon.path)
+    assert first.visible
+
+    second = DisplayClient('second', daemon.path)
+    assert wait_for(lambda: (first.poll(), not first.visible)[1])
+    status = display_daemon.request(display_daemon.LIST, path=daemon.path)
+    assert status.splitlines()[0].startswith('* second')
+
+    assert display_daemon.request(display_daemon.FOCUS, b'first', path=daemon.path) == 'first'
+    assert wait_for(lambda: (first.poll(), first.visible)[1])
+
+    display_daemon.request(display_daemon.FOCUS, b'second', path=daemon.path)
+    second.close()
+    assert wait_for(lambda: (first.poll(), first.visible)[1])
+
+    first.close()
+    daemon.stop()
+    thread.join(2)
+
+
+def test_overlay_is_composited_until_it_expires(tmp_path):
+    """A status card shows at once over the last frame, then comes off by itself"""
+    lcd, daemon, thread = start_daemon(tmp_path)
+    client = DisplayClient('flames', daemon.path)
+    image = Image.new('RGB', (client.width, client.height), (0, 0, 255))
+    client.LCD_ShowImage(image, 0, 0)
+    assert wait_for(lambda: lcd.frames_shown == 1)
+
+    card = Image.new('RGB', (20, 10), (255, 255, 0))
+    display_daemon.show_overlay(packed(card), 20, 10, 5, 118, 0.2, path=daemon.path)
+    assert wait_for(lambda: lcd.frames_shown == 2)
+    expected = image.copy()
+    expected.paste(card, (5, 118))
+    assert lcd.last_rgb565 == packed(expected)
+
+    assert wait_for(lambda: lcd.frames_shown == 3)
+    assert lcd.last_rgb565 == packed(image)
+
+    client.close()
+    daemon.stop()
+    thread.join(2)
+
+
+def test_malformed_messages_drop_the_client_not_the_daemon(tmp_path):
+    """Wrong-sized frames and cards that don't fit disconnect their sender; the panel keeps going"""
+    lcd, daemon, thread = start_daemon(tmp_path)
+    assert stat.S_IMODE(os.stat(daemon.path).st_mode) == 0o600
+
+    card = bytes(20 * 10 * 2)
+    bad = [(display_daemon.FRAME, bytes(10)),
+           (display_daemon.FRAME_565, bytes(100)),
+           (display_daemon.TICK, b''),
+           (display_daemon.OVERLAY, display_daemon.OVERLAY_HEADER.pack(5, 120, 20, 10, 1.0) + card),
+           (display_daemon.OVERLAY, display_daemon.OVERLAY_HEADER.pack(0, 0, 20, 10, 1.0) + card[:-2]),
+           (display_daemon.OVERLAY, b'\x01')]
+    for kind, payload in bad:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon.path)
+            display_daemon.send_message(sock, display_daemon.HELLO, b'bad')
+            display_daemon.recv_message(sock)   # SIZE
+            display_daemon.recv_message(sock)   # SHOW
+            display_daemon.send_message(sock, kind, payload)
+            sock.settimeout(2)
+            assert sock.recv(1) == b''          # Disconnected
+    assert thread.is_alive() and lcd.frames_shown == 0
+
+    client = DisplayClient('good', daemon.path, 'socket')
+    client.LCD_ShowImage(Image.new('RGB', (client.width, client.height), (1, 2, 3)), 0, 0)
+    assert wait_for(lambda: lcd.frames_shown == 1)
+
+    client.close()
+    daemon.stop()
+    thread.join(2)
+
+
+def test_startup_clear_waits_for_the_first_frame(tmp_path):
+    """An effect's clear before its first frame never reaches the panel"""
+    lcd, daemon, thread = start_daemon(tmp_path)
+    client = DisplayClient('flames', daemon.path)
+    client.LCD_Clear()
+    client.LCD_ShowImage(Image.new('RGB', (client.width, client.height), (9, 9, 9)), 0, 0)
+    assert wait_for(lambda: lcd.frames_shown == 1)
+    assert daemon.stack[-1].frames == 1
+
+    client.LCD_Clear()
+    assert wait_for(lambda: daemon.stack[-1].frames == 2)
+    assert daemon.last_frame is None
+
+    client.close()
+    daemon.stop()
+    thread.join(2)
+
+
+def test_unchanged_frames_are_not_sent(tmp_path):
+    """A repeated frame stays in the client; a clear or regaining the screen resends it"""
+    lcd, daemon, thread = start_daemon(tmp_path)
+    client = DisplayClient('slow', daemon.path)
+    image = Image.new('RGB', (client.width, client.height), (0, 80, 0))
+    for _ in range(3):
+        client.LCD_ShowImage(image, 0, 0)
+    assert client.static_frames == 2
+    assert wait_for(lambda: lcd.frames_shown == 1)
+
+    other = DisplayClient('other', daemon.path)
+    other.close()
+    assert wait_for(lambda: (client.poll(), client.visible and client.last_frame_crc is None)[1])
+    client.LCD_ShowImage(image, 0, 0)
+    assert client.static_frames == 0
+    assert wait_for(lambda: lcd.frames_shown == 2)
+
+    client.close()
+    daemon.stop()
+    thread.join(2)
+
+
+def test_standalone_card_holds_the_effect_for_its_duration(monkeypatch):
+    """Without the daemon the card goes to the LCD and the effect is stopped until it expires"""
+    from status_overlay import StatusBanner
+    monkeypatch.setattr(display_daemon, 'daemon_running', lambda: False)
+    lcd = headless.HeadlessLCD()
+    signals = []
+    banner = StatusBanner(lcd, lambda key: Image.new('RGB', (20, 10), (255, 255, 0)), duration=0.1,
+                          hold=lambda signum: signals.append(signum) or True)
+    banner.show('card')
+    assert lcd.frames_shown == 1 and lcd.last_image.getpixel((64, 127)) == (255, 255, 0)
+    assert signals == [signal.SIGSTOP]
+    assert wait_for(lambda: signals == [signal.SIGSTOP, signal.SIGCONT])
+
+    banner.hold = lambda signum: False      # Between effects nothing is running
+    banner.show('card')
+    assert lcd.frames_shown == 2 and banner.release.finished.is_set()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Effect controller tests - bursts of presses switch once, crashed effects restart
+Run with: python3 -m pytest test_effect_controller.py
+"""
+
+import sys
+import asyncio
+
+from effect_controller import EffectController
+
+
+def effect_scripts(tmp_path, count, body='import time; time.sleep(30)'):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f'effect{i}.py'
+        path.write_text(body + '\n')
+        paths.append(str(path))
+    return paths
+
+
+def test_burst_of_presses_switches_once(tmp_path):
+    """Five quick 'next' presses start only the final target"""
+    started = []
+    controller = EffectController(effect_scripts(tmp_path, 4), on_switch=started.append,
+                                  coalesce=0.1, command=[sys.executable])
+
+    async def scenario():
+        runner = asyncio.ensure_future(controller.run(0))
+        while controller.process is None:
+            await asyncio.sleep(0.01)
+        first = controller.process
+        for _ in range(5):
+            controller.post('next')
+            await asyncio.sleep(0.02)
+        while controller.current != 1:
+            await asyncio.sleep(0.01)
+        assert first.returncode is not None  # Awaited, not left running
+        controller.post('prev')
+        controller.post('next')   # Back where it was: no transition at all
+        await asyncio.sleep(0.3)
+        controller.post('exit')
+        await runner
+
+    asyncio.run(asyncio.wait_for(scenario(), 10))
+    assert started == [0, 1]
+    assert controller.process is None
+
+
+def test_crashed_effect_restarts(tmp_path):
+    """An effect that exits on its own is started again, with the command looked up afresh"""
+    started = []
+    commands = []
+
+    def command():
+        commands.append(len(started))
+        return [sys.executable]
+
+    controller = EffectController(effect_scripts(tmp_path, 2, 'raise SystemExit(1)'), on_switch=started.append,
+                                  restart_delay=0, command=command)
+
+    async def scenario():
+        runner = asyncio.ensure_future(controller.run(1))
+        while len(started) < 3:
+            await asyncio.sleep(0.01)
+        controller.post('exit')
+        await runner
+
+    asyncio.run(asyncio.wait_for(scenario(), 10))
+    assert started[:3] == [1, 1, 1]
+    assert commands[:3] == [1, 2, 3]
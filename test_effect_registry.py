@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Effect registry tests - effects.json matches the effect scripts on disk
+Run with: python3 -m pytest test_effect_registry.py
+"""
+
+import ast
+import sys
+import subprocess
+
+import effect_registry
+
+
+def test_every_entry_names_a_real_class():
+    """Each effect file exists and defines the class the registry points at"""
+    for info in effect_registry.effects().values():
+        assert info['available'], info['file']
+        with open(info['path']) as f:
+            classes = {node.name: node for node in ast.parse(f.read()).body if isinstance(node, ast.ClassDef)}
+        assert info['class'] in classes, info['key']
+        methods = {node.name for node in ast.walk(classes[info['class']]) if isinstance(node, ast.FunctionDef)}
+        assert set(info.get('frame', ())) <= methods, info['key']
+        assert info['cost'] in effect_registry.COST_CLASSES
+        assert info['fps'] > 0
+    for info in effect_registry.switchers().values():
+        assert info['available'], info['file']
+
+
+def test_lookup_by_name_alias_and_number():
+    """Old launcher names and menu numbers resolve to the same effect"""
+    assert effect_registry.find('micro_drip')['key'] == 'micro_dots_dripping'
+    assert effect_registry.find('12') is effect_registry.find('micro_dots_dripping.py')
+    assert effect_registry.find(80)['file'] == 'simple_button_switcher.py'
+    assert effect_registry.find('nope') is None
+    assert [info['key'] for info in effect_registry.button_set()][:2] == ['glyph_rain1_fixed', 'glyph_rain2']
+
+
+def test_menus_start_without_numpy_or_pil():
+    """Launchers read metadata only; effect modules load when selected"""
+    check = ("import sys, screensaver_manager, screensaver_launcher, boot_manager, background_launcher; "
+             "screensaver_manager.ScreensaverManager(); "
+             "print(sorted(m for m in ('numpy', 'PIL', 'plasma_field') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+    import headless
+    headless.install()
+    assert effect_registry.effect_class('dragon_curve').__name__ == 'DragonCurve'
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Fractal kernel tests - fast paths against the brute-force kernels
+Run with: python3 -m pytest test_fractal.py
+"""
+
+import math
+import numpy as np
+
+import fractal
+
+WIDTH = 128
+HEIGHT = 128
+
+# Views the Mandelbrot effect passes through: (center_x, center_y, zoom, max_iter)
+MANDELBROT_VIEWS = [
+    (-0.5, 0.0, 1.0, 30),
+    (-0.5, 0.0, 7.0, 60),
+    (-0.75, 0.1, 3.0, 30),
+    (-0.235125, 0.827215, 15.0, 60),
+    (-0.74529, 0.11307, 30.0, 42),
+    (0.0, 1.0, 3.413584432215376, 60),      # Subdivision fills over 2 escaping pixels here
+]
+
+# Subdivision is approximate: pixels per frame it may fill over as inside
+MAX_FILLED_OVER = 4
+
+
+def julia_path(steps):
+    """c values along the Julia effect's animation path"""
+    for step in range(steps):
+        t = step * 1.1
+        yield complex(-0.7 + 0.3 * math.sin(t * 0.5), 0.27015 + 0.2 * math.cos(t * 0.7))
+
+
+def test_subdivide_matches_every_sample():
+    """Concentric bands: filled blocks must hold the value sampling would give"""
+    def sample(rows, cols):
+        return (np.hypot(rows - 40.3, cols - 25.7) // 9).astype(np.int32)
+
+    rows, cols = np.indices((64, 64))
+    for levels in [(8,), (16, 4), (16, 8, 4)]:
+        assert np.array_equal(fractal.subdivide(sample, (64, 64), levels), sample(rows, cols))
+
+
+def test_subdivide_odd_shapes():
+    """Grids that aren't a whole number of blocks"""
+    def sample(rows, cols):
+        return ((rows // 5) + (cols // 7)).astype(np.int32)
+
+    for shape in [(1, 1), (3, 17), (33, 65), (50, 20)]:
+        rows, cols = np.indices(shape)
+        assert np.array_equal(fractal.subdivide(sample, shape), sample(rows, cols))
+
+
+def assert_nearly_equal(subdivided, exact, max_iter):
+    """Subdivision may only fill a few escaping pixels over as inside the set"""
+    wrong = subdivided != exact
+    assert np.count_nonzero(wrong) <= MAX_FILLED_OVER
+    assert np.all(subdivided[wrong] == max_iter)
+
+
+def test_mandelbrot_subdivided_is_close_to_brute_force():
+    for scale in (1, 2, 4):
+        xs = ys = np.arange(0, WIDTH, scale)
+        for center_x, center_y, zoom, max_iter in MANDELBROT_VIEWS:
+            args = (center_x, center_y, zoom, WIDTH, HEIGHT, max_iter, xs, ys)
+            assert_nearly_equal(fractal.mandelbrot_subdivided(*args),
+                                fractal.mandelbrot_iterations(*args), max_iter)
+
+
+def test_julia_subdivided_is_close_to_brute_force():
+    for scale in (1, 2):
+        xs = ys = np.arange(0, WIDTH, scale)
+        for c in julia_path(40):
+            args = (c, WIDTH, HEIGHT, 25, xs, ys)
+            assert_nearly_equal(fractal.julia_subdivided(*args), fractal.julia_iterations(*args), 25)
+
+
+def test_subdivide_skips_interior():
+    """Inside the main cardioid most pixels should be filled, not iterated"""
+    xs = ys = np.arange(WIDTH)
+    c = fractal.mandelbrot_plane(-0.3, 0.0, 6.0, WIDTH, HEIGHT,
+                                 np.arange(WIDTH + 8), np.arange(HEIGHT + 8))
+    sampled = []
+
+    def sample(rows, cols):
+        sampled.append(rows.size)
+        return fractal.escape_time(np.zeros(rows.size), c[rows, cols], 40)
+
+    counts = fractal.subdivide(sample, (HEIGHT, WIDTH))
+    assert np.array_equal(counts, fractal.mandelbrot_iterations(-0.3, 0.0, 6.0, WIDTH, HEIGHT, 40, xs, ys))
+    assert sum(sampled) < WIDTH * HEIGHT / 2
+
+
+def test_mandelbrot_escape_matches_plain_iteration():
+    """Bulb early-out and periodicity checking must not change any count"""
+    xs = ys = np.arange(0, WIDTH, 2)
+    views = MANDELBROT_VIEWS + [(-1.3107, 0.0, 100.0, 200), (-1.7548776662, 0.0, 400.0, 200),
+                                (-0.12256, 0.74486, 50.0, 150)]
+    for center_x, center_y, zoom, max_iter in views:
+        c = fractal.mandelbrot_plane(center_x, center_y, zoom, WIDTH, HEIGHT, xs, ys)
+        assert np.array_equal(fractal.mandelbrot_escape(c, max_iter),
+                              fractal.escape_time(np.zeros_like(c), c, max_iter)), (center_x, center_y, zoom)
+
+
+def test_perturbation_periodicity_matches_plain_perturbation():
+    """Deep minibrot views check for cycles, boundary views don't, and no count changes"""
+    xs = ys = np.arange(0, WIDTH, 2)
+    views = [(("-1.7548776662466927600495", "0"), 1e5),
+             (("-0.12256116687665361237", "0.74486176661974423659"), 1e4),
+             (("-0.2306185488094149258366498672466233051", "0.8160764508988396612991868716560091980"), 1e12)]
+    for center, zoom in views:
+        orbit = fractal.reference_orbit(*center, 1024, 40)
+        series = fractal.series_approximation(orbit, fractal.view_radius(zoom, WIDTH, HEIGHT))
+        dc = fractal.plane_offsets(zoom, WIDTH, HEIGHT, xs[np.newaxis, :], ys[:, np.newaxis])
+        limit = series[0] + 360
+        assert np.array_equal(fractal.perturbation_escape(orbit, dc, limit, series, smooth=True),
+                              fractal.perturbation_escape(orbit, dc, limit, series, smooth=True,
+                                                          periodicity=False)), center
+
+
+def test_julia_atlas_matches_live_render(tmp_path):
+    """Atlas slices must be the live smooth render in eighths of an iteration"""
+    from julia_atlas import JuliaAtlas, build_atlas, path_c, INTERESTING_C, PATH_PERIOD
+    atlas = JuliaAtlas(build_atlas(64, path=str(tmp_path / 'atlas.bin')))
+    xs = ys = np.arange(0, WIDTH, 2)
+
+    def live(c):
+        return fractal.julia_iterations(complex(*c), WIDTH, HEIGHT, 25, xs, ys, smooth=True) * 8 // fractal.SMOOTH_SCALE
+
+    for sample in (0, 17, 63):
+        t = PATH_PERIOD * sample / 64
+        assert np.array_equal(atlas.path_field(t), live(path_c(t)))
+    assert np.array_equal(atlas.path_field(PATH_PERIOD * 3 - 1e-9), atlas.path_field(0))
+    for jump, c in enumerate(INTERESTING_C):
+        assert np.array_equal(atlas.jump_field(jump), live(c))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Frame pacer tests - a fake sysfs root stands in for a throttled Pi
+Run with: python3 -m pytest test_frame_pacer.py
+"""
+
+from frame_pacer import FramePacer, SystemLoad, MIN_SCALE
+from quality_governor import QualityGovernor
+from render_scale import RenderScale
+
+
+class FakeSystem:
+    def __init__(self, root):
+        self.root = root
+        self.periods = self.throttled = 0
+        self.write('proc/self/cgroup', '0::/system.slice/lcd-stable.service\n')
+        self.set(temperature=50.0, pressure=0.5)
+        self.run_periods(100, 0)
+
+    def write(self, relative, text):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+    def set(self, temperature, pressure):
+        self.write('sys/class/thermal/thermal_zone0/temp', f"{int(temperature * 1000)}\n")
+        self.write('proc/pressure/cpu', f"some avg10={pressure:.2f} avg60=0.00 avg300=0.00 total=1\n"
+                                        "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n")
+
+    def run_periods(self, periods, throttled):
+        self.periods += periods
+        self.throttled += throttled
+        self.write('sys/fs/cgroup/system.slice/lcd-stable.service/cpu.stat',
+                   f"usage_usec 1000\nnr_periods {self.periods}\nnr_throttled {self.throttled}\n"
+                   f"throttled_usec {self.throttled * 500}\n")
+
+
+def test_signals_are_read_from_the_fake_root(tmp_path):
+    system = FakeSystem(tmp_path)
+    load = SystemLoad(str(tmp_path))
+    system.set(temperature=76.5, pressure=12.0)
+    assert load.temperature() == 76.5
+    assert load.cpu_pressure() == 12.0
+    assert load.quota_throttling() is None      # Needs two readings
+    system.run_periods(100, 40)
+    assert load.quota_throttling() == 0.4
+    assert SystemLoad(str(tmp_path / 'missing')).sample() == {
+        'temperature': None, 'pressure': None, 'throttling': None}
+
+
+def test_fps_eases_down_under_quota_throttling_and_recovers(tmp_path):
+    """CPUQuota overruns lower the FPS a step at a time, never below the floor"""
+    system = FakeSystem(tmp_path)
+    pacer = FramePacer(20, load=SystemLoad(str(tmp_path)), interval=1.0, enabled=True)
+    pacer.update(now=0)
+    assert pacer.fps == 20
+
+    scales = []
+    for second in range(1, 15):
+        system.run_periods(10, 8)
+        scales.append(pacer.update(now=second))
+    assert all(later < earlier for earlier, later in zip(scales, scales[1:]) if later > MIN_SCALE)
+    assert scales[0] > 0.7 and scales[-1] == MIN_SCALE
+    assert 'quota 80% throttled' in pacer.status()
+    assert pacer.fps == 20 * MIN_SCALE
+
+    for second in range(15, 40):
+        system.run_periods(10, 0)
+        pacer.update(now=second)
+    assert pacer.fps == 20
+
+
+def test_governor_drops_quality_before_fps_when_hot(tmp_path):
+    system = FakeSystem(tmp_path)
+    system.set(temperature=85.0, pressure=0.0)
+    pacer = FramePacer(10, load=SystemLoad(str(tmp_path)), interval=0.0, enabled=True)
+    levels = []
+    governor = QualityGovernor('iterations', [10, 20, 30], target_fps=10, apply=levels.append,
+                               window=3, pacer=pacer)
+
+    sleeps = [governor.frame_done(0.05) for _ in range(12)]
+    assert levels == [30, 20, 10]
+    assert sleeps[0] == 0.05                      # Quality steps first, FPS held
+    assert sleeps[-1] > 0.05                      # Then frames slow down at the cheapest level
+
+
+def test_held_governor_ignores_frame_times():
+    """A held knob stays put however fast frames are, and moves again once released"""
+    levels = []
+    governor = QualityGovernor('iterations', [10, 20, 30], target_fps=10, apply=levels.append,
+                               start=10, window=3)
+    governor.hold(20)
+    for _ in range(12):
+        governor.frame_done(0.001)
+    assert governor.value == 20 and 'held' in governor.status()
+
+    governor.hold(None)
+    for _ in range(12):
+        governor.frame_done(0.001)
+    assert levels == [10, 20, 30]
+
+
+def test_governor_lowers_resolution_only_at_the_cheapest_level(monkeypatch):
+    """Slow frames drop the knob, then the render scale; fast ones undo it in reverse"""
+    monkeypatch.delenv('M5_RENDER_SCALE', raising=False)
+    render_scale = RenderScale(128, 128)
+    levels, history = [], []
+    governor = QualityGovernor('iterations', [10, 20, 30], target_fps=10, apply=levels.append,
+                               window=3, render_scale=render_scale)
+    for _ in range(16):
+        governor.frame_done(0.5)
+        history.append((governor.value, render_scale.scale))
+    assert levels == [30, 20, 10] and render_scale.scale == 4
+    assert history.index((10, 2)) > history.index((10, 1))
+
+    for _ in range(24):
+        governor.frame_done(0.001)
+    assert render_scale.scale == 1 and levels[-1] == 30
+
+    render_scale.set_scale(2)                     # The user's own choice is left alone
+    for _ in range(12):
+        governor.frame_done(0.001)
+    assert render_scale.scale == 2
+
+
+def test_static_frames_drop_to_a_slow_tick(tmp_path):
+    """Once the LCD has skipped identical frames for a while the loop ticks at idle_fps"""
+    class StaticLCD:
+        static_frames = 0
+
+    lcd = StaticLCD()
+    pacer = FramePacer(20, load=SystemLoad(str(tmp_path)), lcd=lcd, idle_after=10.0, idle_fps=1.0)
+    assert not pacer.idle(now=100.0)
+    lcd.static_frames = 150
+    assert not pacer.idle(now=105.0)
+    assert pacer.idle(now=110.0)
+    assert 'idle' in pacer.status()
+    lcd.static_frames = 0
+    assert not pacer.idle(now=111.0)
+
+    pacer.idle_after = 0.0
+    lcd.static_frames = 1
+    assert pacer.frame_done(0.01) == 0.99
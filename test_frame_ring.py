@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Frame ring tests - the reader only ever sees whole, newest frames
+Run with: python3 -m pytest test_frame_ring.py
+"""
+
+import numpy as np
+
+from frame_ring import FrameRing, pack_rgb565, SLOTS, LATEST_SLOT, READING_SLOT, SLOT_SEQ
+
+
+def frame(value, width=240, height=135):
+    return np.full(width * height * 2, value, dtype=np.uint8)
+
+
+def test_reader_gets_newest_frame():
+    """Frames written between reads are skipped, and nothing new reads as None"""
+    writer = FrameRing.create(240, 135)
+    reader = FrameRing.attach(writer.name)
+    try:
+        assert reader.read() == (0, None)
+        for value in (1, 2, 3, 4):
+            writer.write(frame(value))
+        sequence, data = reader.read()
+        assert sequence == 4 and (data == 4).all()
+        assert reader.read(sequence) == (4, None)
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_writer_skips_the_slot_being_read():
+    """The slot a reader claimed is never reused until it moves on"""
+    writer = FrameRing.create(128, 128)
+    reader = FrameRing.attach(writer.name)
+    try:
+        writer.write(frame(9, 128, 128))
+        reader.read()
+        reading = int(reader.counters[READING_SLOT])
+        for value in range(3 * SLOTS):
+            slot, view = writer.begin_write()
+            assert slot != reading
+            view[:] = value
+            writer.commit(slot)
+        assert (writer.slots[reading] == 9).all()
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_torn_frame_is_not_returned():
+    """A slot refilled mid-read fails the sequence check"""
+    writer = FrameRing.create(128, 128)
+    reader = FrameRing.attach(writer.name)
+    try:
+        sequence = writer.write(frame(5, 128, 128))
+        slot, _ = writer.begin_write()
+        # Mark the published slot as being rewritten, as a racing writer would
+        published = int(writer.counters[LATEST_SLOT])
+        writer.counters[SLOT_SEQ + published] = 2 * sequence + 1
+        assert reader.read() == (0, None)
+        writer.commit(slot)
+        assert reader.read()[0] == sequence + 1
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_pack_matches_driver_layout():
+    """Packed bytes match LCD_1in44.image_to_rgb565"""
+    rgb = np.random.default_rng(3).integers(0, 256, (4, 5, 3), dtype=np.uint8)
+    packed = pack_rgb565(rgb, np.empty((4, 5, 2), np.uint8)).astype(np.int32)
+    red, green, blue = rgb.astype(np.int32).transpose(2, 0, 1)
+    value = (red >> 3 << 11) | (green >> 2 << 5) | (blue >> 3)
+    assert (((packed[..., 0] << 8) | packed[..., 1]) == value).all()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Golden frame tests - every effect must still render its stored frames
+Run with: python3 -m pytest test_golden.py
+Re-capture after an intended visual change: list the effect in golden_frames.CHANGED,
+then python3 golden_frames.py update <effect>
+"""
+
+import os
+import pytest
+
+import golden_frames
+
+
+@pytest.mark.parametrize('effect_name', list(golden_frames.EFFECTS))
+def test_effect_matches_goldens(effect_name):
+    """Frames at the golden indices stay within MIN_PSNR of the stored PNGs"""
+    if not os.path.exists(golden_frames.golden_path(effect_name, golden_frames.effect_frames(effect_name)[0])):
+        pytest.skip(f"no goldens for {effect_name}")
+    rows, ms, passed = golden_frames.compare(effect_name)
+    assert passed, [(frame, score, delta) for frame, score, delta in rows]
+
+
+def test_changed_effects_are_covered():
+    """Every effect excused from matching the baseline exactly is one the goldens cover"""
+    assert set(golden_frames.CHANGED) <= set(golden_frames.EFFECTS)
+    assert set(golden_frames.BASELINE_STEPS) <= set(golden_frames.EFFECTS) - set(golden_frames.CHANGED)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+GPIO cleanup tests - one /proc pass finds targets and the wait ends when they exit
+Run with: python3 -m pytest test_gpio_cleanup.py
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+import gpio_cleanup
+
+
+def fake_proc(tmp_path, processes):
+    for pid, argv in processes.items():
+        os.makedirs(tmp_path / str(pid))
+        (tmp_path / str(pid) / 'cmdline').write_bytes(b'\0'.join(word.encode() for word in argv) + b'\0')
+    os.makedirs(tmp_path / 'self')
+    return str(tmp_path)
+
+
+def test_one_pass_matches_every_pattern(tmp_path):
+    """All patterns match in a single scan; excluded PIDs and non-processes are skipped"""
+    root = fake_proc(tmp_path, {
+        101: ['python3', 'glyph_rain1_fixed.py'],
+        102: ['python3', '/home/pi/saver/plasma_field.py', '--seed', '3'],
+        103: ['bash'],
+        104: ['python3', 'screensaver_manager.py'],
+    })
+    found = gpio_cleanup.find_processes(['glyph_rain', 'plasma', 'screensaver'], root, exclude={104})
+    assert sorted(found) == [101, 102]
+    assert gpio_cleanup.process_name(found[102]) == 'plasma_field.py'
+
+
+def test_release_waits_for_exit_and_forces_stragglers(monkeypatch):
+    """Polite processes exit on SIGTERM; one ignoring it is killed after the grace period"""
+    monkeypatch.setattr(gpio_cleanup, 'TERM_GRACE', 0.2)
+    marker = f"m5-cleanup-test-{os.getpid()}"
+    polite = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)', marker])
+    stubborn = subprocess.Popen([sys.executable, '-c',
+                                 'import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+                                 'print(flush=True); time.sleep(30)', marker], stdout=subprocess.PIPE)
+    stubborn.stdout.readline()  # SIGTERM is ignored from here on
+
+    start = time.perf_counter()
+    report = gpio_cleanup.release_gpio([marker], services=[], lines=())
+    assert sorted(report['killed']) == sorted([polite.pid, stubborn.pid])
+    assert report['forced'] == [stubborn.pid]
+    assert time.perf_counter() - start < 2
+    assert polite.wait(1) is not None and stubborn.wait(1) is not None
+
+
+def test_unreadable_gpio_chip():
+    """Without a readable gpiochip the line check is skipped, not failed"""
+    assert gpio_cleanup.busy_lines('/nonexistent/gpiochip0') is None
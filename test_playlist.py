@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Playlist tests - weights and hours decide what plays; the next effect is warm in time
+Run with: python3 -m pytest test_playlist.py
+"""
+
+import datetime
+import numpy as np
+
+import headless
+import playlist
+from playlist import Playlist, PlaylistPlayer
+
+
+class FakeClock:
+    """Wall clock that only moves when the player sleeps"""
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(seconds, 0.001)
+
+
+def test_hours_and_weights_pick_the_items():
+    """Night-only items play at night; weights set how often each plays"""
+    items = [{'effect': 'glyph_rain1_fixed', 'weight': 3},
+             {'effect': 'raindrops'},
+             {'effect': 'glyph_rain5_slow', 'hours': '23:00-07:00', 'weight': 4}]
+    rotation = Playlist(items, rng=np.random.default_rng(0))
+    noon, night = datetime.datetime(2026, 1, 1, 12, 0), datetime.datetime(2026, 1, 1, 2, 30)
+    assert [item['info']['key'] for item in rotation.eligible(noon)] == ['glyph_rain1_fixed', 'raindrops']
+    assert len(rotation.eligible(night)) == 3
+
+    picks = [rotation.pick(noon)['info']['key'] for _ in range(400)]
+    assert 250 < picks.count('glyph_rain1_fixed') < 350
+    previous = rotation.items[0]
+    assert all(rotation.pick(noon, previous) is not previous for _ in range(20))
+
+    assert playlist.in_hours(playlist.parse_hours('22:00-07:00'), datetime.datetime(2026, 1, 1, 23, 59))
+    assert not playlist.in_hours(playlist.parse_hours('09:00-17:00'), datetime.datetime(2026, 1, 1, 17, 0))
+
+
+def test_player_switches_to_a_warmed_effect():
+    """Each effect plays for its dwell and the next one is built before the switch"""
+    headless.install()
+    lcd = headless.HeadlessLCD()
+    rotation = Playlist([{'effect': 'dragon_curve', 'dwell': 3}, {'effect': 'raindrops', 'dwell': 2}],
+                        rng=np.random.default_rng(1))
+    player = PlaylistPlayer(rotation, lcd=lcd, lead=1.0, clock=FakeClock())
+    player.run(items=3)
+
+    assert player.played in (['dragon_curve', 'raindrops', 'dragon_curve'],
+                             ['raindrops', 'dragon_curve', 'raindrops'])
+    assert lcd.frames_shown >= 40
+    assert lcd.last_image is not None
+    # The item after the last one was already warming before the run ended
+    assert player.upcoming is not None and player.upcoming.effect is not None
+    # Effect modules get their own LCD_1in44 back once constructed
+    import dragon_curve, raindrops, LCD_1in44
+    assert dragon_curve.LCD_1in44 is LCD_1in44 and raindrops.LCD_1in44 is LCD_1in44
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tile delta tests - the panel ends up showing every frame, from partial windows
+Run with: python3 -m pytest test_tile_delta.py
+"""
+
+import threading
+import numpy as np
+
+import headless
+import display_daemon
+from tile_delta import TileDelta
+
+
+class FakePanel:
+    """Panel memory written window by window, as LCD_SetWindows + data would"""
+    def __init__(self, width=128, height=128):
+        self.memory = np.zeros((height, width * 2), dtype=np.uint8)
+        self.windows = []
+
+    def send(self, x0, y0, x1, y1, data):
+        self.memory[y0:y1, x0 * 2:x1 * 2] = np.frombuffer(data, dtype=np.uint8).reshape(y1 - y0, -1)
+        self.windows.append((x0, y0, x1, y1))
+
+
+def test_panel_matches_every_frame():
+    """Moving sprites over a static background reach the panel exactly"""
+    rng = np.random.default_rng(0)
+    panel = FakePanel()
+    delta = TileDelta(128, 128)
+    frame = rng.integers(0, 256, (128, 256), dtype=np.uint8)
+    for step in range(30):
+        frame = frame.copy()
+        for _ in range(3):
+            y, x = rng.integers(0, 120, 2)
+            frame[y:y + 6, x * 2:x * 2 + 12] = step
+        panel.windows.clear()
+        delta.push(frame.tobytes(), panel.send)
+        assert (panel.memory == frame).all()
+        if step > 0:
+            assert 0 < len(panel.windows) and panel.windows != [(0, 0, 128, 128)]
+    assert 0.5 < delta.saved() < 1.0
+
+
+def test_cost_model_picks_windows_or_full_frame():
+    """One pixel sends one tile; a frame of noise or an odd size goes whole"""
+    delta = TileDelta(128, 128, tile=8)
+    frame = np.zeros((128, 256), dtype=np.uint8)
+    panel = FakePanel()
+    delta.push(frame, panel.send)
+    assert panel.windows == [(0, 0, 128, 128)]
+
+    frame[20, 41] = 1                            # x = 20, y = 20
+    assert delta.plan(frame) == [(16, 16, 24, 24)]
+
+    frame[20:60, 40:48] = 2                      # Same columns down several tile rows stack
+    frame[20, 100] = 2                           # Three clean tiles across: cheaper than a new window
+    assert delta.plan(frame) == [(16, 16, 56, 24), (16, 24, 24, 64)]
+
+    noise = np.random.default_rng(1).integers(0, 256, (128, 256), dtype=np.uint8)
+    assert delta.plan(noise) == [(0, 0, 128, 128)]
+    assert TileDelta(240, 135).plan(noise) == [(0, 0, 240, 135)]
+
+
+def test_daemon_reports_bytes_saved_per_client(tmp_path):
+    """The status list shows how much of each client's frames stayed off the bus"""
+    class TiledLCD(headless.HeadlessLCD):
+        def __init__(self):
+            super().__init__()
+            self.tile_delta = TileDelta(self.width, self.height)
+
+        def LCD_ShowRGB565(self, data):
+            super().LCD_ShowRGB565(data)
+            self.tile_delta.push(data, lambda *window: None)
+
+    daemon = display_daemon.DisplayDaemon(TiledLCD(), str(tmp_path / 'display.sock'))
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    client = display_daemon.DisplayClient('dots', daemon.path, 'socket')     # Every frame, in order
+    frame = np.zeros(128 * 128 * 2, dtype=np.uint8)
+    for step in range(4):
+        frame[step * 2] = step + 1
+        client.LCD_ShowRGB565(frame)
+
+    status = ''
+    for _ in range(100):
+        status = display_daemon.request(display_daemon.LIST, path=daemon.path)
+        if '(4 frames' in status:
+            break
+    assert status.startswith('* dots (4 frames, 75% SPI bytes saved)')
+
+    client.close()
+    daemon.stop()
+    thread.join(2)
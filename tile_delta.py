@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tile Delta - Send only the parts of a frame that changed
+Keeps a hash per 8x8 tile of the last frame pushed to the panel, compares
+the next frame's hashes in one vectorized step and groups the changed
+tiles into rectangles: runs along each tile row, stacked where rows below
+change over the same columns. Every rectangle costs an LCD_SetWindows on
+top of its pixels, so short clean gaps are sent rather than opening a new
+window, and when the rectangles together cost more than one full frame the
+whole frame goes instead.
+
+Only the hashes are kept, not the frame, so the frame may be a buffer that
+is overwritten afterwards (a frame ring slot).
+
+The hashes only describe the panel while nothing else draws on it. The
+driver resets them whenever the panel may hold another process's pixels
+(after LCD_Clear, on SIGCONT, and every few seconds outside the display
+daemon), so that frame goes whole.
+
+M5_TILE_SIZE picks the tile edge in pixels (8 or 16; 0 always sends full
+frames).
+"""
+
+import os
+import numpy as np
+
+TILE_SIZE = int(os.environ.get('M5_TILE_SIZE', '8'))
+
+# LCD_SetWindows is six small SPI transfers and their DC toggles, about as
+# long as 1 KB of pixel data at 40 MHz
+WINDOW_COST = 1024
+
+# Odd multipliers for the tile hash: frames that differ in a single 8-byte word
+# never hash the same
+HASH_SEED = 565
+
+
+class TileDelta:
+    def __init__(self, width, height, tile=TILE_SIZE, window_cost=WINDOW_COST):
+        self.width = width
+        self.height = height
+        self.tile = tile
+        self.window_cost = window_cost
+        # Tile rows must split into whole 8-byte words for the hash
+        self.enabled = tile > 0 and tile % 4 == 0 and width % tile == 0 and height % tile == 0
+        if self.enabled:
+            keys = np.random.default_rng(HASH_SEED).integers(0, 2**63, (tile, tile // 4), dtype=np.uint64)
+            self.keys = (keys * np.uint64(2) + np.uint64(1)).reshape(1, tile, 1, tile // 4)
+        self.hashes = None      # Per tile of the frame on the panel; None when unknown
+
+        self.frames = 0
+        self.windows = 0
+        self.bytes_full = 0     # What sending every frame whole would have cost
+        self.bytes_sent = 0
+
+    def reset(self):
+        """Forget the panel contents; the next frame goes whole"""
+        self.hashes = None
+
+    def tile_hashes(self, frame):
+        """(rows, cols) uint64 hashes of a packed RGB565 frame"""
+        tile = self.tile
+        words = frame.reshape(self.height, self.width * 2).view(np.uint64)
+        words = words.reshape(self.height // tile, tile, self.width // tile, tile // 4)
+        # Overflow wraps, which is what the hash wants
+        return (words * self.keys).sum(axis=(1, 3), dtype=np.uint64)
+
+    def spans(self, dirty):
+        """Pixel rectangles (x0, y0, x1, y1) covering the dirty tiles"""
+        tile = self.tile
+        # A clean gap this many tiles wide costs less to resend than a new window
+        gap = self.window_cost // (tile * tile * 2)
+        rects = []
+        above = {}              # (first col, end col) -> rect still growing downwards
+        for row in range(dirty.shape[0]):
+            cols = np.flatnonzero(dirty[row])
+            current = {}
+            if len(cols):
+                breaks = np.flatnonzero(np.diff(cols) > gap + 1)
+                starts = np.concatenate(([cols[0]], cols[breaks + 1]))
+                ends = np.concatenate((cols[breaks], [cols[-1]])) + 1
+                for run in zip(starts.tolist(), ends.tolist()):
+                    rect = above.get(run)
+                    if rect is None:
+                        rect = [run[0] * tile, row * tile, run[1] * tile, 0]
+                        rects.append(rect)
+                    rect[3] = (row + 1) * tile
+                    current[run] = rect
+            above = current
+        return [tuple(rect) for rect in rects]
+
+    def plan(self, frame):
+        """Windows to send for frame, and remember it as the panel contents"""
+        full = [(0, 0, self.width, self.height)]
+        if not self.enabled:
+            return full
+        hashes = self.tile_hashes(frame)
+        previous, self.hashes = self.hashes, hashes
+        if previous is None:
+            return full
+        rects = self.spans(hashes != previous)
+        cost = sum(self.window_cost + (x1 - x0) * (y1 - y0) * 2 for x0, y0, x1, y1 in rects)
+        return rects if cost < self.window_cost + self.width * self.height * 2 else full
+
+    def push(self, frame, send):
+        """Call send(x0, y0, x1, y1, data) for each window of frame that changed"""
+        frame = np.frombuffer(frame, dtype=np.uint8).reshape(self.height, self.width * 2)
+        self.frames += 1
+        self.bytes_full += frame.nbytes
+        for x0, y0, x1, y1 in self.plan(frame):
+            data = frame[y0:y1, x0 * 2:x1 * 2]
+            send(x0, y0, x1, y1, data if data.flags.c_contiguous else np.ascontiguousarray(data))
+            self.windows += 1
+            self.bytes_sent += data.nbytes
+
+    def skipped(self):
+        """Count a frame that was not sent at all because nothing changed"""
+        self.frames += 1
+        self.bytes_full += self.width * self.height * 2
+
+    def saved(self):
+        """Fraction of full-frame bytes not sent"""
+        return 1.0 - self.bytes_sent / self.bytes_full if self.bytes_full else 0.0
+
+    def status(self):
+        """Telemetry string for status lines"""
+        windows = self.windows / self.frames if self.frames else 0.0
+        return f"{self.saved():.0%} SPI bytes saved, {windows:.1f} windows/frame"